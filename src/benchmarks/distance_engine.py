@@ -0,0 +1,100 @@
+"""
+compares SlotDistanceEngine and SlotSpatialIndex with the per-pair math.sqrt
+path they replaced.
+
+two workloads are measured for 10, 50 and 200 slots:
+    nearest: closest slot for a single window (WINDOW_MOVED handling), also
+        measured against the spatial index grid
+    matrix: full slot x window distance matrix (arrange_layout_on_start)
+
+usage (from src/):
+    python -m benchmarks.distance_engine
+"""
+import argparse
+import math
+import random
+import timeit
+
+from services.tables.distance_engine import SlotDistanceEngine
+from services.tables.entities import Slot
+from services.tables.spatial_index import SlotSpatialIndex
+
+TABLE_WIDTH = 516
+TABLE_HEIGHT = 679
+
+
+def build_slots(slot_count: int) -> dict[str, Slot]:
+    return {
+        f"slot_{index + 1}": Slot(
+            top=(index // 10) * TABLE_HEIGHT,
+            left=(index % 10) * TABLE_WIDTH,
+            height=TABLE_HEIGHT,
+            width=TABLE_WIDTH,
+        )
+        for index in range(slot_count)
+    }
+
+
+def calculate_distance(win_coord, slot_coord) -> float:
+    return math.sqrt(
+        (win_coord[0] - slot_coord[0]) ** 2 + (win_coord[1] - slot_coord[1]) ** 2
+    )
+
+
+def nearest_per_pair(slots: dict[str, Slot], point: tuple[float, float]) -> str:
+    return min(
+        slots,
+        key=lambda slot_num: calculate_distance(
+            point, slots[slot_num].slot_center_coordinates
+        ),
+    )
+
+
+def matrix_per_pair(slots: dict[str, Slot], points: list[tuple[float, float]]):
+    return [
+        [calculate_distance(point, slot.slot_center_coordinates) for point in points]
+        for slot in slots.values()
+    ]
+
+
+def best_of(statement, number: int) -> float:
+    """
+    returns the best time per call in microseconds
+    """
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--slots", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(
+        f"{'slots':>6} {'nearest sqrt us':>16} {'nearest numpy us':>17}"
+        f" {'nearest grid us':>16}"
+        f" {'matrix sqrt us':>15} {'matrix numpy us':>16}"
+    )
+    for slot_count in args.slots:
+        slots = build_slots(slot_count)
+        engine = SlotDistanceEngine(slots)
+        spatial_index = SlotSpatialIndex(slots)
+        points = [
+            (rng.uniform(0, 3000), rng.uniform(0, 5000)) for _ in range(slot_count)
+        ]
+        assert engine.nearest(points[:1])[0] == nearest_per_pair(slots, points[0])
+        assert spatial_index.nearest(points[0]) == nearest_per_pair(slots, points[0])
+
+        print(
+            f"{slot_count:>6}"
+            f" {best_of(lambda: nearest_per_pair(slots, points[0]), args.number):>16.1f}"
+            f" {best_of(lambda: engine.nearest(points[:1]), args.number):>17.1f}"
+            f" {best_of(lambda: spatial_index.nearest(points[0]), args.number):>16.1f}"
+            f" {best_of(lambda: matrix_per_pair(slots, points), args.number // 10 or 1):>15.1f}"
+            f" {best_of(lambda: engine.distance_matrix(points), args.number):>16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+measures one hotkey action, HotkeyManager.perform_base_action on a table under
+the cursor, through MouseController on each input injector.
+
+    pyautogui_before: every step is its own pyautogui call followed by the
+        pyautogui pause, how MouseController drove pyautogui before batching.
+    pyautogui: PyAutoGuiInjector, only the last step of a batch keeps the pause.
+    sendinput: SendInputInjector, the whole batch in one SendInput call.
+    recording: RecordingInjector, the cost of the action without injection.
+
+there is no desktop here, pyautogui and user32 are replaced by FakePyAutoGui
+and FakeUser32 which take --call-latency per call. FakePyAutoGui applies the
+pyautogui pause the way the library does, the benchmark never sleeps itself.
+
+usage (from src/):
+    python -m benchmarks.hotkey_action
+"""
+import argparse
+import time
+
+from services.input_controllers.fake_injector import (
+    FakePyAutoGui,
+    FakeUser32,
+    RecordingInjector,
+)
+from services.input_controllers.hotkey_manager import hotkey_manager
+from services.input_controllers.injector import (
+    InputInjector,
+    InputStep,
+    InputStepType,
+    PyAutoGuiInjector,
+    SendInputInjector,
+    set_input_injector,
+)
+from services.tables.entities import Buttons
+from services.windows.fake_backend import FakeWindowBackend
+
+from .tracker_tick import build_table_manager, open_table
+
+CURSOR = (100, 100)
+FOLD_BUTTON = (146, 385)  # on the reference table at (0, 0)
+
+
+class PyAutoGuiBeforeInjector(PyAutoGuiInjector):
+    """
+    one pyautogui call per step with the pause after each, as MouseController
+    called move_to_coordinates, left_click and move_to_coordinates in turn
+    """
+
+    def send(self, steps: list[InputStep]) -> None:
+        for step in steps:
+            if step.step_type is InputStepType.MOVE:
+                self._pa.moveTo(step.x, step.y)
+            elif step.step_type is InputStepType.LEFT_CLICK:
+                self._pa.click()
+
+
+def build_injectors(call_latency: float) -> dict[str, tuple[InputInjector, object]]:
+    """
+    returns every injector with the fake its OS calls are counted on
+    """
+    injectors = {}
+    for name, injector_type in (
+        ("pyautogui_before", PyAutoGuiBeforeInjector),
+        ("pyautogui", PyAutoGuiInjector),
+    ):
+        pyautogui = FakePyAutoGui(cursor=CURSOR, call_latency=call_latency)
+        injectors[name] = (injector_type(pyautogui_module=pyautogui), pyautogui)
+    user32 = FakeUser32(cursor=CURSOR, call_latency=call_latency)
+    injectors["sendinput"] = (SendInputInjector(user32=user32), user32)
+    recording = RecordingInjector(cursor=CURSOR)
+    injectors["recording"] = (recording, recording)
+    return injectors
+
+
+def count_calls(fake) -> int:
+    if isinstance(fake, RecordingInjector):
+        return len(fake.batches)
+    return fake.calls
+
+
+def setup_table() -> None:
+    """
+    opens one table under the cursor with a fold button.
+
+    perform_base_action resolves slots on the TableManager singleton, which
+    build_table_manager initialises.
+    """
+    backend = FakeWindowBackend()
+    manager = build_table_manager(1, backend)
+    manager.table_configuration.button_coordinates = {Buttons.FOLD.value: FOLD_BUTTON}
+    open_table(backend, 1, left=0, top=0)
+    manager.initialize_tracked_windows()
+    manager.arrange_layout_on_start()
+
+
+def run(injector: InputInjector, fake, actions: int) -> dict:
+    set_input_injector(injector)
+    hotkey_manager.perform_base_action(Buttons.FOLD)  # builds the button table
+    calls_before = count_calls(fake)
+    timings = []
+    for _ in range(actions):
+        start = time.perf_counter()
+        hotkey_manager.perform_base_action(Buttons.FOLD)
+        timings.append(time.perf_counter() - start)
+    set_input_injector(None)
+    timings.sort()
+    return {
+        "calls_per_action": (count_calls(fake) - calls_before) / actions,
+        "p50_ms": timings[len(timings) // 2] * 1000,
+        "max_ms": timings[-1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--actions", type=int, default=50)
+    parser.add_argument(
+        "--call-latency",
+        type=float,
+        default=0.0002,
+        help="simulated seconds spent per pyautogui or user32 call",
+    )
+    args = parser.parse_args()
+
+    setup_table()
+    print(f"{'injector':>18} {'calls':>6} {'p50 ms':>8} {'max ms':>8}")
+    for name, (injector, fake) in build_injectors(args.call_latency).items():
+        result = run(injector, fake, args.actions)
+        print(
+            f"{name:>18} {result['calls_per_action']:>6.0f}"
+            f" {result['p50_ms']:>8.2f} {result['max_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+replays a window trace recorded by the tracker through TableManager.
+
+record a trace by starting the application with TABLETAMER_TRACE set to the
+output path, e.g. TABLETAMER_TRACE=session.trace.gz, then replay it:
+
+usage (from src/):
+    python -m benchmarks.replay_trace session.trace.gz
+    python -m benchmarks.replay_trace session.trace.gz --realtime
+    python -m benchmarks.replay_trace session.trace.gz --profile
+"""
+import argparse
+import cProfile
+import pstats
+from pathlib import Path
+
+from services.tables.trace import TraceReplayer
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("trace", type=Path)
+    parser.add_argument(
+        "--realtime", action="store_true", help="follow the recorded timestamps"
+    )
+    parser.add_argument(
+        "--profile", action="store_true", help="print the top cProfile entries"
+    )
+    args = parser.parse_args()
+
+    replayer = TraceReplayer(args.trace)
+    if args.profile:
+        profiler = cProfile.Profile()
+        stats = profiler.runcall(replayer.replay, realtime=args.realtime)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    else:
+        stats = replayer.replay(realtime=args.realtime)
+
+    print(
+        f"{stats.ticks} ticks, {stats.events} events in {stats.elapsed:.3f}s"
+        f" ({stats.ticks_per_sec:.0f} ticks/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+estimates CPU time per hour and event-detection latency of the tracker loop
+for different TrackerScheduler settings.
+
+the tick cost is measured with benchmarks.tracker_tick, the session itself
+(table events and drags) is simulated on a virtual clock so an hour of
+tracking runs in a few seconds.
+
+usage (from src/):
+    python -m benchmarks.tracker_scheduler
+"""
+
+import argparse
+import random
+import statistics
+
+from services.tables.tracker_scheduler import (
+    BACKOFF_FACTOR,
+    FAST_PERIOD,
+    FAST_TICK,
+    TrackerScheduler,
+)
+
+from . import tracker_tick
+
+SESSION_SECONDS = 3600
+
+# (base_tick, idle_tick) pairs to compare
+CONFIGURATIONS = [
+    (0.02, 0.25),
+    (0.05, 0.5),
+    (0.1, 1.0),
+]
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def generate_session(
+    seed: int, event_every: float, drag_every: float, drag_length: float
+) -> tuple[list[float], list[tuple[float, float]]]:
+    """
+    returns event timestamps and (start, end) drag intervals for one session
+    """
+    rng = random.Random(seed)
+    events, drags = [], []
+    now = rng.expovariate(1 / event_every)
+    while now < SESSION_SECONDS:
+        events.append(now)
+        now += rng.expovariate(1 / event_every)
+    now = rng.expovariate(1 / drag_every)
+    while now < SESSION_SECONDS:
+        drags.append((now, now + drag_length))
+        now += drag_length + rng.expovariate(1 / drag_every)
+    return events, drags
+
+
+def simulate(
+    scheduler: TrackerScheduler,
+    clock: VirtualClock,
+    events: list[float],
+    drags: list[tuple[float, float]],
+) -> tuple[int, list[float]]:
+    """
+    runs the tracker loop on the virtual clock, returns tick count and detection latencies
+    """
+    ticks, latencies = 0, []
+    event_index, drag_index = 0, 0
+    while clock.now < SESSION_SECONDS:
+        ticks += 1
+        event_detected = False
+        while event_index < len(events) and events[event_index] <= clock.now:
+            latencies.append(clock.now - events[event_index])
+            event_index += 1
+            event_detected = True
+
+        while drag_index < len(drags) and drags[drag_index][1] < clock.now:
+            drag_index += 1
+        is_dragging = drag_index < len(drags) and drags[drag_index][0] <= clock.now
+        scheduler.wait(event_detected=event_detected, is_dragging=is_dragging)
+    return ticks, latencies
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tables", type=int, default=12)
+    parser.add_argument("--event-every", type=float, default=30.0)
+    parser.add_argument("--drag-every", type=float, default=60.0)
+    parser.add_argument("--drag-length", type=float, default=1.5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    tick_cost = (
+        tracker_tick.run(args.tables, ticks=200, enumeration_latency=0.0005)["tick_us"]
+        / 1_000_000
+    )
+    events, drags = generate_session(
+        args.seed, args.event_every, args.drag_every, args.drag_length
+    )
+    print(
+        f"tick cost: {tick_cost * 1000:.3f} ms for {args.tables} tables,"
+        f" {len(events)} events and {len(drags)} drags per hour"
+    )
+    print(
+        f"{'base':>6} {'idle':>6} {'ticks/h':>10} {'cpu s/h':>9}"
+        f" {'lat p50 ms':>11} {'lat p99 ms':>11} {'lat max ms':>11}"
+    )
+    # a busy loop keeps one core pegged for the whole hour
+    print(
+        f"{'busy':>6} {'-':>6} {SESSION_SECONDS / tick_cost:>10.0f}"
+        f" {SESSION_SECONDS:>9.1f} {tick_cost * 1000:>11.1f}"
+        f" {tick_cost * 1000:>11.1f} {tick_cost * 1000:>11.1f}"
+    )
+    for base_tick, idle_tick in CONFIGURATIONS:
+        clock = VirtualClock()
+        scheduler = TrackerScheduler(
+            base_tick=base_tick,
+            fast_tick=FAST_TICK,
+            idle_tick=idle_tick,
+            backoff_factor=BACKOFF_FACTOR,
+            fast_period=FAST_PERIOD,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        ticks, latencies = simulate(scheduler, clock, events, drags)
+        latencies = [latency + tick_cost for latency in latencies]
+        print(
+            f"{base_tick:>6} {idle_tick:>6} {ticks:>10} {ticks * tick_cost:>9.1f}"
+            f" {statistics.median(latencies) * 1000:>11.1f}"
+            f" {percentile(latencies, 0.99) * 1000:>11.1f}"
+            f" {max(latencies) * 1000:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""
+benchmark suite for TableManager and SlotManager on a simulated window set.
+
+for every (windows, slots) scenario it reports:
+    ticks_per_sec: steady state get_event throughput
+    relayout_p50/p95/p99_us: latency from the tick detecting an event to the
+        end of handle_event, under random open/close/drag churn
+    alloc_peak_bytes_per_tick: peak memory allocated by one steady tick (tracemalloc)
+    arrange_ms: arrange_layout_on_start
+    slot_lookup_ns: SlotManager.get_slot_from_window
+
+every scenario is measured --repeat times on a fresh manager and every metric
+keeps the median of the runs, so neither a slow nor a lucky run moves the
+numbers. each run is scaled by a calibration loop measured around it, so a
+slower or busier machine does not show up as a regression. results are compared with a stored
+JSON baseline, metrics worse than the baseline by more than their threshold
+are reported as regressions and make the command exit with status 1.
+
+the baseline must be regenerated with --update-baseline whenever a change
+moves the measured paths on purpose.
+
+usage (from src/):
+    python -m benchmarks.tracker_suite
+    python -m benchmarks.tracker_suite --update-baseline
+"""
+import argparse
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+from services.input_controllers.entities import key_states
+from services.tables.table_manager import TableManager
+from services.windows.fake_backend import FakeWindowBackend
+
+from .tracker_tick import TABLE_HEIGHT, TABLE_WIDTH, build_table_manager, open_table
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+
+WINDOW_COUNTS = [1, 10, 50, 200]
+SLOT_COUNTS = [1, 10, 50]
+
+# metrics where a higher value is better, every other metric is lower is better
+HIGHER_IS_BETTER = {"ticks_per_sec"}
+# metrics that do not depend on the machine speed
+UNSCALED = {"alloc_peak_bytes_per_tick"}
+# relative change counted as a regression, tail latencies are far noisier than
+# medians
+THRESHOLDS = {
+    "ticks_per_sec": 0.3,
+    "relayout_p50_us": 0.4,
+    "relayout_p95_us": 0.75,
+    "relayout_p99_us": 1.25,
+    "alloc_peak_bytes_per_tick": 0.1,
+    "arrange_ms": 0.5,
+    # a few hundred nanoseconds, shifts with cache and scheduler state
+    "slot_lookup_ns": 1.0,
+}
+CALIBRATION = "calibration_s"
+
+SCREEN_WIDTH = 3840
+SCREEN_HEIGHT = 2160
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def random_position(rng: random.Random) -> tuple[int, int]:
+    return (
+        rng.randint(0, SCREEN_WIDTH - TABLE_WIDTH),
+        rng.randint(0, SCREEN_HEIGHT - TABLE_HEIGHT),
+    )
+
+
+@contextmanager
+def gc_disabled():
+    """
+    keeps garbage collections out of the timed code, as timeit does
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def measure(function) -> float:
+    """
+    returns the duration of a call in seconds
+    """
+    with gc_disabled():
+        start = time.perf_counter()
+        function()
+        return time.perf_counter() - start
+
+
+def calibrate(repeat: int) -> float:
+    """
+    times a fixed pure python workload, used to scale timings between machines
+    """
+    return min(
+        measure(lambda: sorted(str(number) for number in range(20_000)))
+        for _ in range(repeat)
+    )
+
+
+def scale(metric: str, value: float, speed: float) -> float:
+    """
+    converts a metric measured on one machine to a machine speed times slower
+    """
+    if metric in UNSCALED:
+        return value
+    return value / speed if metric in HIGHER_IS_BETTER else value * speed
+
+
+def churn_events(
+    manager: TableManager,
+    backend: FakeWindowBackend,
+    rng: random.Random,
+    churn: int,
+    next_number: int,
+) -> list[float]:
+    """
+    opens, closes and drags random tables
+
+    returns:
+        list[float]: microseconds from the tick detecting each change to the end
+        of handle_event.
+    """
+    latencies = []
+    for _ in range(churn):
+        action = rng.choice(("open", "close", "drag"))
+        if action == "open" or not backend.windows:
+            open_table(backend, next_number, *random_position(rng))
+            next_number += 1
+        elif action == "close":
+            backend.close_window(rng.choice(list(backend.windows.values())))
+        elif manager.slot_manager.allocated_windows:
+            window = rng.choice(manager.slot_manager.allocated_windows)
+            backend.drag_window(window, *random_position(rng))
+
+        start = time.perf_counter()
+        events = manager.get_event()
+        if events:
+            manager.handle_event(events)
+            latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def measure_scenario(
+    window_count: int,
+    slot_count: int,
+    ticks: int,
+    churn: int,
+    latency: float,
+    seed: int,
+) -> dict[str, float]:
+    """
+    measures every metric once on a fresh manager, with the calibration
+    measured around the run
+    """
+    calibration = calibrate(3)
+    rng = random.Random(seed)
+    backend = FakeWindowBackend(latency=latency)
+    manager = build_table_manager(slot_count, backend)
+    for number in range(1, window_count + 1):
+        open_table(backend, number, *random_position(rng))
+
+    manager.initialize_tracked_windows()
+    arrange_rounds = 20
+
+    def run_arrange():
+        for _ in range(arrange_rounds):
+            manager.arrange_layout_on_start()
+
+    arrange_ms = measure(run_arrange) / arrange_rounds * 1000
+    manager.handle_event(manager.get_event())  # settle the initial layout
+
+    def run_ticks():
+        for _ in range(ticks):
+            manager.get_event()
+
+    ticks_per_sec = ticks / measure(run_ticks)
+
+    # memory allocated by a steady tick
+    tracemalloc.start()
+    peaks = []
+    for _ in range(min(ticks, 50)):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        manager.get_event()
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    # SlotManager lookups
+    allocated_windows = manager.slot_manager.allocated_windows
+    lookups = 10_000
+
+    def run_lookups():
+        for index in range(lookups):
+            manager.slot_manager.get_slot_from_window(
+                allocated_windows[index % len(allocated_windows)]
+            )
+
+    slot_lookup_ns = measure(run_lookups) / lookups * 1e9
+
+    # event to relayout latency under churn
+    key_states.left_button_pressed = False
+    with gc_disabled():
+        latencies = churn_events(manager, backend, rng, churn, window_count + 1)
+
+    return {
+        "ticks_per_sec": ticks_per_sec,
+        "relayout_p50_us": percentile(latencies, 0.5),
+        "relayout_p95_us": percentile(latencies, 0.95),
+        "relayout_p99_us": percentile(latencies, 0.99),
+        "alloc_peak_bytes_per_tick": percentile(peaks, 0.5),
+        "arrange_ms": arrange_ms,
+        "slot_lookup_ns": slot_lookup_ns,
+        CALIBRATION: (calibration + calibrate(3)) / 2,
+    }
+
+
+def run_scenario(
+    window_count: int,
+    slot_count: int,
+    ticks: int,
+    churn: int,
+    latency: float,
+    seed: int,
+    repeat: int,
+) -> dict[str, float]:
+    """
+    measures a scenario repeat times and combines the runs metric by metric.
+
+    every run is first scaled to the median calibration of the runs, so a run
+    measured while the machine was busy is not mistaken for a slow run.
+    """
+    runs = [
+        measure_scenario(window_count, slot_count, ticks, churn, latency, seed)
+        for _ in range(repeat)
+    ]
+    calibration = statistics.median(run[CALIBRATION] for run in runs)
+    results = {CALIBRATION: calibration}
+    for metric in THRESHOLDS:
+        values = [
+            scale(metric, run[metric], calibration / run[CALIBRATION]) for run in runs
+        ]
+        results[metric] = statistics.median(values)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold_scale: float = 1.0,
+) -> list[str]:
+    """
+    returns a description of every metric that regressed beyond its threshold,
+    thresholds are multiplied by threshold_scale
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        reference_metrics = baseline.get(scenario, {})
+        if CALIBRATION not in reference_metrics:
+            continue
+        speed = metrics[CALIBRATION] / reference_metrics[CALIBRATION]
+        for metric, threshold in THRESHOLDS.items():
+            reference = reference_metrics.get(metric)
+            if not reference:
+                continue
+            reference = scale(metric, reference, speed)
+            value = metrics[metric]
+            if metric in HIGHER_IS_BETTER:
+                change = (reference - value) / reference
+            else:
+                change = (value - reference) / reference
+            if change > threshold * threshold_scale:
+                regressions.append(
+                    f"{scenario} {metric}: {value:.1f} vs baseline {reference:.1f}"
+                    f" ({change:+.0%} worse)"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--churn", type=int, default=1000)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="simulated seconds per OS call"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument(
+        "--threshold-scale",
+        type=float,
+        default=1.0,
+        help="multiplier applied to the regression threshold of every metric",
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    print(
+        f"{'scenario':>10} {'ticks/s':>9} {'p50 us':>8} {'p95 us':>8} {'p99 us':>8}"
+        f" {'alloc B':>8} {'arrange ms':>10} {'lookup ns':>9}"
+    )
+    for window_count in WINDOW_COUNTS:
+        for slot_count in SLOT_COUNTS:
+            scenario = f"{window_count}w_{slot_count}s"
+            metrics = run_scenario(
+                window_count,
+                slot_count,
+                ticks=args.ticks,
+                churn=args.churn,
+                latency=args.latency,
+                seed=args.seed,
+                repeat=args.repeat,
+            )
+            results[scenario] = metrics
+            print(
+                f"{scenario:>10} {metrics['ticks_per_sec']:>9.0f}"
+                f" {metrics['relayout_p50_us']:>8.1f}"
+                f" {metrics['relayout_p95_us']:>8.1f}"
+                f" {metrics['relayout_p99_us']:>8.1f}"
+                f" {metrics['alloc_peak_bytes_per_tick']:>8.0f}"
+                f" {metrics['arrange_ms']:>10.2f}"
+                f" {metrics['slot_lookup_ns']:>9.0f}"
+            )
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=4, sort_keys=True))
+        print(f"baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, run with --update-baseline")
+        return
+
+    regressions = compare(
+        results, json.loads(args.baseline.read_text()), args.threshold_scale
+    )
+    if regressions:
+        print("regressions:")
+        for regression in regressions:
+            print(f"    {regression}")
+        sys.exit(1)
+    print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+measures the cost of a single tracker tick (TableManager.get_event) as the
+number of open tables grows.
+
+windows are simulated with FakeWindowBackend, enumeration and geometry reads
+are given a configurable latency so the number of OS calls per tick shows up
+directly in the tick cost.
+
+usage (from src/):
+    python -m benchmarks.tracker_tick
+"""
+import argparse
+import time
+from types import SimpleNamespace
+
+from services.tables.entities import AppName
+from services.tables.table_manager import TableManager
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindowBackend
+from utils.configuration_models import LayoutSlot
+
+SEARCH_STRING = "Benchmark Table"
+TABLE_WIDTH = 516
+TABLE_HEIGHT = 679
+SLOTS_PER_ROW = 4
+
+
+def build_layout(table_count: int) -> dict[str, LayoutSlot]:
+    return {
+        f"slot_{index + 1}": LayoutSlot(
+            top=(index // SLOTS_PER_ROW) * TABLE_HEIGHT,
+            left=(index % SLOTS_PER_ROW) * TABLE_WIDTH,
+        )
+        for index in range(table_count)
+    }
+
+
+def open_table(backend: FakeWindowBackend, number: int, left: int, top: int):
+    return backend.open_window(
+        title=f"{SEARCH_STRING} {number} - {AppName.CHROME.value}",
+        left=left,
+        top=top,
+        width=TABLE_WIDTH,
+        height=TABLE_HEIGHT,
+    )
+
+
+def build_table_manager(slot_count: int, backend: FakeWindowBackend) -> TableManager:
+    """
+    creates a TableManager with slot_count slots whose windows live in the fake backend
+    """
+    set_window_backend(backend)
+    table_layout_manager = SimpleNamespace(
+        table_configurations=build_layout(slot_count)
+    )
+    table_configuration = SimpleNamespace(
+        search_string=SEARCH_STRING,
+        width=TABLE_WIDTH,
+        height=TABLE_HEIGHT,
+        top=0,
+        left=0,
+        button_coordinates={},
+    )
+    return TableManager(
+        table_layout_manager=table_layout_manager,
+        table_configuration=table_configuration,
+    )
+
+
+def run(
+    table_count: int,
+    ticks: int,
+    enumeration_latency: float,
+    geometry_latency: float = 0.0,
+) -> dict:
+    backend = FakeWindowBackend(
+        call_latencies={
+            "get_windows_with_title": enumeration_latency,
+            "get_geometry": geometry_latency,
+        }
+    )
+    manager = build_table_manager(table_count, backend)
+    for number, slot in enumerate(build_layout(table_count).values(), start=1):
+        open_table(backend, number, left=slot.left, top=slot.top)
+
+    manager.initialize_tracked_windows()
+    manager.arrange_layout_on_start()
+    backend.reset_call_counts()
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        manager.get_event()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "tables": table_count,
+        "enumerations_per_tick": backend.call_counts["get_windows_with_title"] / ticks,
+        "geometry_reads_per_tick": backend.call_counts["get_geometry"] / ticks,
+        "tick_us": elapsed / ticks * 1_000_000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument(
+        "--enumeration-latency",
+        type=float,
+        default=0.0005,
+        help="simulated seconds spent per window enumeration",
+    )
+    parser.add_argument(
+        "--geometry-latency",
+        type=float,
+        default=0.0,
+        help="simulated seconds spent per window rect read",
+    )
+    parser.add_argument("--tables", type=int, nargs="+", default=[1, 4, 12, 24, 48])
+    args = parser.parse_args()
+
+    print(f"{'tables':>8} {'enum/tick':>10} {'rects/tick':>11} {'tick (us)':>12}")
+    for table_count in args.tables:
+        result = run(
+            table_count, args.ticks, args.enumeration_latency, args.geometry_latency
+        )
+        print(
+            f"{result['tables']:>8} {result['enumerations_per_tick']:>10.1f}"
+            f" {result['geometry_reads_per_tick']:>11.1f}"
+            f" {result['tick_us']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
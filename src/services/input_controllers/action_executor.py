@@ -0,0 +1,88 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable
+
+from services.instrumentation import instrumentation
+
+MAX_QUEUED_ACTIONS = 8
+# seconds after which a queued action is dropped, None keeps every action
+STALE_AFTER: float | None = None
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ActionExecutor:
+    """
+    runs hotkey actions one at a time on a single long-lived worker thread.
+
+    actions are queued from the input hooks without blocking them and executed
+    in the order they were pressed, so the cursor moves and clicks of two
+    actions never interleave. when the queue is full new actions are dropped.
+    if stale_after is set, actions that waited longer are skipped, every
+    dropped action is logged.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str], None],
+        max_queued_actions: int = MAX_QUEUED_ACTIONS,
+        stale_after: float | None = STALE_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.handler = handler
+        self.stale_after = stale_after
+        self.clock = clock
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued_actions)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        stops the worker once the actions queued before are handled
+        """
+        if not self.is_running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, action: str) -> bool:
+        """
+        queues an action without blocking
+
+        returns:
+            bool: False if the queue is full and the action was dropped.
+        """
+        try:
+            self._queue.put_nowait((action, self.clock()))
+        except queue.Full:
+            logger.warning("action queue full, dropped %s", action)
+            return False
+        return True
+
+    def run(self) -> None:
+        while (item := self._queue.get()) is not _STOP:
+            action, queued_at = item
+            waited = self.clock() - queued_at
+            if self.stale_after is not None and waited > self.stale_after:
+                logger.warning("dropped stale %s queued %.3fs ago", action, waited)
+                continue
+            if instrumentation.enabled:
+                instrumentation.record("hotkey.queue_wait", int(waited * 1e9))
+            try:
+                self.handler(action)
+            except Exception:
+                logger.exception("action %s failed", action)
@@ -1,10 +1,15 @@
 import win32con
 from pynput import mouse
 
+from .hotkey_dispatch import MOUSE_BUTTON_KEY_CODES
+
 BTN_X1_MOUSE_DATA = 65536
 BTN_X2_MOUSE_DATA = 131072
 BTN_X_PRESS = 523
 
+# seconds for a simulated click to activate its window before it is read
+FOCUS_SETTLE_DELAY = 0.01
+
 SUPPRESSED_EVENTS = [
     mouse.Listener.WM_XBUTTONDOWN,
     mouse.Listener.WM_XBUTTONUP,
@@ -17,9 +22,10 @@ SUPPRESSED_EVENTS = [
 ]
 
 # to be used for event_filtering / suppressing in pynput
-MOUSE_MESSAGE_DATA_TO_BUTTON_MAP = {
-    (BTN_X_PRESS, BTN_X1_MOUSE_DATA): "Button.x1",  # msg press, data.mousedata
-    (BTN_X_PRESS, BTN_X2_MOUSE_DATA): "Button.x2",
-    (win32con.WM_RBUTTONDOWN, 0): "Button.right",
-    (win32con.WM_MBUTTONDOWN, 0): "Button.middle",
+MOUSE_MESSAGE_DATA_TO_KEY_CODE = {
+    # msg press, data.mousedata
+    (BTN_X_PRESS, BTN_X1_MOUSE_DATA): MOUSE_BUTTON_KEY_CODES["x1"],
+    (BTN_X_PRESS, BTN_X2_MOUSE_DATA): MOUSE_BUTTON_KEY_CODES["x2"],
+    (win32con.WM_RBUTTONDOWN, 0): MOUSE_BUTTON_KEY_CODES["right"],
+    (win32con.WM_MBUTTONDOWN, 0): MOUSE_BUTTON_KEY_CODES["middle"],
 }
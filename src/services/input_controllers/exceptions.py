@@ -1,2 +1,10 @@
 class DuplicateHotkeysError(Exception):
     ...
+
+
+class HotkeyConflictError(DuplicateHotkeysError):
+    ...
+
+
+class InvalidHotkeyError(Exception):
+    ...
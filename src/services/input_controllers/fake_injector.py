@@ -0,0 +1,116 @@
+import time
+
+from .injector import InputInjector, InputStep, InputStepType, Point
+
+
+class RecordingInjector(InputInjector):
+    """
+    in-memory injector for tests and benchmarks.
+
+    every batch passed to send is recorded and applied to a simulated cursor,
+    call_latency simulates the cost of one injection call.
+    """
+
+    def __init__(self, cursor: tuple[int, int] = (0, 0), call_latency: float = 0.0):
+        self.cursor = Point(*cursor)
+        self.call_latency = call_latency
+        self.batches: list[list[InputStep]] = []
+        self.clicks: list[Point] = []
+
+    def _call(self) -> None:
+        if self.call_latency:
+            time.sleep(self.call_latency)
+
+    def get_cursor_position(self) -> Point:
+        self._call()
+        return self.cursor
+
+    def send(self, steps: list[InputStep]) -> None:
+        self._call()
+        self.batches.append(list(steps))
+        for step in steps:
+            if step.step_type is InputStepType.MOVE:
+                self.cursor = Point(step.x, step.y)
+            elif step.step_type is InputStepType.LEFT_CLICK:
+                self.clicks.append(self.cursor)
+
+    @property
+    def steps(self) -> list[InputStep]:
+        return [step for batch in self.batches for step in batch]
+
+
+class FakePyAutoGui:
+    """
+    stand-in for the pyautogui module, pass it to PyAutoGuiInjector.
+
+    every call takes call_latency and, like pyautogui, calls that move or click
+    sleep PAUSE afterwards unless they are made with _pause=False.
+    """
+
+    PAUSE = 0.1  # pyautogui default
+
+    def __init__(self, cursor: tuple[int, int] = (0, 0), call_latency: float = 0.0):
+        self.cursor = Point(*cursor)
+        self.call_latency = call_latency
+        self.calls = 0
+        self.pauses = 0
+        self.clicks: list[Point] = []
+
+    def _call(self, _pause: bool = False) -> None:
+        self.calls += 1
+        if self.call_latency:
+            time.sleep(self.call_latency)
+        if _pause and self.PAUSE:
+            self.pauses += 1
+            time.sleep(self.PAUSE)
+
+    def position(self) -> Point:
+        self._call()
+        return self.cursor
+
+    def moveTo(self, x: int, y: int, _pause: bool = True) -> None:
+        self.cursor = Point(x, y)
+        self._call(_pause)
+
+    def click(self, _pause: bool = True) -> None:
+        self.clicks.append(self.cursor)
+        self._call(_pause)
+
+
+class FakeUser32:
+    """
+    stand-in for ctypes.windll.user32, pass it to SendInputInjector.
+
+    every call takes call_latency, the inputs of each SendInput call are recorded.
+    """
+
+    def __init__(
+        self,
+        cursor: tuple[int, int] = (0, 0),
+        screen: tuple[int, int] = (1920, 1080),
+        call_latency: float = 0.0,
+    ):
+        self.cursor = Point(*cursor)
+        self.screen = screen
+        self.call_latency = call_latency
+        self.calls = 0
+        self.batches: list[list[int]] = []  # dwFlags of every input of a call
+
+    def _call(self) -> None:
+        self.calls += 1
+        if self.call_latency:
+            time.sleep(self.call_latency)
+
+    def GetCursorPos(self, point) -> int:
+        self._call()
+        point._obj.x, point._obj.y = self.cursor
+        return 1
+
+    def GetSystemMetrics(self, index: int) -> int:
+        # not an OS call worth simulating, the metrics are constant
+        return {78: self.screen[0], 79: self.screen[1]}.get(index, 0)
+
+    def SendInput(self, count: int, inputs, size: int) -> int:
+        self._call()
+        self.batches.append([inputs[index].mi.dwFlags for index in range(count)])
+        return count
@@ -0,0 +1,285 @@
+"""
+compiles the hotkey configuration into a dispatch table resolved with one
+dictionary lookup per input event.
+
+a hotkey is a chord or a short comma separated sequence of chords, a chord
+is optional modifiers and a key joined with "+", e.g. "F", "Ctrl+F",
+"Shift+Mouse4", "Button.x1" or "Ctrl+K, F".
+
+keys are identified by their windows virtual-key code, the modifiers held
+while a key is pressed are or-ed into the code above the key bits.
+"""
+import enum
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Mapping
+
+from .exceptions import HotkeyConflictError, InvalidHotkeyError
+
+KEY_CODE_BITS = 11  # 8 bits of virtual-key code and 3 modifier flags
+MAX_SEQUENCE_LENGTH = 3
+SEQUENCE_TIMEOUT = 1.0  # seconds allowed between two keys of a sequence
+
+F_KEY_OFFSET = 0x6F  # VK_F1 is 0x70
+
+
+class Modifier(enum.IntFlag):
+    NONE = 0
+    CTRL = 0x100
+    SHIFT = 0x200
+    ALT = 0x400
+
+
+MODIFIER_NAMES = {
+    "CTRL": Modifier.CTRL,
+    "CONTROL": Modifier.CTRL,
+    "SHIFT": Modifier.SHIFT,
+    "ALT": Modifier.ALT,
+}
+
+# generic, left and right virtual-key codes of every modifier
+MODIFIER_KEY_CODES = {
+    0x10: Modifier.SHIFT.value,
+    0xA0: Modifier.SHIFT.value,
+    0xA1: Modifier.SHIFT.value,
+    0x11: Modifier.CTRL.value,
+    0xA2: Modifier.CTRL.value,
+    0xA3: Modifier.CTRL.value,
+    0x12: Modifier.ALT.value,
+    0xA4: Modifier.ALT.value,
+    0xA5: Modifier.ALT.value,
+}
+
+# pynput button names
+MOUSE_BUTTON_KEY_CODES = {
+    "left": 0x01,
+    "right": 0x02,
+    "middle": 0x04,
+    "x1": 0x05,
+    "x2": 0x06,
+}
+
+MOUSE_BUTTON_ALIASES = {
+    "MOUSE1": "left",
+    "MOUSE2": "right",
+    "MOUSE3": "middle",
+    "MOUSE4": "x1",
+    "MOUSE5": "x2",
+}
+
+# letters and digits share their ascii code with their virtual-key code
+CHAR_KEY_CODES = {
+    char: ord(char.upper())
+    for char in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+}
+
+
+def parse_key(name: str) -> int:
+    """
+    returns:
+        int: virtual-key code of a key or mouse button name.
+
+    raises:
+        InvalidHotkeyError: the name is not a supported key.
+    """
+    upper = name.strip().upper()
+    if upper in MOUSE_BUTTON_ALIASES:
+        return MOUSE_BUTTON_KEY_CODES[MOUSE_BUTTON_ALIASES[upper]]
+    if upper.startswith("BUTTON.") and upper[7:].lower() in MOUSE_BUTTON_KEY_CODES:
+        return MOUSE_BUTTON_KEY_CODES[upper[7:].lower()]
+    if len(upper) == 1 and upper in CHAR_KEY_CODES:
+        return CHAR_KEY_CODES[upper]
+    if upper[:1] == "F" and upper[1:].isdigit() and 1 <= int(upper[1:]) <= 24:
+        return F_KEY_OFFSET + int(upper[1:])
+    raise InvalidHotkeyError(f"unsupported key {name!r}")
+
+
+def parse_chord(chord: str) -> int:
+    """
+    returns:
+        int: key code of a chord, e.g. "Ctrl+Shift+F", with its modifier flags.
+
+    raises:
+        InvalidHotkeyError: the chord has no key or an unknown modifier.
+    """
+    *modifier_names, key_name = chord.split("+")
+    modifiers = Modifier.NONE
+    for modifier_name in modifier_names:
+        modifier = MODIFIER_NAMES.get(modifier_name.strip().upper())
+        if modifier is None:
+            raise InvalidHotkeyError(f"unsupported modifier {modifier_name!r}")
+        modifiers |= modifier
+    return parse_key(key_name) | modifiers.value
+
+
+def parse_hotkey(hotkey: str) -> tuple[int, ...]:
+    """
+    returns:
+        tuple[int, ...]: key codes of the chords of a hotkey, empty if unbound.
+
+    raises:
+        InvalidHotkeyError: a chord is invalid or the sequence is too long.
+    """
+    if not hotkey.strip():
+        return ()
+    sequence = tuple(parse_chord(chord) for chord in hotkey.split(","))
+    if len(sequence) > MAX_SEQUENCE_LENGTH:
+        raise InvalidHotkeyError(
+            f"{hotkey!r} is longer than {MAX_SEQUENCE_LENGTH} chords"
+        )
+    return sequence
+
+
+@dataclass(frozen=True, slots=True)
+class DispatchEntry:
+    """
+    action is set once a hotkey is complete, otherwise node is the state to
+    continue the sequence from.
+    """
+
+    action: str | None = None
+    node: int = 0
+
+
+def compile_hotkeys(hotkeys: Mapping[str, str]) -> dict[int, DispatchEntry]:
+    """
+    builds the dispatch table of a {action: hotkey} mapping.
+
+    the table is keyed by node << KEY_CODE_BITS | key code, where node 0 is the
+    start of every hotkey. a key that does not continue a pending sequence
+    resolves as if no sequence was pending.
+
+    raises:
+        InvalidHotkeyError: a hotkey can not be parsed.
+        HotkeyConflictError: two hotkeys are equal, or one is the start of another.
+    """
+    sequences: dict[tuple[int, ...], str] = {}
+    for action, hotkey in hotkeys.items():
+        if not (sequence := parse_hotkey(hotkey)):
+            continue
+        if sequence in sequences:
+            raise HotkeyConflictError(
+                f"{action} and {sequences[sequence]} are both bound to {hotkey!r}"
+            )
+        sequences[sequence] = action
+
+    nodes: dict[tuple[int, ...], int] = {(): 0}
+    for sequence, action in sequences.items():
+        for length in range(1, len(sequence)):
+            prefix = sequence[:length]
+            if prefix in sequences:
+                raise HotkeyConflictError(
+                    f"{sequences[prefix]} is the start of the {action} sequence"
+                )
+            nodes.setdefault(prefix, len(nodes))
+
+    table = {}
+    for prefix, node in nodes.items():
+        if prefix:
+            key = nodes[prefix[:-1]] << KEY_CODE_BITS | prefix[-1]
+            table[key] = DispatchEntry(node=node)
+    for sequence, action in sequences.items():
+        key = nodes[sequence[:-1]] << KEY_CODE_BITS | sequence[-1]
+        table[key] = DispatchEntry(action=action)
+
+    start_entries = {
+        key: entry for key, entry in table.items() if key < 1 << KEY_CODE_BITS
+    }
+    for node in range(1, len(nodes)):
+        for key_code, entry in start_entries.items():
+            table.setdefault(node << KEY_CODE_BITS | key_code, entry)
+    return table
+
+
+def get_key_code(key) -> int | None:
+    """
+    returns:
+        int | None: virtual-key code of a pynput Key or KeyCode.
+    """
+    key = getattr(key, "value", key)  # Key members wrap a KeyCode
+    if (vk := getattr(key, "vk", None)) is not None:
+        return vk
+    if char := getattr(key, "char", None):
+        return CHAR_KEY_CODES.get(char)
+    return None
+
+
+def get_button_key_code(button) -> int | None:
+    """
+    returns:
+        int | None: virtual-key code of a pynput mouse Button.
+    """
+    return MOUSE_BUTTON_KEY_CODES.get(getattr(button, "name", None))
+
+
+class HotkeyDispatcher:
+    """
+    resolves key presses against a compiled dispatch table.
+
+    keeps the modifiers held and the pending sequence. listeners whose keys
+    combine share a dispatcher, e.g. the keyboard and mouse listeners so a
+    mouse button sees the keyboard modifiers, and as they run on their own
+    threads the key state is only touched while holding a lock.
+    """
+
+    def __init__(
+        self,
+        table: dict[int, DispatchEntry] | None = None,
+        sequence_timeout: float = SEQUENCE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.table = table or {}
+        self.sequence_timeout = sequence_timeout
+        self.clock = clock
+        self.modifiers = 0
+        self.node = 0
+        self.node_entered_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self, table: dict[int, DispatchEntry]):
+        with self._lock:
+            self.table = table
+            self.node = 0  # nodes are only valid in the table they were compiled in
+
+    def reset(self):
+        """
+        forgets the pending sequence and the modifiers held, releases are not
+        seen while the listener is stopped
+        """
+        with self._lock:
+            self.node = 0
+            self.modifiers = 0
+
+    def press(self, key_code: int | None) -> str | None:
+        """
+        returns:
+            str | None: the action completed by the key press, if any.
+        """
+        if key_code is None:
+            return None
+        with self._lock:
+            if (
+                self.node
+                and self.clock() - self.node_entered_at > self.sequence_timeout
+            ):
+                self.node = 0
+
+            entry = self.table.get(
+                self.node << KEY_CODE_BITS | key_code | self.modifiers
+            )
+            if entry is None:
+                if modifier := MODIFIER_KEY_CODES.get(key_code):
+                    self.modifiers |= modifier
+                else:
+                    self.node = 0
+                return None
+            if entry.node:
+                self.node_entered_at = self.clock()
+            self.node = entry.node
+            return entry.action
+
+    def release(self, key_code: int | None):
+        if modifier := MODIFIER_KEY_CODES.get(key_code):
+            with self._lock:
+                self.modifiers &= ~modifier
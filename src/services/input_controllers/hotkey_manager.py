@@ -1,17 +1,29 @@
-import threading
+import logging
+import time
 
 from pynput import keyboard, mouse
 
+from services.instrumentation import instrumentation
 from services.tables.entities import Buttons
-from services.tables.table_config import table_configuration
 from services.tables.table_manager import table_manager
 from services.utilities import WindowsSelector
 
 from . import constants
+from . import exceptions as hotkey_exceptions
+from .action_executor import ActionExecutor
 from .entities import KeyActions
+from .hotkey_dispatch import (
+    HotkeyDispatcher,
+    compile_hotkeys,
+    get_button_key_code,
+    get_key_code,
+)
 from .hotkeys_config import hotkey_configuration
+from .injector import build_click_sequence
 from .mouse_controller import mouse_controller
 
+logger = logging.getLogger(__name__)
+
 
 class HotkeyManager:
     def __init__(self, hotkey_configuration=hotkey_configuration):
@@ -19,9 +31,15 @@ class HotkeyManager:
         self.toggle_hotkeys_listener = None
         self.keyboard_listener = None
         self.mouse_listener = None
-        self.key_to_action = {}
-        self.relative_coordinates = {}
-        self.thread = None
+        self.hotkey_table = {}
+        # shared by the keyboard and mouse listeners so mouse chords see the
+        # keyboard modifiers, the toggle listener keeps its own key state
+        self.dispatcher = HotkeyDispatcher()
+        self.toggle_dispatcher = HotkeyDispatcher()
+        # absolute (x, y) of every button on every slot
+        self.button_coordinates: dict[tuple[str, str], tuple[int, int]] = {}
+        self._button_coordinates_source = (None, None)
+        self.action_executor = ActionExecutor(handler=self.handle_action)
 
         self.initialize_toggle_hotkeys_listener()
 
@@ -29,6 +47,7 @@ class HotkeyManager:
     def hotkeys(self):
         return self.hotkey_configuration.hotkeys
 
+    @instrumentation.timed("hotkey.mouse_event_filter")
     def mouse_event_filter(self, msg, data):
         """
         if click is coming from user data.flags = 0
@@ -41,14 +60,14 @@ class HotkeyManager:
         Additionally, actions related to suppressing browser interactions
         are handled within this function
 
-        Actions are started in a separate thread to avoid risks freezing input for all processes
+        Actions are queued to the action executor to avoid risks freezing input for all processes
         """
         if msg in constants.SUPPRESSED_EVENTS and self.mouse_listener:
-            button = constants.MOUSE_MESSAGE_DATA_TO_BUTTON_MAP.get(
-                (msg, data.mouseData), None
+            key_code = constants.MOUSE_MESSAGE_DATA_TO_KEY_CODE.get(
+                (msg, data.mouseData)
             )
-            if action := self.get_action_from_button(button):
-                self.start_action_thread(action)
+            if action := self.dispatcher.press(key_code):
+                self.action_executor.submit(action)
             self.mouse_listener.suppress_event()
 
         if data.flags:
@@ -58,115 +77,111 @@ class HotkeyManager:
         if data.flags:
             return False
 
-    def populate_reverse_hotkeys(self):
+    def compile_hotkeys(self):
         """
-        Populates a reverse hotkey mapping to store the hotkey-to-action relationship for later access.
-
-        This method creates a dictionary that maps action strings to their corresponding hotkeys. It also ensures that
-        all hotkeys are represented in uppercase for consistency.
-
-        Returns:
-            None
+        compiles the configured hotkeys into the dispatch table of both listeners.
 
-        Example:
-            Suppose the 'hotkeys' attribute contains the following mapping:
-            {'A': 'Fold', 'B': 'Call'}
-
-            After calling this method, 'self.key_to_action' will be updated to:
-            {'Fold': 'A', 'Call': 'B'}
+        a configuration with conflicting or invalid hotkeys is logged and the
+        previous table is kept.
         """
-        self.key_to_action = {value: key for key, value in self.hotkeys.items()}
-        for key, value in self.key_to_action.items():
-            if key.isalnum():
-                self.key_to_action[key] = value.upper()
-
-    def update_relative_button_coordinates(self):
+        try:
+            self.hotkey_table = compile_hotkeys(self.hotkeys)
+        except (
+            hotkey_exceptions.HotkeyConflictError,
+            hotkey_exceptions.InvalidHotkeyError,
+        ):
+            logger.exception("hotkey configuration not applied")
+        self.dispatcher.load(self.hotkey_table)
+        self.toggle_dispatcher.load(self.hotkey_table)
+
+    def update_button_coordinates(self):
         """
-        updates the relative coordinates of a button given a slot / window
+        precomputes the absolute coordinates of every button on every slot.
+
+        the table is only rebuilt when the slots or the settings they were built
+        from have been replaced since the last build, which costs two attribute
+        reads otherwise.
         """
-        for action, coordinate in table_configuration.button_coordinates.items():
-            relative_coordinate = (
-                coordinate[0] - table_configuration.left,
-                coordinate[1] - table_configuration.top,
-            )
-            self.relative_coordinates[action] = relative_coordinate
+        config_snapshot = (
+            table_manager.config_snapshot or table_manager.get_config_snapshot()
+        )
+        layout_version = table_manager.slot_manager.layout_version
+        source_snapshot, source_layout_version = self._button_coordinates_source
+        if (
+            config_snapshot is source_snapshot
+            and layout_version == source_layout_version
+        ):
+            return
+
+        table_top, table_left = config_snapshot.table_position
+        self.button_coordinates = {
+            (slot_num, action): (slot.left + x - table_left, slot.top + y - table_top)
+            for slot_num, slot in table_manager.slot_manager.slots.items()
+            for action, (x, y) in config_snapshot.button_coordinates.items()
+        }
+        self._button_coordinates_source = (config_snapshot, layout_version)
 
     def get_button_coordinate(
-        self, slot_coordinate: tuple[int, int], button_type: Buttons
-    ) -> tuple[int, int]:
+        self, slot_num: str, button_type: Buttons
+    ) -> tuple[int, int] | None:
         """
-        calculates button coordinate given a slot_coordinate
-
         returns:
-            tuple[int, int]: a tuple of (x, y) coordinates
+            tuple[int, int] | None: (x, y) coordinates of the button on the slot,
+            None if the button is not configured.
         """
+        return self.button_coordinates.get((slot_num, button_type.value))
 
-        def get_absolute_coordinates(slot_coordinate, relative_coordinate):
-            return (
-                slot_coordinate[0] + relative_coordinate[0],
-                slot_coordinate[1] + relative_coordinate[1],
-            )
-
-        return get_absolute_coordinates(
-            slot_coordinate, self.relative_coordinates[button_type.value]
-        )
-
-    def get_slot_coordinates(self) -> tuple[int, int] | None:
+    @instrumentation.timed("hotkey.get_target_slot_num")
+    def get_target_slot_num(self, cursor: tuple[int, int] | None = None) -> str | None:
         """
-        Simulates a left click and retrieves the active window. If a slot is found within the window,
-        this function returns a tuple containing the (x, y) coordinates of the slot.
+        Resolves the slot under the cursor from the slot rectangles. If there is no
+        occupied slot under the cursor, or several occupied slots overlap there,
+        simulates a left click and uses the slot of the active window instead.
+
+        args:
+            cursor (tuple[int, int], optional): (x, y) cursor position, read if not given.
 
         returns:
-            tuple[int, int] | None: A tuple of (x, y) coordinates if a slot is found,
-            or None if no slot is detected.
+            str | None: the slot number if a slot is found, or None if no slot is detected.
         """
-        mouse_controller.left_click()
+        x, y = cursor or mouse_controller.get_mouse_coordinates()
+        slot_num = table_manager.slot_manager.get_allocated_slot_num_at(x=x, y=y)
+        if slot_num is not None:
+            return slot_num
+
+        mouse_controller.left_click()  # fallback, focus the window under the cursor
+        time.sleep(constants.FOCUS_SETTLE_DELAY)
         window = WindowsSelector.get_active_window()
         if window:
-            slot = table_manager.slot_manager.get_slot_from_window(window)
-            if slot:
-                return slot.left, slot.top
+            return table_manager.slot_manager.get_slot_num_from_window(window)
         return None
 
-    def get_action_from_button(self, button) -> str | None:
-        action = self.key_to_action.get(str(button))
-        return action
-
-    def get_action_from_key(self, key) -> str | None:
-        if hasattr(key, "char") and key.char is not None:
-            key_char = key.char
-            action = self.key_to_action.get(
-                key_char.upper(), self.key_to_action.get(key_char, None)
-            )
-            return action
-        return None
-
-    def start_action_thread(self, action):
-        """
-        Start a new thread to handle the given action.
-        """
-        self.thread = threading.Thread(target=self.handle_action, args=(action,))
-        self.thread.start()
-
     def on_press(self, key):
-        action = self.get_action_from_key(key)
-        if action:
-            self.handle_action(action)
+        if action := self.dispatcher.press(get_key_code(key)):
+            self.action_executor.submit(action)
+
+    def on_release(self, key):
+        self.dispatcher.release(get_key_code(key))
 
     def on_click(self, x, y, button, pressed):
-        if pressed and (action := self.get_action_from_button(button)):
-            self.start_action_thread(action)
+        if pressed and (action := self.dispatcher.press(get_button_key_code(button))):
+            self.action_executor.submit(action)
 
     def start(self):
-        self.update_relative_button_coordinates()
+        self.update_button_coordinates()
+        self.action_executor.start()
 
         self.keyboard_listener = keyboard.Listener(
-            on_press=self.on_press, win32_event_filter=self.keyboard_event_filter
+            on_press=self.on_press,
+            on_release=self.on_release,
+            win32_event_filter=self.keyboard_event_filter,
         )
         self.mouse_listener = mouse.Listener(
             on_click=self.on_click, win32_event_filter=self.mouse_event_filter
         )
-        self.populate_reverse_hotkeys()
+        self.compile_hotkeys()
+        # releases were not seen while stopped, the toggle listener never stops
+        self.dispatcher.reset()
         self.keyboard_listener.start()
         self.mouse_listener.start()
 
@@ -177,18 +192,17 @@ class HotkeyManager:
         if self.mouse_listener:
             self.mouse_listener.stop()
             self.mouse_listener = None
+        self.action_executor.stop()
 
-    def move_to_amount_field(self, slot_coord: tuple[int, int]):
+    def move_to_amount_field(self, slot_num: str):
         """
         move the cursor to the amount field associated with a given slot.
 
         args:
-            slot_coord (tuple[int, int]): A tuple containing the (x, y) coordinates of the slot.
+            slot_num (str): the slot the action was performed on.
         """
-        button_coord_x, button_coord_y = self.get_button_coordinate(
-            slot_coord, button_type=Buttons.AMOUNT
-        )
-        mouse_controller.move_to_coordinates(button_coord_x, button_coord_y)
+        if amount_coord := self.get_button_coordinate(slot_num, Buttons.AMOUNT):
+            mouse_controller.move_to_coordinates(*amount_coord)
 
     def perform_base_action(
         self, button_type: Buttons, move_to_amount_field: bool = False
@@ -203,20 +217,26 @@ class HotkeyManager:
             orig_mouse_coord_x,
             orig_mouse_coord_y,
         ) = mouse_controller.get_mouse_coordinates()
-        slot_coord = self.get_slot_coordinates()
-        if not slot_coord:
-            return
-
-        button_coord_x, button_coord_y = self.get_button_coordinate(
-            slot_coord, button_type=button_type
+        slot_num = self.get_target_slot_num(
+            cursor=(orig_mouse_coord_x, orig_mouse_coord_y)
         )
-        mouse_controller.move_to_coordinates(button_coord_x, button_coord_y)
-        mouse_controller.left_click()
+        if slot_num is None:
+            return
+        self.update_button_coordinates()
+        button_coord = self.get_button_coordinate(slot_num, button_type=button_type)
+        if button_coord is None:
+            return
 
+        cursor_after = (orig_mouse_coord_x, orig_mouse_coord_y)
         if move_to_amount_field:
-            self.move_to_amount_field(slot_coord)
-        else:
-            mouse_controller.move_to_coordinates(orig_mouse_coord_x, orig_mouse_coord_y)
+            # the cursor stays on the button when the amount field is not configured
+            cursor_after = (
+                self.get_button_coordinate(slot_num, Buttons.AMOUNT) or button_coord
+            )
+
+        # click and cursor restore are injected as a single batch
+        with instrumentation.measure("hotkey.click_button"):
+            mouse_controller.send(build_click_sequence(button_coord, cursor_after))
 
     def perform_fold(self):
         self.perform_base_action(button_type=Buttons.FOLD)
@@ -230,6 +250,7 @@ class HotkeyManager:
     def perform_bet(self):
         self.perform_base_action(button_type=Buttons.BET, move_to_amount_field=True)
 
+    @instrumentation.timed("hotkey.handle_action")
     def handle_action(self, action: str):
         match action:
             case Buttons.FOLD.value:
@@ -242,17 +263,22 @@ class HotkeyManager:
                 self.perform_raise()
 
     def initialize_toggle_hotkeys_listener(self):
-        self.populate_reverse_hotkeys()
+        self.compile_hotkeys()
 
         def on_press(key):
-            action = self.get_action_from_key(key)
+            action = self.toggle_dispatcher.press(get_key_code(key))
             if action == KeyActions.TOGGLE_HOTKEYS.value:
                 if self.keyboard_listener is None:
                     self.enable_hotkeys()
                 else:
                     self.disable_hotkeys()
 
-        self.toggle_hotkeys_listener = keyboard.Listener(on_press=on_press)
+        def on_release(key):
+            self.toggle_dispatcher.release(get_key_code(key))
+
+        self.toggle_hotkeys_listener = keyboard.Listener(
+            on_press=on_press, on_release=on_release
+        )
         self.toggle_hotkeys_listener.start()
 
     def enable_hotkeys(self):
@@ -2,7 +2,7 @@ from services.tables.entities import Buttons
 from services.tables.table_config import table_configuration
 from utils.configuration_parser import HotkeyConfigurationParser, IConfigurationParser
 
-from . import exceptions as hotkey_exceptions
+from .hotkey_dispatch import compile_hotkeys
 
 
 class HotkeyConfiguration:
@@ -20,16 +20,23 @@ class HotkeyConfiguration:
         self.load_settings()  # load initial set hotkeys
 
     def load_settings(self):
-        self.hotkeys = self.configuration_parser.read_configuration()
+        self.hotkeys = self.configuration_parser.read_settings().hotkeys
 
-    def check_for_hk_duplicates(self) -> None:
-        hotkey_values = [value for value in self.hotkeys.values() if value != ""]
-        if len(set(hotkey_values)) < len(hotkey_values):
-            raise hotkey_exceptions.DuplicateHotkeysError
+    def check_for_hk_duplicates(self, hotkeys: dict | None = None) -> None:
+        """
+        args:
+            hotkeys (dict, optional): hotkeys to check, the current ones if not given.
+
+        raises:
+            HotkeyConflictError: two hotkeys are equal once normalized, or one is
+                the start of another's sequence.
+            InvalidHotkeyError: a hotkey can not be parsed.
+        """
+        compile_hotkeys(self.hotkeys if hotkeys is None else hotkeys)
 
     def save_settings(self, hotkeys: dict):
+        self.check_for_hk_duplicates(hotkeys)  # rejected hotkeys are not applied
         self.hotkeys = hotkeys
-        self.check_for_hk_duplicates()
         self.configuration_parser.write_configuration(hotkeys=self.hotkeys)
 
 
@@ -0,0 +1,203 @@
+import enum
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import NamedTuple
+
+PYAUTOGUI_PAUSE = 0.01  # pause pyautogui keeps after single, unbatched calls
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class InputStepType(enum.Enum):
+    MOVE = "move"
+    LEFT_CLICK = "left_click"
+
+
+@dataclass(frozen=True, slots=True)
+class InputStep:
+    step_type: InputStepType
+    x: int = 0
+    y: int = 0
+
+    @classmethod
+    def move(cls, x: int, y: int) -> "InputStep":
+        return cls(InputStepType.MOVE, x, y)
+
+    @classmethod
+    def left_click(cls) -> "InputStep":
+        """
+        clicks at the current cursor position
+        """
+        return cls(InputStepType.LEFT_CLICK)
+
+
+def build_click_sequence(
+    button: tuple[int, int], cursor_after: tuple[int, int]
+) -> list[InputStep]:
+    """
+    moves to a button, clicks it and moves the cursor to cursor_after
+    """
+    return [
+        InputStep.move(*button),
+        InputStep.left_click(),
+        InputStep.move(*cursor_after),
+    ]
+
+
+class InputInjector(ABC):
+    """
+    sends synthetic mouse input, a sequence of steps is submitted as one batch
+    """
+
+    @abstractmethod
+    def get_cursor_position(self) -> Point:
+        pass
+
+    @abstractmethod
+    def send(self, steps: list[InputStep]) -> None:
+        """
+        injects the steps in order, as a single batch where the platform allows it
+        """
+
+
+class PyAutoGuiInjector(InputInjector):
+    """
+    pyautogui implementation, steps are sent one call each but without the
+    pause pyautogui adds after every call, only the last step of a batch keeps it
+
+    args:
+        pyautogui_module: module the calls are made on, pyautogui if not given.
+    """
+
+    def __init__(self, pyautogui_module=None):
+        if pyautogui_module is None:
+            import pyautogui as pyautogui_module
+
+        pyautogui_module.PAUSE = PYAUTOGUI_PAUSE
+        self._pa = pyautogui_module
+
+    def get_cursor_position(self) -> Point:
+        x, y = self._pa.position()
+        return Point(x, y)
+
+    def send(self, steps: list[InputStep]) -> None:
+        for index, step in enumerate(steps):
+            pause = index == len(steps) - 1
+            if step.step_type is InputStepType.MOVE:
+                self._pa.moveTo(step.x, step.y, _pause=pause)
+            elif step.step_type is InputStepType.LEFT_CLICK:
+                self._pa.click(_pause=pause)
+
+
+class SendInputInjector(InputInjector):
+    """
+    win32 implementation submitting a whole batch with a single SendInput call
+
+    args:
+        user32: object the user32 functions are called on, ctypes.windll.user32
+            if not given.
+    """
+
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_MOVE = 0x0001
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_VIRTUALDESK = 0x4000
+    MOUSEEVENTF_ABSOLUTE = 0x8000
+    SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN = 76, 77
+    SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN = 78, 79
+
+    def __init__(self, user32=None):
+        import ctypes
+        from ctypes import wintypes
+
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = [
+                ("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t),
+            ]
+
+        class INPUT(ctypes.Structure):
+            class _INPUT(ctypes.Union):
+                # KEYBDINPUT and HARDWAREINPUT are smaller than MOUSEINPUT
+                _fields_ = [("mi", MOUSEINPUT)]
+
+            _anonymous_ = ("_input",)
+            _fields_ = [("type", wintypes.DWORD), ("_input", _INPUT)]
+
+        self._ctypes = ctypes
+        self._wintypes = wintypes
+        self._input = INPUT
+        self._mouse_input = MOUSEINPUT
+        self._user32 = user32 or ctypes.windll.user32
+
+    def get_cursor_position(self) -> Point:
+        point = self._wintypes.POINT()
+        self._user32.GetCursorPos(self._ctypes.byref(point))
+        return Point(point.x, point.y)
+
+    def to_absolute(self, x: int, y: int) -> tuple[int, int]:
+        """
+        maps screen coordinates to the 0..65535 range SendInput expects
+        """
+        metrics = self._user32.GetSystemMetrics
+        left, top = metrics(self.SM_XVIRTUALSCREEN), metrics(self.SM_YVIRTUALSCREEN)
+        width = max(metrics(self.SM_CXVIRTUALSCREEN) - 1, 1)
+        height = max(metrics(self.SM_CYVIRTUALSCREEN) - 1, 1)
+        return (x - left) * 65535 // width, (y - top) * 65535 // height
+
+    def _mouse(self, flags: int, dx: int = 0, dy: int = 0):
+        return self._input(
+            type=self.INPUT_MOUSE,
+            mi=self._mouse_input(dx=dx, dy=dy, mouseData=0, dwFlags=flags, time=0),
+        )
+
+    def send(self, steps: list[InputStep]) -> None:
+        inputs = []
+        for step in steps:
+            if step.step_type is InputStepType.MOVE:
+                dx, dy = self.to_absolute(step.x, step.y)
+                flags = (
+                    self.MOUSEEVENTF_MOVE
+                    | self.MOUSEEVENTF_ABSOLUTE
+                    | self.MOUSEEVENTF_VIRTUALDESK
+                )
+                inputs.append(self._mouse(flags, dx, dy))
+            elif step.step_type is InputStepType.LEFT_CLICK:
+                inputs.append(self._mouse(self.MOUSEEVENTF_LEFTDOWN))
+                inputs.append(self._mouse(self.MOUSEEVENTF_LEFTUP))
+        if not inputs:
+            return
+        batch = (self._input * len(inputs))(*inputs)
+        self._user32.SendInput(len(inputs), batch, self._ctypes.sizeof(self._input))
+
+
+_input_injector: InputInjector | None = None
+
+
+def get_input_injector() -> InputInjector:
+    """
+    returns the injector in use, defaults to SendInput on Windows and pyautogui elsewhere
+    """
+    global _input_injector
+    if _input_injector is None:
+        _input_injector = (
+            SendInputInjector() if sys.platform == "win32" else PyAutoGuiInjector()
+        )
+    return _input_injector
+
+
+def set_input_injector(injector: InputInjector | None) -> None:
+    """
+    replaces the injector in use, None restores the default on next access
+    """
+    global _input_injector
+    _input_injector = injector
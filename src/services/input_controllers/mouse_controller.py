@@ -1,6 +1,6 @@
-import pyautogui as pa
+from services.instrumentation import instrumentation
 
-pa.PAUSE = 0.01
+from .injector import InputStep, Point, get_input_injector
 
 
 class MouseController:
@@ -11,14 +11,24 @@ class MouseController:
             cls._instance = super(MouseController, cls).__new__(cls)
         return cls._instance
 
-    def get_mouse_coordinates(self):
-        return pa.position()
+    @instrumentation.timed("mouse.get_mouse_coordinates")
+    def get_mouse_coordinates(self) -> Point:
+        return get_input_injector().get_cursor_position()
 
+    @instrumentation.timed("mouse.left_click")
     def left_click(self) -> None:
-        pa.click()
+        get_input_injector().send([InputStep.left_click()])
 
+    @instrumentation.timed("mouse.move_to_coordinates")
     def move_to_coordinates(self, x: int, y: int) -> None:
-        pa.moveTo(x, y)
+        get_input_injector().send([InputStep.move(x, y)])
+
+    @instrumentation.timed("mouse.send")
+    def send(self, steps: list[InputStep]) -> None:
+        """
+        injects a whole sequence of steps as one batch
+        """
+        get_input_injector().send(steps)
 
 
 mouse_controller = MouseController()
@@ -0,0 +1,182 @@
+"""
+per-stage latency instrumentation for the tracker and hotkey paths.
+
+stages are timed with the timed decorator or the measure context manager and
+go into histograms with power of two nanosecond buckets. every thread writes
+to its own histogram per stage so recording never takes a lock, shards are
+merged when the histograms are dumped.
+
+instrumentation is disabled unless TABLETAMER_LATENCY is set to the path of
+the dump file, a disabled stage costs one attribute check per call.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable
+
+LATENCY_ENV_VAR = "TABLETAMER_LATENCY"
+DUMP_INTERVAL = 60.0  # seconds between periodic dumps
+BUCKET_COUNT = 64  # bucket i counts durations below 2 ** i ns
+
+_disabled = nullcontext()
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.buckets = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        self.buckets[min(duration_ns.bit_length(), BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def percentile(self, fraction: float) -> int:
+        """
+        returns the upper bound in ns of the bucket holding the given fraction
+        """
+        if not self.count:
+            return 0
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(2**index, self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "p50_us": self.percentile(0.5) / 1000,
+            "p95_us": self.percentile(0.95) / 1000,
+            "p99_us": self.percentile(0.99) / 1000,
+            "max_us": self.max_ns / 1000,
+        }
+
+
+class Instrumentation:
+    def __init__(self, enabled: bool = False, dump_path: str | Path | None = None):
+        self.enabled = enabled
+        self.dump_path = Path(dump_path) if dump_path else None
+        self._shards: dict[tuple[str, int], LatencyHistogram] = {}
+        self._dump_stop: threading.Event | None = None
+
+    def record(self, stage: str, duration_ns: int) -> None:
+        key = (stage, threading.get_ident())
+        histogram = self._shards.get(key)
+        if histogram is None:
+            histogram = self._shards.setdefault(key, LatencyHistogram())
+        histogram.record(duration_ns)
+
+    def timed(self, stage: str) -> Callable:
+        """
+        decorator timing every call of the function as the given stage
+        """
+
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(stage, time.perf_counter_ns() - start)
+
+            return wrapper
+
+        return decorator
+
+    def measure(self, stage: str):
+        """
+        context manager timing a block as the given stage
+        """
+        if not self.enabled:
+            return _disabled
+        return self._measure(stage)
+
+    @contextmanager
+    def _measure(self, stage: str):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter_ns() - start)
+
+    def get_histograms(self) -> dict[str, LatencyHistogram]:
+        """
+        merges the per-thread shards into one histogram per stage
+        """
+        histograms = {}
+        for (stage, _), shard in list(self._shards.items()):
+            histograms.setdefault(stage, LatencyHistogram()).merge(shard)
+        return histograms
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            stage: histogram.summary()
+            for stage, histogram in sorted(self.get_histograms().items())
+        }
+
+    def dump(self, path: str | Path | None = None) -> None:
+        """
+        writes the summary and buckets of every stage as JSON
+        """
+        path = Path(path) if path else self.dump_path
+        if path is None:
+            return
+        histograms = self.get_histograms()
+        report = {
+            "timestamp": time.time(),
+            "stages": {
+                stage: {**histogram.summary(), "buckets": histogram.buckets}
+                for stage, histogram in sorted(histograms.items())
+            },
+        }
+        temporary_path = path.with_name(path.name + ".tmp")
+        temporary_path.write_text(json.dumps(report, indent=4))
+        os.replace(temporary_path, path)
+
+    def reset(self) -> None:
+        self._shards = {}
+
+    def start_periodic_dump(self, interval: float = DUMP_INTERVAL) -> None:
+        if not self.enabled or self.dump_path is None or self._dump_stop:
+            return
+        self._dump_stop = threading.Event()
+
+        def run(stop: threading.Event):
+            while not stop.wait(interval):
+                self.dump()
+
+        threading.Thread(target=run, args=(self._dump_stop,), daemon=True).start()
+
+    def stop_periodic_dump(self) -> None:
+        if self._dump_stop:
+            self._dump_stop.set()
+            self._dump_stop = None
+            self.dump()
+
+
+instrumentation = Instrumentation(
+    enabled=bool(os.environ.get(LATENCY_ENV_VAR)),
+    dump_path=os.environ.get(LATENCY_ENV_VAR) or None,
+)
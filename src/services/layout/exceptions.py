@@ -0,0 +1,6 @@
+class UnknownLayoutProfile(Exception):
+    ...
+
+
+class InvalidLayoutProfileName(Exception):
+    ...
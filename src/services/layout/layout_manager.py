@@ -1,13 +1,16 @@
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, Mapping, TypeVar
 
+from utils.configuration_models import LayoutSettings, LayoutSlot, TableSettings
 from utils.configuration_parser import (
     IConfigurationParser,
     LayoutConfigurationParser,
     TableConfigurationParser,
 )
-from widgets.table_layout.table_template import TableTemplate
 
-T = TypeVar("T", bound=TableTemplate)
+if TYPE_CHECKING:
+    from widgets.table_layout.table_template import TableTemplate
+
+T = TypeVar("T", bound="TableTemplate")
 
 
 class TableLayOutManager(Generic[T]):
@@ -41,18 +44,16 @@ class TableLayOutManager(Generic[T]):
         return cls._shared_instance
 
     @property
-    def table_settings(self) -> dict:
-        return self.table_configuration_parser.read_configuration()
+    def table_settings(self) -> TableSettings:
+        return self.table_configuration_parser.read_settings()
 
     @property
-    def layout_settings(self) -> dict:
-        return self.layout_configuration_parser.read_configuration()
+    def layout_settings(self) -> LayoutSettings:
+        return self.layout_configuration_parser.read_settings()
 
     @property
-    def table_configurations(self) -> dict:
-        return self.layout_configuration_parser.read_configuration()[
-            "table_configurations"
-        ]
+    def table_configurations(self) -> Mapping[str, LayoutSlot]:
+        return self.layout_settings.table_configurations
 
     def save_table_configuration(self):
         table_configurations = dict()
@@ -78,26 +79,26 @@ class TableLayOutManager(Generic[T]):
         """
         self.table_templates = []  # destroy any widget so not to repopulate it again
 
+        table_settings, layout_settings = self.table_settings, self.layout_settings
+        table_configurations = layout_settings.table_configurations
+
         main_table_template = cls_main_table_template(
-            left=self.table_configurations["slot_1"]["left"],
-            top=self.table_configurations["slot_1"]["top"],
-            table_height=self.table_settings.get("table_height", 0),
-            table_width=self.table_settings.get("table_width", 0),
+            left=table_configurations["slot_1"].left,
+            top=table_configurations["slot_1"].top,
+            table_height=table_settings.table_height,
+            table_width=table_settings.table_width,
             number_label=1,
         )
         self.table_templates.append(main_table_template)
-        for number_label in range(2, self.layout_settings.get("table_count", 1) + 1):
-            left = self.table_configurations.get("slot_" + str(number_label), {}).get(
-                "left", 0
-            )
-            top = self.table_configurations.get("slot_" + str(number_label), {}).get(
-                "top", 0
+        for number_label in range(2, layout_settings.table_count + 1):
+            slot = table_configurations.get(
+                "slot_" + str(number_label), LayoutSlot(top=0, left=0)
             )
             table_template = cls_table_template(
-                left=left,
-                top=top,
-                table_height=self.table_settings.get("table_height", 0),
-                table_width=self.table_settings.get("table_width", 0),
+                left=slot.left,
+                top=slot.top,
+                table_height=table_settings.table_height,
+                table_width=table_settings.table_width,
                 number_label=number_label,
             )
             self.table_templates.append(table_template)
@@ -0,0 +1,154 @@
+from pathlib import Path
+from typing import Mapping
+
+from utils.configuration_models import LayoutSettings
+from utils.configuration_parser import (
+    BASE_DIR,
+    IConfigurationParser,
+    LayoutConfigurationParser,
+    configuration_cache,
+    settings_writer,
+)
+
+from . import exceptions
+
+MANIFEST = "manifest.json"
+INVALID_PROFILE_NAME_CHARACTERS = set('<>:"/\\|?*')
+
+
+class LayoutProfileStore:
+    """
+    named layouts kept as one settings file per profile in a directory, with a
+    manifest indexing the profile files and naming the active profile.
+
+    the active layout stays in layout_settings.json, switching profile copies
+    the profile over it. only the manifest and the profile being switched to
+    are read, each parsed once per change of its file.
+
+    manifest.json:
+        {"layout_profiles": {"active": "cash", "profiles": {"cash": "cash.json"}}}
+    """
+
+    def __init__(
+        self,
+        directory: Path = BASE_DIR / "settings" / "layouts",
+        layout_configuration_parser: type[
+            IConfigurationParser
+        ] = LayoutConfigurationParser,
+    ):
+        self.directory = directory
+        self.layout_configuration_parser = layout_configuration_parser
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / MANIFEST
+
+    @property
+    def manifest(self) -> Mapping:
+        if not self.manifest_path.exists():
+            return {"active": None, "profiles": {}}
+        return configuration_cache.read(self.manifest_path).get("layout_profiles", {})
+
+    @property
+    def profile_names(self) -> list[str]:
+        return list(self.manifest.get("profiles", {}))
+
+    @property
+    def active_profile(self) -> str | None:
+        return self.manifest.get("active")
+
+    def get_profile_path(self, name: str) -> Path:
+        filename = self.manifest.get("profiles", {}).get(name)
+        if filename is None:
+            raise exceptions.UnknownLayoutProfile(name)
+        return self.directory / filename
+
+    def get_profile(self, name: str) -> LayoutSettings:
+        """
+        raises:
+            exceptions.UnknownLayoutProfile: if there is no profile with this name or
+                its file has been deleted.
+        """
+        try:
+            return configuration_cache.read_model(
+                self.get_profile_path(name), "layout_configuration", LayoutSettings
+            )
+        except FileNotFoundError as error:
+            raise exceptions.UnknownLayoutProfile(name) from error
+
+    def save_profile(self, name: str) -> None:
+        """
+        stores the active layout as a profile, replacing a profile with the same name
+
+        raises:
+            exceptions.InvalidLayoutProfileName: if the name cannot be used as a file name.
+        """
+        self.validate_profile_name(name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        layout_configuration = self.layout_configuration_parser.read_configuration()
+        profiles = dict(self.manifest.get("profiles", {}))
+        filename = profiles.setdefault(name, f"{name}.json")
+
+        settings_writer.write(
+            self.directory / filename, {"layout_configuration": layout_configuration}
+        )
+        self._write_manifest(active=name, profiles=profiles)
+
+    @staticmethod
+    def validate_profile_name(name: str) -> None:
+        """
+        the profile name becomes the name of its file in the profile directory
+
+        raises:
+            exceptions.InvalidLayoutProfileName: if the name is empty, has surrounding
+                whitespace, starts with a dot or contains a path separator or a character windows rejects.
+        """
+        if (
+            not name
+            or name != name.strip()
+            or name.startswith(".")
+            or INVALID_PROFILE_NAME_CHARACTERS.intersection(name)
+            or any(ord(character) < 32 for character in name)
+        ):
+            raise exceptions.InvalidLayoutProfileName(name)
+
+    def delete_profile(self, name: str) -> None:
+        profile_path = self.get_profile_path(name)
+        profiles = dict(self.manifest.get("profiles", {}))
+        del profiles[name]
+        active = self.active_profile if self.active_profile != name else None
+        self._write_manifest(active=active, profiles=profiles)
+        profile_path.unlink(missing_ok=True)
+        configuration_cache.invalidate(profile_path)
+
+    def switch_profile(self, name: str) -> LayoutSettings:
+        """
+        makes a profile the active layout
+
+        raises:
+            exceptions.UnknownLayoutProfile: if there is no profile with this name.
+        """
+        profile = self.get_profile(name)
+        self.layout_configuration_parser.write_configuration(
+            table_count=profile.table_count,
+            table_configurations={
+                slot_num: {"top": slot.top, "left": slot.left}
+                for slot_num, slot in profile.table_configurations.items()
+            },
+        )
+        self._write_manifest(
+            active=name, profiles=dict(self.manifest.get("profiles", {}))
+        )
+        return profile
+
+    def _write_manifest(self, active: str | None, profiles: dict[str, str]) -> None:
+        manifest = {"active": active, "profiles": profiles}
+        if self.manifest_path.exists():
+            settings_writer.update(
+                self.manifest_path, "layout_profiles", manifest, replace=True
+            )
+        else:
+            settings_writer.write(self.manifest_path, {"layout_profiles": manifest})
+
+
+layout_profile_store = LayoutProfileStore()
@@ -0,0 +1,77 @@
+import math
+
+
+def solve_assignment(cost_matrix: list[list[float]]) -> list[tuple[int, int]]:
+    """
+    solves the minimum total cost assignment problem (hungarian algorithm with
+    potentials, O(n^2 * m)).
+
+    rectangular matrices are supported: every row is assigned when there are
+    fewer rows than columns, every column otherwise.
+
+    Args:
+        cost_matrix (list[list[float]]): cost_matrix[row][column] cost of assigning a row to a column.
+
+    Returns:
+        list[tuple[int, int]]: assigned (row, column) pairs sorted by row.
+    """
+    if not cost_matrix or not cost_matrix[0]:
+        return []
+
+    transposed = len(cost_matrix) > len(cost_matrix[0])
+    if transposed:
+        cost_matrix = [list(column) for column in zip(*cost_matrix)]
+
+    row_count, column_count = len(cost_matrix), len(cost_matrix[0])
+
+    # 1-indexed potentials, column_match[column] is the row assigned to the column
+    row_potential = [0.0] * (row_count + 1)
+    column_potential = [0.0] * (column_count + 1)
+    column_match = [0] * (column_count + 1)
+    way = [0] * (column_count + 1)
+
+    for row in range(1, row_count + 1):
+        column_match[0] = row
+        current_column = 0
+        min_slack = [math.inf] * (column_count + 1)
+        used = [False] * (column_count + 1)
+        while True:
+            used[current_column] = True
+            current_row = column_match[current_column]
+            delta, next_column = math.inf, 0
+            for column in range(1, column_count + 1):
+                if used[column]:
+                    continue
+                slack = (
+                    cost_matrix[current_row - 1][column - 1]
+                    - row_potential[current_row]
+                    - column_potential[column]
+                )
+                if slack < min_slack[column]:
+                    min_slack[column] = slack
+                    way[column] = current_column
+                if min_slack[column] < delta:
+                    delta, next_column = min_slack[column], column
+            for column in range(column_count + 1):
+                if used[column]:
+                    row_potential[column_match[column]] += delta
+                    column_potential[column] -= delta
+                else:
+                    min_slack[column] -= delta
+            current_column = next_column
+            if column_match[current_column] == 0:
+                break
+        # augment along the alternating path
+        while current_column:
+            previous_column = way[current_column]
+            column_match[current_column] = column_match[previous_column]
+            current_column = previous_column
+
+    pairs = [
+        (column_match[column] - 1, column - 1)
+        for column in range(1, column_count + 1)
+        if column_match[column]
+    ]
+    if transposed:
+        pairs = [(column, row) for row, column in pairs]
+    return sorted(pairs)
@@ -0,0 +1,59 @@
+import enum
+from dataclasses import dataclass, field
+from typing import Mapping
+
+
+class ConfigChangeType(enum.Enum):
+    SEARCH_STRING = "search_string"
+    TABLE_SIZE = "table_size"
+    SLOT_LAYOUT = "slot_layout"
+    BUTTON_COORDINATES = "button_coordinates"
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    """
+    a change of the settings the slots were built from.
+
+    Attributes:
+        change_type (ConfigChangeType): which setting changed.
+        slot_nums (tuple[str, ...]): slots added, removed or moved by a SLOT_LAYOUT change.
+    """
+
+    change_type: ConfigChangeType
+    slot_nums: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    the settings TableManager builds its slots from
+    """
+
+    search_string: str
+    width: int
+    height: int
+    layout: dict[str, tuple[int, int]] = field(default_factory=dict)  # (top, left)
+    # button coordinates recorded on the reference table at table_position (top, left)
+    table_position: tuple[int, int] = (0, 0)
+    button_coordinates: Mapping[str, tuple[int, int]] = field(default_factory=dict)
+
+    def diff(self, other: "ConfigSnapshot") -> list[ConfigChange]:
+        changes = []
+        if self.search_string != other.search_string:
+            changes.append(ConfigChange(ConfigChangeType.SEARCH_STRING))
+        if (self.width, self.height) != (other.width, other.height):
+            changes.append(ConfigChange(ConfigChangeType.TABLE_SIZE))
+        slot_nums = tuple(
+            slot_num
+            for slot_num in {**self.layout, **other.layout}
+            if self.layout.get(slot_num) != other.layout.get(slot_num)
+        )
+        if slot_nums:
+            changes.append(ConfigChange(ConfigChangeType.SLOT_LAYOUT, slot_nums))
+        if (self.table_position, self.button_coordinates) != (
+            other.table_position,
+            other.button_coordinates,
+        ):
+            changes.append(ConfigChange(ConfigChangeType.BUTTON_COORDINATES))
+        return changes
@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from .entities import Slot
+
+
+class SlotDistanceEngine:
+    """
+    computes distances between slot centers and window centers in bulk.
+
+    slot centers are kept in a contiguous (slots, 2) array in the same
+    (center_y, center_x) order used by Slot.slot_center_coordinates, so many
+    windows can be measured against every slot in a single NumPy operation.
+    """
+
+    def __init__(self, slots: dict[str, Slot]):
+        self.slot_nums: list[str] = list(slots)
+        self.centers = np.array(
+            [slot.slot_center_coordinates for slot in slots.values()],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+
+    def __len__(self) -> int:
+        return len(self.slot_nums)
+
+    def distance_matrix(self, points: Sequence[tuple[float, float]]) -> np.ndarray:
+        """
+        args:
+            points: (center_y, center_x) coordinates of the windows.
+
+        returns:
+            np.ndarray: (slots, points) matrix of euclidean distances.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        deltas = self.centers[:, np.newaxis, :] - points[np.newaxis, :, :]
+        return np.hypot(deltas[..., 0], deltas[..., 1])
+
+    def nearest(self, points: Sequence[tuple[float, float]]) -> list[str | None]:
+        """
+        returns the closest slot number for each point, None if there are no slots
+        """
+        if not self.slot_nums:
+            return [None] * len(points)
+        indices = self.distance_matrix(points).argmin(axis=0)
+        return [self.slot_nums[index] for index in indices]
+
+    def nearest_empty(
+        self, points: Sequence[tuple[float, float]], empty_mask: Sequence[bool]
+    ) -> list[str | None]:
+        """
+        returns the closest empty slot number for each point, None if every slot is taken
+
+        args:
+            points: (center_y, center_x) coordinates of the windows.
+            empty_mask: whether each slot is empty, in the same order as slot_nums.
+        """
+        empty_mask = np.asarray(empty_mask, dtype=bool)
+        if not empty_mask.any():
+            return [None] * len(points)
+        distances = self.distance_matrix(points)
+        distances[~empty_mask, :] = np.inf
+        indices = distances.argmin(axis=0)
+        return [self.slot_nums[index] for index in indices]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import enum
+from typing import TYPE_CHECKING
+
+from ..utilities import WindowsSelector
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
+
+
+class DragState(enum.Enum):
+    STARTED = "started"
+    IN_PROGRESS = "in_progress"
+    SETTLED = "settled"
+
+
+class WindowDragTracker:
+    """
+    follows windows that are displaced from their slot while the left button is held.
+
+    a displaced window is STARTED on the first tick of a drag and IN_PROGRESS on
+    the following ticks, no event is emitted for it until the button is released.
+    the tick after the release ends the drag and the window settles exactly once,
+    it stays SETTLED until it is back at its slot position, as the settle event
+    may be handled on another thread a few ticks later. windows displaced while
+    the button is up (i.e. moved programmatically) settle immediately.
+    """
+
+    def __init__(self):
+        self._states: dict[int, DragState] = {}
+
+    def update(
+        self, displaced_windows: list[gw.Window], button_pressed: bool
+    ) -> list[gw.Window]:
+        """
+        advances the drag state of every window displaced during this tick,
+        windows back in their slot or no longer tracked are forgotten.
+
+        returns:
+            list[gw.Window]: the windows that settled during this tick.
+        """
+        states, settled_windows = {}, []
+        for window in displaced_windows:
+            handle = WindowsSelector.get_window_handle(window)
+            state = self._states.get(handle)
+            if button_pressed:
+                states[handle] = (
+                    DragState.IN_PROGRESS
+                    if state in (DragState.STARTED, DragState.IN_PROGRESS)
+                    else DragState.STARTED
+                )
+            else:
+                if state is not DragState.SETTLED:
+                    settled_windows.append(window)
+                states[handle] = DragState.SETTLED
+        self._states = states
+        return settled_windows
+
+    def get_state(self, window: gw.Window) -> DragState | None:
+        return self._states.get(WindowsSelector.get_window_handle(window))
+
+    @property
+    def is_dragging(self) -> bool:
+        return any(state is not DragState.SETTLED for state in self._states.values())
+
+    def reset(self) -> None:
+        self._states = {}
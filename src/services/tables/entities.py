@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import enum
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from services.windows.backend import get_window_backend
 
-import pygetwindow as gw
+if TYPE_CHECKING:
+    import pygetwindow as gw
 
 
 class AppName(enum.Enum):
@@ -36,33 +42,36 @@ class Slot:
 
     def move_to_assigned_slot(self):
         if self.window:
-            self.window.moveTo(self.left, self.top)
+            get_window_backend().move_window(self.window, self.left, self.top)
 
     def resize_window(self):
         if self.window:
-            self.window.width = self.width
-            self.window.height = self.height
+            get_window_backend().resize_window(self.window, self.width, self.height)
 
     @property
     def window_center_coordinates(self) -> tuple[int, int]:
         if self.window:
-            return (self.window.centery, self.window.centerx)
+            return get_window_backend().get_geometry(self.window).center_coordinates
         return (0, 0)
 
     @property
     def slot_center_coordinates(self) -> tuple[int, int]:
-        return (self.top - self.height / 2, self.left + self.width / 2)
+        return (self.top + self.height / 2, self.left + self.width / 2)
+
+    def contains_point(self, x: float, y: float) -> bool:
+        return (self.left <= x <= self.left + self.width) and (
+            self.top <= y <= self.top + self.height
+        )
 
     @property
     def is_center_outside_slot_boundary(self):
         if self.window:
-            outside_x_boundary = (
-                self.window.centerx < self.left
-                or self.window.centerx > (self.left + self.width)
+            geometry = get_window_backend().get_geometry(self.window)
+            outside_x_boundary = geometry.centerx < self.left or geometry.centerx > (
+                self.left + self.width
             )
-            outside_y_boundary = (
-                self.window.centery < self.top
-                or self.window.centery > (self.top + self.height)
+            outside_y_boundary = geometry.centery < self.top or geometry.centery > (
+                self.top + self.height
             )
             return outside_x_boundary or outside_y_boundary
         return False
@@ -14,9 +14,5 @@ class EmptySlot(Exception):
     ...
 
 
-class MultipleWindowsDetected(Exception):
-    ...
-
-
 class ButtonOutsideWindowError(Exception):
     ...
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from services.windows.entities import WindowGeometry
+
+from ..utilities import WindowsSelector
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
+
+
+class WindowGeometryCache:
+    """
+    reads the rectangle of each tracked window once per tick.
+
+    every position, size or center lookup made while handling the tick is
+    answered from the snapshot instead of another OS call.
+    """
+
+    def __init__(self):
+        self._geometries: dict[int, WindowGeometry] = {}
+
+    def refresh(self, windows: Iterable[gw.Window]) -> None:
+        """
+        reads the geometry of the given windows, forgetting every other window
+        """
+        geometries = {}
+        for window in windows:
+            handle = WindowsSelector.get_window_handle(window)
+            geometries[handle] = WindowsSelector.get_window_geometry(window)
+        self._geometries = geometries
+
+    def get(self, window: gw.Window) -> WindowGeometry | None:
+        return self._geometries.get(WindowsSelector.get_window_handle(window))
+
+    def set(self, window: gw.Window, geometry: WindowGeometry) -> None:
+        """
+        records a geometry applied by the tracker itself, so later lookups during
+        the tick see where the window was moved to
+        """
+        self._geometries[WindowsSelector.get_window_handle(window)] = geometry
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from services.windows.backend import get_window_backend
+from services.windows.entities import WindowGeometry
+
+from .entities import Slot
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutOperation:
+    """
+    moves and/or resizes a window onto the geometry of its slot
+    """
+
+    window: gw.Window
+    geometry: WindowGeometry
+    move: bool
+    resize: bool
+
+
+def get_slot_geometry(slot: Slot) -> WindowGeometry:
+    return WindowGeometry(
+        left=slot.left, top=slot.top, width=slot.width, height=slot.height
+    )
+
+
+def plan_layout(
+    assignment: Mapping[str, gw.Window | None],
+    slots: Mapping[str, Slot],
+    get_geometry: Callable[[gw.Window], WindowGeometry | None],
+) -> list[LayoutOperation]:
+    """
+    computes the operations placing every assigned window onto its slot.
+
+    windows already at the position and size of their slot get no operation,
+    and a window only at the wrong position is moved without being resized.
+
+    args:
+        assignment: target window of each slot, None for slots left empty.
+        slots: slots by slot number.
+        get_geometry: current geometry of a window, None if it is unknown.
+
+    returns:
+        list[LayoutOperation]: one operation per window whose geometry changes.
+    """
+    operations = []
+    for slot_num, window in assignment.items():
+        if window is None:
+            continue
+        target = get_slot_geometry(slots[slot_num])
+        current = get_geometry(window)
+        move = current is None or current.position != target.position
+        resize = current is None or current.size != target.size
+        if move or resize:
+            operations.append(LayoutOperation(window, target, move, resize))
+    return operations
+
+
+def execute_layout(operations: list[LayoutOperation]) -> None:
+    backend = get_window_backend()
+    for operation in operations:
+        if operation.resize:
+            backend.resize_window(
+                operation.window, operation.geometry.width, operation.geometry.height
+            )
+        if operation.move:
+            backend.move_window(
+                operation.window, operation.geometry.left, operation.geometry.top
+            )
@@ -0,0 +1,166 @@
+import math
+import statistics
+from collections import defaultdict
+from collections.abc import Callable
+
+from .entities import Slot
+
+Cell = tuple[int, int]
+
+MIN_CELL_SIZE = 50  # px, keeps the ring search short for tiny or empty slots
+# up to this many slots scanning every slot center beats the ring search
+LINEAR_SCAN_MAX_SLOTS = 32
+
+
+class SlotSpatialIndex:
+    """
+    uniform grid over the slot rectangles and slot centers.
+
+    answers "which slot contains this point" by checking the slots overlapping a
+    single cell, and "nearest slot" by searching rings of cells around the point
+    until no unvisited cell can hold a closer slot center.
+
+    coordinates follow the rest of the slot code: points and centers are
+    (y, x) tuples and centers come from Slot.slot_center_coordinates.
+
+    nearest scans every slot center instead on layouts of up to
+    LINEAR_SCAN_MAX_SLOTS slots, the usual case, where the ring search costs
+    more than it saves. slots_at always uses the grid, a single cell lookup.
+    """
+
+    def __init__(self, slots: dict[str, Slot], cell_size: int | None = None):
+        self.cell_size = cell_size or self.get_default_cell_size(slots)
+        self._slots = slots
+        self._order = {slot_num: order for order, slot_num in enumerate(slots)}
+        self._centers: dict[str, tuple[float, float]] = {}
+        self._center_cells: dict[Cell, list[str]] = defaultdict(list)
+        self._rect_cells: dict[Cell, list[str]] = defaultdict(list)
+        self._linear_scan = len(slots) <= LINEAR_SCAN_MAX_SLOTS
+
+        for slot_num, slot in slots.items():
+            center = slot.slot_center_coordinates
+            self._centers[slot_num] = center
+            self._center_cells[self.get_cell(*center)].append(slot_num)
+
+            top_row, left_column = self.get_cell(slot.top, slot.left)
+            bottom_row, right_column = self.get_cell(
+                slot.top + slot.height, slot.left + slot.width
+            )
+            for row in range(top_row, bottom_row + 1):
+                for column in range(left_column, right_column + 1):
+                    self._rect_cells[(row, column)].append(slot_num)
+
+        if self._center_cells:
+            rows = [row for row, _ in self._center_cells]
+            columns = [column for _, column in self._center_cells]
+            self._bounds = (min(rows), max(rows), min(columns), max(columns))
+
+    @staticmethod
+    def get_default_cell_size(slots: dict[str, Slot]) -> int:
+        """
+        cells about the size of a slot keep a handful of slots per cell
+        """
+        if not slots:
+            return MIN_CELL_SIZE
+        return max(
+            MIN_CELL_SIZE,
+            int(statistics.median(min(s.width, s.height) for s in slots.values())),
+        )
+
+    def get_cell(self, y: float, x: float) -> Cell:
+        return (math.floor(y / self.cell_size), math.floor(x / self.cell_size))
+
+    def slot_at(self, x: float, y: float) -> str | None:
+        """
+        returns the slot whose rectangle contains the point, the first slot in
+        order if slots overlap, None if no slot contains it.
+        """
+        return next(iter(self.slots_at(x=x, y=y)), None)
+
+    def slots_at(self, x: float, y: float) -> list[str]:
+        """
+        returns every slot whose rectangle contains the point, in slot order
+        """
+        candidates = [
+            slot_num
+            for slot_num in self._rect_cells.get(self.get_cell(y, x), ())
+            if self._slots[slot_num].contains_point(x=x, y=y)
+        ]
+        return sorted(candidates, key=self._order.__getitem__)
+
+    def nearest(
+        self,
+        point: tuple[float, float],
+        is_candidate: Callable[[str], bool] | None = None,
+    ) -> str | None:
+        """
+        returns the slot whose center is closest to the point
+
+        args:
+            point: (y, x) coordinates.
+            is_candidate (callable, optional): filters the slots that may be returned,
+            i.e. only empty slots.
+        """
+        if not self._center_cells:
+            return None
+        if self._linear_scan:
+            return self._nearest_linear(point, is_candidate)
+
+        point_row, point_column = self.get_cell(*point)
+        min_row, max_row, min_column, max_column = self._bounds
+        max_ring = max(
+            abs(point_row - min_row),
+            abs(point_row - max_row),
+            abs(point_column - min_column),
+            abs(point_column - max_column),
+        )
+
+        best, best_key = None, (math.inf, math.inf)
+        for ring in range(max_ring + 1):
+            for cell in self._get_ring_cells(point_row, point_column, ring):
+                for slot_num in self._center_cells.get(cell, ()):
+                    if is_candidate and not is_candidate(slot_num):
+                        continue
+                    center = self._centers[slot_num]
+                    key = (
+                        math.hypot(center[0] - point[0], center[1] - point[1]),
+                        self._order[slot_num],
+                    )
+                    if key < best_key:
+                        best, best_key = slot_num, key
+            # every slot outside the visited rings is at least ring * cell_size away
+            if best is not None and best_key[0] < ring * self.cell_size:
+                break
+        return best
+
+    def _nearest_linear(
+        self,
+        point: tuple[float, float],
+        is_candidate: Callable[[str], bool] | None = None,
+    ) -> str | None:
+        best, best_distance = None, math.inf
+        for slot_num, center in self._centers.items():
+            if is_candidate and not is_candidate(slot_num):
+                continue
+            # slots are visited in order, a tie keeps the first slot
+            distance = math.hypot(center[0] - point[0], center[1] - point[1])
+            if distance < best_distance:
+                best, best_distance = slot_num, distance
+        return best
+
+    def nearest_empty(self, point: tuple[float, float]) -> str | None:
+        return self.nearest(
+            point, is_candidate=lambda slot_num: self._slots[slot_num].window is None
+        )
+
+    @staticmethod
+    def _get_ring_cells(row: int, column: int, ring: int):
+        if ring == 0:
+            yield (row, column)
+            return
+        for offset in range(-ring, ring + 1):
+            yield (row - ring, column + offset)
+            yield (row + ring, column + offset)
+        for offset in range(-ring + 1, ring):
+            yield (row + offset, column - ring)
+            yield (row + offset, column + ring)
@@ -1,5 +1,6 @@
-import pyautogui
+from typing import Mapping
 
+from utils.configuration_models import TableSettings
 from utils.configuration_parser import IConfigurationParser, TableConfigurationParser
 
 from ..tables.entities import AppName
@@ -24,36 +25,41 @@ class TableConfiguration:
         self._left: int = 0
         self._button_coords = {}
         self.table = None
-        self.table_settings = None
+        self.table_settings: TableSettings | None = None
         self.configuration_parser = configuration_parser
 
         self.load_settings()
 
     @property
-    def top(self):
-        return self.configuration_parser.read_configuration().get("top", 0)
+    def settings(self) -> TableSettings:
+        """
+        saved table settings, parsed once per change of the settings file
+        """
+        return self.configuration_parser.read_settings()
 
     @property
-    def left(self):
-        return self.configuration_parser.read_configuration().get("left", 0)
+    def top(self) -> int:
+        return self.settings.top
 
     @property
-    def width(self):
-        return self.configuration_parser.read_configuration().get("table_width", 0)
+    def left(self) -> int:
+        return self.settings.left
 
     @property
-    def height(self):
-        return self.configuration_parser.read_configuration().get("table_height", 0)
+    def width(self) -> int:
+        return self.settings.table_width
 
     @property
-    def button_coordinates(self):
-        return self.configuration_parser.read_configuration().get(
-            "button_coordinates", {}
-        )
+    def height(self) -> int:
+        return self.settings.table_height
+
+    @property
+    def button_coordinates(self) -> Mapping[str, tuple[int, int]]:
+        return self.settings.button_coordinates
 
     @property
-    def search_string(self):
-        return self.configuration_parser.read_configuration().get("search_string", 0)
+    def search_string(self) -> str:
+        return self.settings.search_string
 
     @property
     def current_width(self):
@@ -85,10 +91,11 @@ class TableConfiguration:
         except IndexError:
             raise exceptions.NoTableFound
         else:
-            self._current_width = self.table.width
-            self._current_height = self.table.height
-            self._top = self.table.top
-            self._left = self.table.left
+            geometry = WindowsSelector.get_window_geometry(self.table)
+            self._current_width = geometry.width
+            self._current_height = geometry.height
+            self._top = geometry.top
+            self._left = geometry.left
             self.set_search_string(table_name)
 
     def configure_button_coordinates(
@@ -102,13 +109,14 @@ class TableConfiguration:
         self._button_coords[button_type.value] = coordinates
 
     def load_settings(self):
-        self.table_settings = self.configuration_parser.read_configuration()
-        self._current_width = self.table_settings.get("table_width", 0)
-        self._current_height = self.table_settings.get("table_height", 0)
-        self._search_string = self.table_settings.get("search_string", "")
-        self._top = self.table_settings.get("top", 0)
-        self._left = self.table_settings.get("left", 0)
-        self._button_coords = self.table_settings.get("button_coordinates", {})
+        self.table_settings = self.settings
+        self._current_width = self.table_settings.table_width
+        self._current_height = self.table_settings.table_height
+        self._search_string = self.table_settings.search_string
+        self._top = self.table_settings.top
+        self._left = self.table_settings.left
+        # copied, the settings are shared through the configuration cache
+        self._button_coords = dict(self.table_settings.button_coordinates)
 
     def save_settings(self):
         self.configuration_parser.write_configuration(
@@ -1,24 +1,58 @@
-import math
+from __future__ import annotations
 
-import pygetwindow as gw
+import json
+import logging
+import math
+from typing import TYPE_CHECKING
 
 from services.input_controllers.entities import key_states
 from services.layout.layout_manager import TableLayOutManager, table_layout_manager
+from services.layout.profile_store import LayoutProfileStore, layout_profile_store
+from services.windows.backend import get_window_backend
+from services.windows.entities import WindowGeometry
+from utils.exceptions import InvalidConfigurationError
 
+from ..instrumentation import instrumentation
 from ..utilities import AppName, WindowsSelector
 from . import exceptions
+from .assignment import solve_assignment
+from .config_changes import ConfigChange, ConfigChangeType, ConfigSnapshot
+from .distance_engine import SlotDistanceEngine
+from .drag_tracker import WindowDragTracker
 from .entities import Slot
 from .events import EventType
+from .geometry import WindowGeometryCache
+from .layout_planner import execute_layout, plan_layout
+from .spatial_index import SlotSpatialIndex
 from .table_config import TableConfiguration, table_configuration
+from .trace import TraceRecorder, to_window_record
+from .tracked_windows import TrackedWindows
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
+
+logger = logging.getLogger(__name__)
 
 
 class SlotManager:
     """
     class to manage slots and window allocation.
+
+    keeps a reverse index from window handle to slot number so window lookups
+    are O(1). The index is only updated by allocate_window_to_slot,
+    deallocate_window_from_slot, apply_assignment and the slots setter.
+
+    windows are only moved or resized when their geometry differs from their
+    slot, see place_windows.
     """
 
-    def __init__(self):
+    def __init__(self, window_geometries: WindowGeometryCache | None = None):
+        self.window_geometries = window_geometries
         self._slots: dict[str, Slot] = {}
+        self._window_slots: dict[int, str] = {}
+        self.layout_version = 0  # incremented every time the slots are replaced
+        self._distance_engine = SlotDistanceEngine({})
+        self._spatial_index = SlotSpatialIndex({})
 
     def allocate_window_to_slot(self, slot_num: str, window: gw.Window) -> None:
         """
@@ -33,10 +67,11 @@ class SlotManager:
             exceptions.InvalidSlotNum: If the provided slot number is invalid.
         """
         if slot_num in self._slots:
-            if self._slots[slot_num].window is None:
-                self._slots[slot_num].window = window
-                self._slots[slot_num].resize_window()
-                self._slots[slot_num].move_to_assigned_slot()
+            slot = self._slots[slot_num]
+            if slot.window is None:
+                slot.window = window
+                self._window_slots[WindowsSelector.get_window_handle(window)] = slot_num
+                self.place_windows({slot_num: window})
             else:
                 raise exceptions.SlotAlreadyOccupied(slot_num)
         else:
@@ -57,16 +92,75 @@ class SlotManager:
             slot = self._slots[slot_num]
             if slot.window:
                 window, slot.window = slot.window, None
+                del self._window_slots[WindowsSelector.get_window_handle(window)]
                 return window
             else:
                 raise exceptions.EmptySlot(slot_num)
         else:
             raise exceptions.InvalidSlotNum(slot_num)
 
-    def add_window_to_empty_slot(self, window: gw.Window) -> None:
+    def apply_assignment(self, assignment: dict[str, gw.Window | None]) -> None:
+        """
+        reassigns several slots in one pass, then places only the windows whose
+        geometry changes.
+
+        windows assigned here are taken out of the slot they were in, windows that
+        were in the reassigned slots and are not assigned again are left unallocated.
+
+        args:
+            assignment: new window of each given slot, None to empty the slot.
+
+        raises:
+            exceptions.InvalidSlotNum: If one of the slot numbers is invalid.
+        """
+        for slot_num in assignment:
+            if slot_num not in self._slots:
+                raise exceptions.InvalidSlotNum(slot_num)
+
+        released_slot_nums = list(assignment) + [
+            self.get_slot_num_from_window(window)
+            for window in assignment.values()
+            if window is not None
+        ]
+        for slot_num in released_slot_nums:
+            slot = self._slots.get(slot_num)
+            if slot is not None and slot.window is not None:
+                del self._window_slots[WindowsSelector.get_window_handle(slot.window)]
+                slot.window = None
+
+        for slot_num, window in assignment.items():
+            if window is not None:
+                self._slots[slot_num].window = window
+                self._window_slots[WindowsSelector.get_window_handle(window)] = slot_num
+        self.place_windows(assignment)
+
+    def place_windows(self, assignment: dict[str, gw.Window | None]) -> None:
+        """
+        moves and resizes the windows of the given slots onto their slot, skipping
+        windows already in place
+        """
+        operations = plan_layout(assignment, self._slots, self.get_window_geometry)
+        execute_layout(operations)
+        if self.window_geometries is not None:
+            for operation in operations:
+                self.window_geometries.set(operation.window, operation.geometry)
+
+    def get_window_geometry(self, window: gw.Window) -> WindowGeometry:
+        """
+        returns the geometry cached for this tick, read from the window otherwise
+        """
+        if self.window_geometries is not None:
+            if geometry := self.window_geometries.get(window):
+                return geometry
+        return WindowsSelector.get_window_geometry(window)
+
+    def add_window_to_empty_slot(self, window: gw.Window) -> str | None:
         """
         args:
             window: window to be allocated
+
+        returns:
+            str | None: the slot number the window was allocated to, None if all slots are taken.
         """
         empty_slots = {
             key: value for key, value in self.slots.items() if value.window is None
@@ -75,18 +169,23 @@ class SlotManager:
             # assign to first empty slot in order
             slot_num = next(iter(empty_slots.keys()))
             self.allocate_window_to_slot(slot_num=slot_num, window=window)
+            return slot_num
+        return None
 
     def remove_window_from_slot(self, window: gw.Window) -> None:
         """
         args:
             window: window to be deallocated
         """
-        for slot_num, slot in self.slots.items():
-            if slot.window == window:
-                self.deallocate_window_from_slot(slot_num)
+        slot_num = self.get_slot_num_from_window(window)
+        if slot_num is not None:
+            self.deallocate_window_from_slot(slot_num)
 
     def get_closest_slot_to_window(
-        self, window: gw.Window, assign_to_empty_slot: bool = False
+        self,
+        window: gw.Window,
+        assign_to_empty_slot: bool = False,
+        window_center: tuple[int, int] | None = None,
     ) -> str | None:
         """
         gets the closest slot num given a window
@@ -94,64 +193,130 @@ class SlotManager:
         args:
             window: window in which distance will be calculated
             assign_to_empty_slot (bool, optional): Whether to assign to an empty slot. Defaults to False.
+            window_center (tuple[int, int], optional): cached (center_y, center_x) of the window,
+            read from the window if not given.
         returns:
             str | None: The closest slot number or None if assign_to_empty_slot is True and all slots are occupied.
         """
-        window_center = (window.centery, window.centerx)
+        if window_center is None:
+            window_center = WindowsSelector.get_window_geometry(
+                window
+            ).center_coordinates
 
-        # Filter the slots based on the assign_to_empty_slot flag
         if assign_to_empty_slot:
-            filtered_slots = {
-                slot_num: slot
-                for slot_num, slot in self._slots.items()
-                if slot.window is None
-            }
-        else:
-            filtered_slots = self._slots
-
-        # Find the closest slot
-        if filtered_slots:
-            closest_slot_num = min(
-                filtered_slots,
-                key=lambda slot_num: self.calculate_distance(
-                    win_coord=window_center,
-                    slot_coord=filtered_slots[slot_num].slot_center_coordinates,
-                ),
-            )
-            return closest_slot_num
+            return self._spatial_index.nearest_empty(window_center)
+        return self._spatial_index.nearest(window_center)
+
+    def get_slot_num_at(self, x: int, y: int) -> str | None:
+        """
+        returns the slot number whose rectangle contains the point, None if there is none
+        """
+        return self._spatial_index.slot_at(x=x, y=y)
+
+    def get_allocated_slot_num_at(self, x: int, y: int) -> str | None:
+        """
+        returns the slot number containing the point if a window is allocated to it.
+
+        None if several allocated slots overlap at the point, which of their
+        windows is on top is not known from the slots.
+        """
+        allocated_slot_nums = [
+            slot_num
+            for slot_num in self._spatial_index.slots_at(x=x, y=y)
+            if self._slots[slot_num].window is not None
+        ]
+        if len(allocated_slot_nums) == 1:
+            return allocated_slot_nums[0]
         return None
 
-    def assign_window_to_closest_slot(self, window: gw.Window):
+    def assign_window_to_closest_slot(
+        self, window: gw.Window, window_center: tuple[int, int] | None = None
+    ):
         """
         Assigns a window to the closest slot.
 
         If the closest slot is occupied, it swaps the windows between the slots.
         else just moves it to the closest slot
         """
-        closest_slot_num = self.get_closest_slot_to_window(window)
+        closest_slot_num = self.get_closest_slot_to_window(
+            window, window_center=window_center
+        )
         orig_slot_num = self.get_slot_num_from_window(window)
 
-        closest_slot = self._slots[closest_slot_num]
-
-        if closest_slot.window is not None:
-            # swap the windows between the slots
-            deallocated_window = self.deallocate_window_from_slot(closest_slot_num)
-            self.allocate_window_to_slot(slot_num=closest_slot_num, window=window)
-            self.deallocate_window_from_slot(orig_slot_num)
-            self.allocate_window_to_slot(
-                slot_num=orig_slot_num, window=deallocated_window
+        if closest_slot_num == orig_slot_num:
+            self.place_windows({orig_slot_num: window})
+        else:
+            # swaps the windows if the closest slot is occupied, else orig_slot_num
+            # is left empty
+            self.apply_assignment(
+                {
+                    closest_slot_num: window,
+                    orig_slot_num: self._slots[closest_slot_num].window,
+                }
             )
-        elif closest_slot.window is None:
-            # assign the window to the closest slot
-            self.deallocate_window_from_slot(orig_slot_num)
-            self.allocate_window_to_slot(slot_num=closest_slot_num, window=window)
 
-    def assign_window_to_closest_empty_slot(self, window: gw.Window):
+    def assign_windows_to_slots(
+        self, windows: list[gw.Window], assign_to_empty_slot: bool = True
+    ) -> dict[str, gw.Window]:
+        """
+        allocates windows to slots so that the total distance between window and slot
+        centers is minimal, i.e. windows are moved as little as possible.
+
+        if there are more windows than slots the farthest windows are left unallocated,
+        if there are fewer windows the remaining slots stay empty.
+
+        args:
+            windows: windows to be allocated
+            assign_to_empty_slot (bool, optional): only consider empty slots. Defaults to True.
+
+        returns:
+            dict[str, gw.Window]: the allocated windows keyed by slot number.
+        """
+        if not windows:
+            return {}
+
+        windows_center_coordinates = [
+            self.get_window_geometry(window).center_coordinates for window in windows
+        ]
+        # rows are slots, columns are windows
+        distances = self._distance_engine.distance_matrix(windows_center_coordinates)
+        slot_nums = self._distance_engine.slot_nums
+        if assign_to_empty_slot:
+            empty_mask = self.get_empty_slot_mask()
+            slot_nums = [
+                slot_num
+                for slot_num, is_empty in zip(slot_nums, empty_mask)
+                if is_empty
+            ]
+            distances = distances[empty_mask]
+        cost_matrix = distances.tolist()
+
+        assigned_windows = {
+            slot_nums[slot_index]: windows[window_index]
+            for slot_index, window_index in solve_assignment(cost_matrix)
+        }
+        self.apply_assignment(assigned_windows)
+        return assigned_windows
+
+    def assign_window_to_closest_empty_slot(
+        self, window: gw.Window, window_center: tuple[int, int] | None = None
+    ) -> str | None:
+        """
+        returns:
+            str | None: the slot number the window was allocated to, None if all slots are taken.
+        """
         closest_slot_num = self.get_closest_slot_to_window(
-            window=window, assign_to_empty_slot=True
+            window=window, assign_to_empty_slot=True, window_center=window_center
         )
         if closest_slot_num:
             self.allocate_window_to_slot(slot_num=closest_slot_num, window=window)
+        return closest_slot_num
+
+    def get_empty_slot_mask(self) -> list[bool]:
+        """
+        returns whether each slot is empty, in slot order
+        """
+        return [slot.window is None for slot in self._slots.values()]
 
     def get_center_for_each_slot(self) -> dict[str, tuple[int, int]]:
         """
@@ -175,16 +340,16 @@ class SlotManager:
             raise exceptions.InvalidSlotNum
 
     def get_slot_from_window(self, window: gw.Window) -> Slot | None:
-        for slot in self.slots.values():
-            if slot.window == window:
-                return slot
+        slot_num = self.get_slot_num_from_window(window)
+        if slot_num is not None:
+            return self._slots[slot_num]
         return None
 
     def get_slot_num_from_window(self, window: gw.Window) -> str | None:
-        for slot_num, slot in self.slots.items():
-            if slot.window == window:
-                return slot_num
-        return None
+        return self._window_slots.get(WindowsSelector.get_window_handle(window))
+
+    def is_window_allocated(self, window: gw.Window) -> bool:
+        return WindowsSelector.get_window_handle(window) in self._window_slots
 
     def calculate_distance(
         self, win_coord: tuple[int, int], slot_coord: tuple[int, int]
@@ -205,7 +370,9 @@ class SlotManager:
 
     @property
     def allocated_windows(self) -> list[gw.Window]:
-        return [slot.window for slot in self._slots.values() if slot.window is not None]
+        return [
+            self._slots[slot_num].window for slot_num in self._window_slots.values()
+        ]
 
     @property
     def slots(self) -> dict[str, Slot]:
@@ -214,6 +381,14 @@ class SlotManager:
     @slots.setter
     def slots(self, table_configurations: dict[str, Slot]) -> None:
         self._slots = table_configurations
+        self.layout_version += 1
+        self._distance_engine = SlotDistanceEngine(table_configurations)
+        self._spatial_index = SlotSpatialIndex(table_configurations)
+        self._window_slots = {
+            WindowsSelector.get_window_handle(slot.window): slot_num
+            for slot_num, slot in table_configurations.items()
+            if slot.window is not None
+        }
 
 
 class TableManager:
@@ -235,9 +410,12 @@ class TableManager:
     ):
         self.table_layout_manager = table_layout_manager
         self.table_configuration = table_configuration
-        self.slot_manager = SlotManager()
-
-        self.tracked_windows: list[gw.Window] | list[None] = []
+        self.tracked_windows = TrackedWindows()
+        self.window_geometries = WindowGeometryCache()
+        self.slot_manager = SlotManager(window_geometries=self.window_geometries)
+        self.drag_tracker = WindowDragTracker()
+        self.trace_recorder: TraceRecorder | None = None
+        self.config_snapshot: ConfigSnapshot | None = None
 
     @property
     def table_layout(self):
@@ -255,203 +433,399 @@ class TableManager:
     def table_search_string(self):
         return self.table_configuration.search_string
 
+    def get_config_snapshot(self) -> ConfigSnapshot:
+        return ConfigSnapshot(
+            search_string=self.table_search_string,
+            width=self.table_width,
+            height=self.table_height,
+            layout={
+                slot_num: (layout_slot.top, layout_slot.left)
+                for slot_num, layout_slot in self.table_layout.items()
+            },
+            table_position=(
+                self.table_configuration.top,
+                self.table_configuration.left,
+            ),
+            button_coordinates=self.table_configuration.button_coordinates,
+        )
+
     def initialize_slots(self):
         """
         load the json data from configuration into slot objects
         """
+        self.config_snapshot = self.get_config_snapshot()
         slot_dict = {}
-        for key, value in self.table_layout.items():
+        for key, (top, left) in self.config_snapshot.layout.items():
             slot_dict[key] = Slot(
-                top=value["top"],
-                left=value["left"],
-                height=self.table_configuration.height,
-                width=self.table_configuration.width,
+                top=top,
+                left=left,
+                height=self.config_snapshot.height,
+                width=self.config_snapshot.width,
             )
         self.slot_manager.slots = slot_dict
 
+    def read_config_snapshot(self) -> ConfigSnapshot | None:
+        """
+        reads the settings changed while the tracker runs.
+
+        returns:
+            ConfigSnapshot | None: the current settings, or None if a settings file
+            cannot be parsed or holds invalid values, the last valid snapshot stays
+            in use until the file is fixed.
+        """
+        try:
+            return self.get_config_snapshot()
+        except (InvalidConfigurationError, json.JSONDecodeError) as e:
+            logger.error("settings change ignored, invalid settings: %s", e)
+            return None
+
+    def get_config_changes(self) -> list[ConfigChange]:
+        """
+        compares the current settings with the ones the slots were built from
+        """
+        if self.config_snapshot is None:
+            return []
+        snapshot = self.read_config_snapshot()
+        if snapshot is None:
+            return []
+        return self.config_snapshot.diff(snapshot)
+
+    def handle_config_changes(self) -> list[ConfigChange]:
+        """
+        applies settings changed while the tracker runs without rebuilding the
+        layout, only the affected slots and their windows are touched.
+
+        the changes are diffed here against the settings the slots were built
+        from, settings may have changed again since the tracker detected a
+        change, and a change that was already applied is a no-op. invalid
+        settings are ignored and the last valid ones are kept.
+
+        returns:
+            list[ConfigChange]: the changes applied.
+        """
+        if self.config_snapshot is None:
+            return []
+        snapshot = self.read_config_snapshot()
+        if snapshot is None:
+            return []
+        changes = self.config_snapshot.diff(snapshot)
+        for change in changes:
+            match change.change_type:
+                case ConfigChangeType.TABLE_SIZE:
+                    self.update_table_size(snapshot)
+                case ConfigChangeType.SLOT_LAYOUT:
+                    self.update_slot_layout(snapshot, change.slot_nums)
+                case ConfigChangeType.SEARCH_STRING:
+                    # target windows are filtered with the snapshot search string,
+                    # the next tick untracks old tables and picks up new ones
+                    pass
+                case ConfigChangeType.BUTTON_COORDINATES:
+                    # read by the hotkeys from the snapshot, no window is affected
+                    pass
+        self.config_snapshot = snapshot
+        return changes
+
+    def switch_layout_profile(
+        self, name: str, profile_store: LayoutProfileStore = layout_profile_store
+    ):
+        """
+        makes a layout profile active and re-tiles the running tables onto it
+        """
+        profile_store.switch_profile(name)
+        self.handle_config_changes()
+
+    def update_table_size(self, snapshot: ConfigSnapshot):
+        for slot in self.slot_manager.slots.values():
+            slot.width, slot.height = snapshot.width, snapshot.height
+        self.slot_manager.slots = self.slot_manager.slots  # slot centers moved
+        self.slot_manager.place_windows(
+            {
+                slot_num: slot.window
+                for slot_num, slot in self.slot_manager.slots.items()
+            }
+        )
+
+    def update_slot_layout(self, snapshot: ConfigSnapshot, slot_nums: tuple[str, ...]):
+        """
+        adds, removes and moves the given slots, windows of removed slots are
+        reallocated to empty slots if there are any
+        """
+        slots = dict(self.slot_manager.slots)
+        moved_slot_nums = []
+        for slot_num in slot_nums:
+            slot = slots.get(slot_num)
+            if slot_num not in snapshot.layout:
+                if slot is not None and slot.window is not None:
+                    self.tracked_windows.set_allocated(slot.window, allocated=False)
+                slots.pop(slot_num, None)
+            elif slot is None:
+                top, left = snapshot.layout[slot_num]
+                slots[slot_num] = Slot(
+                    top=top, left=left, height=snapshot.height, width=snapshot.width
+                )
+            else:
+                slot.top, slot.left = snapshot.layout[slot_num]
+                moved_slot_nums.append(slot_num)
+
+        self.slot_manager.slots = {
+            slot_num: slots[slot_num] for slot_num in snapshot.layout
+        }
+        self.slot_manager.place_windows(
+            {slot_num: slots[slot_num].window for slot_num in moved_slot_nums}
+        )
+        self.allocate_unallocated_windows()
+
     def initialize_tracked_windows(self):
-        self.tracked_windows = self.get_target_windows()
+        self.tracked_windows = TrackedWindows(self.get_target_windows())
 
     def get_target_windows(self) -> list[gw.Window]:
+        """
+        the search string comes from the settings the slots were built from, a
+        settings file edited while the tracker runs is only read on a change
+        """
+        if self.config_snapshot is None:
+            search_string = self.table_search_string
+        else:
+            search_string = self.config_snapshot.search_string
         windows = WindowsSelector.get_windows_by_app_name(AppName.CHROME)
         return WindowsSelector.filter_windows_by_tab_title(
-            tab_title=self.table_configuration.search_string, process_windows=windows
+            tab_title=search_string, process_windows=windows
         )
 
     def get_unallocated_window(self) -> gw.Window | None:
-        for window in self.tracked_windows:
-            if window not in self.slot_manager.allocated_windows:
-                return window
-        return None
+        return self.tracked_windows.get_unallocated_window()
 
-    def is_new_window_detected(self) -> tuple[bool, gw.Window | None]:
+    def get_new_windows(
+        self, target_windows: list[gw.Window] | None = None
+    ) -> list[gw.Window]:
         """
-        checks if a new window that satisfies the specified conditions is detected.
+        gets every window satisfying the specified conditions that is not tracked yet.
 
         function updates the list of tracked windows.
 
-        Returns:
-            A tuple containing two elements:
-            1. A boolean value indicating whether a new window satisfying the conditions is detected.
-            2. If a new window is detected, it returns the detected window;
-            otherwise, it returns None to indicate no new window detected.
-        """
-        new_windows = [
-            window
-            for window in self.get_target_windows()
-            if window not in self.tracked_windows
-        ]
-
-        if (
-            len(new_windows) > 1
-        ):  # Program assumed to detect only 1 window at a time per cycle
-            raise exceptions.MultipleWindowsDetected
+        Args:
+            target_windows (list[gw.Window], optional): window snapshot taken for the current tick.
+            Windows are enumerated if no snapshot is given.
 
-        if new_windows:
-            new_window = new_windows[0]
-            self.tracked_windows.append(new_window)
+        Returns:
+            list[gw.Window]: newly detected windows, empty if there are none.
+        """
+        if target_windows is None:
+            target_windows = self.get_target_windows()
 
-        return bool(new_windows), new_windows[0] if new_windows else (False, None)
+        new_windows, _ = self.tracked_windows.diff(target_windows)
+        for window in new_windows:
+            self.tracked_windows.add(window)
+        return new_windows
 
-    def is_window_terminated(self) -> tuple[bool, gw.Window | None]:
+    def get_terminated_windows(
+        self, target_windows: list[gw.Window] | None = None
+    ) -> list[gw.Window]:
         """
-        checks if a tracked window is no longer satisfied based on certain conditions.
-        This includes checking if the window is terminated or if its tab title has changed.
+        gets every tracked window that no longer satisfies the specified conditions.
+        This includes windows that are terminated or whose tab title has changed.
 
         function updates the list of tracked windows
 
+        Args:
+            target_windows (list[gw.Window], optional): window snapshot taken for the current tick.
+            Windows are enumerated if no snapshot is given.
+
         Returns:
-            A tuple containing two elements:
-            1. A boolean value indicating whether a tracked window is terminated or no longer satisfied.
-            2. If a window is terminated or no longer satisfied, it returns the terminated window;
-            otherwise, it returns None to indicate no terminated window.
-        """
-        deleted_windows = [
-            window
-            for window in self.tracked_windows
-            if window not in self.get_target_windows()
-        ]
+            list[gw.Window]: terminated windows, empty if there are none.
+        """
+        if target_windows is None:
+            target_windows = self.get_target_windows()
+
+        _, terminated_windows = self.tracked_windows.diff(target_windows)
+        for window in terminated_windows:
+            self.tracked_windows.remove(window)
+        return terminated_windows
 
-        if len(deleted_windows) > 1:
-            raise exceptions.MultipleWindowsDetected
+    def get_displaced_windows(self) -> list[gw.Window]:
+        """
+        gets every allocated window that is not at its slot position.
+
+        positions are compared against the geometry cached for this tick, windows
+        without a cached geometry (i.e. terminated during this tick) are skipped.
+        """
+        displaced_windows = []
+        for slot in self.slot_manager.slots.values():
+            if slot.window:
+                geometry = self.window_geometries.get(slot.window)
+                if geometry and geometry.position != (slot.left, slot.top):
+                    displaced_windows.append(slot.window)
+        return displaced_windows
 
-        if deleted_windows:
-            deleted_window = deleted_windows[0]
-            self.tracked_windows.remove(deleted_window)
+    def get_moved_windows(self) -> list[gw.Window]:
+        """
+        gets every displaced window that settled during this tick, a window
+        being dragged is reported once when the left button is released.
+        """
+        return self.drag_tracker.update(
+            self.get_displaced_windows(),
+            button_pressed=key_states.left_button_pressed,
+        )
 
-        return bool(deleted_windows), deleted_windows[0] if deleted_windows else (
-            False,
-            None,
+    def arrange_layout_on_start(self):
+        self.drag_tracker.reset()
+        self.initialize_slots()
+        windows = self.get_target_windows()
+        for window in self.slot_manager.assign_windows_to_slots(windows).values():
+            self.tracked_windows.set_allocated(window)
+
+    def get_window_records(self, windows: list[gw.Window]) -> list[tuple]:
+        """
+        describes windows for a trace, geometry comes from the cache when available
+        """
+        records = []
+        for window in windows:
+            geometry = self.window_geometries.get(
+                window
+            ) or WindowsSelector.get_window_geometry(window)
+            records.append(
+                to_window_record(
+                    handle=WindowsSelector.get_window_handle(window),
+                    title=get_window_backend().get_title(window),
+                    geometry=geometry,
+                )
+            )
+        return records
+
+    def start_recording(self, path: str) -> None:
+        """
+        records the window snapshot of every tick to a trace file, see services.tables.trace
+        """
+        self.stop_recording()
+        self.trace_recorder = TraceRecorder(
+            path,
+            header={
+                "search_string": self.table_search_string,
+                "table_width": self.table_width,
+                "table_height": self.table_height,
+                "table_configurations": {
+                    slot_num: {"top": layout_slot.top, "left": layout_slot.left}
+                    for slot_num, layout_slot in self.table_layout.items()
+                },
+            },
+            initial=self.get_window_records(self.get_target_windows()),
         )
 
-    def is_window_moved(self) -> tuple[bool, gw.Window | None]:
+    def stop_recording(self) -> None:
+        if self.trace_recorder:
+            self.trace_recorder.close()
+            self.trace_recorder = None
+
+    @instrumentation.timed("tracker.get_event")
+    def get_event(self) -> list[tuple[EventType, gw.Window]]:
         """
-        Check if any window has been moved from its original position.
+        takes a single snapshot of the target windows for this tick and diffs it
+        against the tracked windows, so a tick costs one window enumeration
+        regardless of how many tables are open.
 
         returns:
-            tuple: A tuple containing two elements:
-                - A boolean value indicating whether any window has been moved.
-                - If a window has been moved, it returns the moved window; otherwise, it returns None.
+            list[tuple[EventType, gw.Window]]: every event detected during this tick,
+            empty if nothing changed.
         """
-        for slot in self.slot_manager.slots.values():
-            if slot.window:
-                current_position = slot.window.left, slot.window.top
-                if current_position != (slot.left, slot.top):
-                    return True, slot.window
-        return False, None
+        target_windows = self.get_target_windows()
+        new_windows = self.get_new_windows(target_windows)
+        terminated_windows = self.get_terminated_windows(target_windows)
+        self.window_geometries.refresh(self.tracked_windows)
+        if self.trace_recorder:
+            self.trace_recorder.record(
+                self.get_window_records(target_windows),
+                button_pressed=key_states.left_button_pressed,
+            )
+        moved_windows = self.get_moved_windows()
 
-    def arrange_layout_on_start(self):
-        def assign_windows_to_slots() -> dict[str, Slot]:
-            """
-            Calculates all distances of slots to windows, assigns min distance of a window to a slot until
-            all slots are taken or all windows are assigned
-            """
-            windows = self.get_target_windows()
-
-            slot_center_coordinates = self.slot_manager.get_center_for_each_slot()
-            windows_center_coordinates = WindowsSelector.get_center_for_windows(windows)
-
-            # list of assigned windows to keep track of
-            assigned_windows = []
-            assigned_slots = []
-
-            # calculate all distances for each target window and slot
-            slot_distances_pair = {}
-            for slot_num, slot_coord in slot_center_coordinates.items():
-                distances = {}
-                for (
-                    win_coord_y,
-                    win_coord_x,
-                    target_window,
-                ) in windows_center_coordinates:
-                    distance = self.slot_manager.calculate_distance(
-                        win_coord=(win_coord_y, win_coord_x), slot_coord=slot_coord
-                    )
-                    distances[distance] = target_window
-                slot_distances_pair[slot_num] = distances
-
-            # sort distances for each slot in ascending order
-            for slot_num, distances in slot_distances_pair.items():
-                sorted_distances = sorted(distances.items(), key=lambda x: x[0])
-
-                # assign to the closest available slot
-                for distance, target_window in sorted_distances:
-                    if (
-                        target_window not in assigned_windows
-                        and slot_num not in assigned_slots
-                    ):
-                        self.slot_manager.allocate_window_to_slot(
-                            slot_num, target_window
-                        )
-                        assigned_windows.append(target_window)
-                        assigned_slots.append(slot_num)
-            return self.slot_manager.slots
+        return (
+            [(EventType.NEW_WINDOW, window) for window in new_windows]
+            + [(EventType.WINDOW_TERMINATED, window) for window in terminated_windows]
+            + [(EventType.WINDOW_MOVED, window) for window in moved_windows]
+        )
 
-        self.initialize_slots()
-        assign_windows_to_slots()
-
-    def get_event(self) -> tuple[EventType | None, gw.Window | None]:
-        has_new_window, new_window = self.is_new_window_detected()
-        is_window_terminated, terminated_window = self.is_window_terminated()
-        is_window_moved, moved_window = self.is_window_moved()
-
-        if has_new_window:
-            return EventType.NEW_WINDOW, new_window
-        elif is_window_terminated:
-            return EventType.WINDOW_TERMINATED, terminated_window
-        elif is_window_moved:
-            return EventType.WINDOW_MOVED, moved_window
-        return None, None
-
-    def handle_event(self, event_type: EventType, window: gw.Window):
-        match event_type:
-            case EventType.NEW_WINDOW:
-                self.handle_new_window_event(window)
-            case EventType.WINDOW_TERMINATED:
-                self.handle_window_terminated_event(window)
-            case EventType.WINDOW_MOVED:
-                self.handle_window_moved_event(window)
+    @instrumentation.timed("tracker.handle_event")
+    def handle_event(self, events: list[tuple[EventType, gw.Window]]):
+        """
+        applies every event detected during a tick in a single layout pass.
+
+        terminated windows are released first so their slots can be taken by new
+        windows, new windows are assigned to the empty slots in one pass and empty
+        slots are refilled once for the whole batch.
+        """
+        windows_by_event = {event_type: [] for event_type in EventType}
+        for event_type, window in events:
+            windows_by_event[event_type].append(window)
+
+        for window in windows_by_event[EventType.WINDOW_TERMINATED]:
+            self.handle_window_terminated_event(window)
+        if windows_by_event[EventType.NEW_WINDOW]:
+            self.handle_new_windows_event(windows_by_event[EventType.NEW_WINDOW])
+        if windows_by_event[EventType.WINDOW_TERMINATED]:
+            self.allocate_unallocated_windows()
+        for window in windows_by_event[EventType.WINDOW_MOVED]:
+            self.handle_window_moved_event(window)
+
+    def get_window_center(self, window: gw.Window) -> tuple[int, int] | None:
+        """
+        returns the (center_y, center_x) of a window cached during the last tick
+        """
+        geometry = self.window_geometries.get(window)
+        return geometry.center_coordinates if geometry else None
+
+    @instrumentation.timed("tracker.handle_new_windows_event")
+    def handle_new_windows_event(self, windows: list[gw.Window]):
+        """
+        allocates the windows detected during a tick to the empty slots with the
+        least total displacement, regardless of the order they appeared in
+        """
+        for window in self.slot_manager.assign_windows_to_slots(windows).values():
+            self.tracked_windows.set_allocated(window)
 
     def handle_new_window_event(self, window: gw.Window):
-        self.slot_manager.assign_window_to_closest_empty_slot(window)
+        self.handle_new_windows_event([window])
 
+    @instrumentation.timed("tracker.handle_window_terminated_event")
     def handle_window_terminated_event(self, window: gw.Window):
         """
         deallocates the window if its assigned to a slot
         """
         self.slot_manager.remove_window_from_slot(window)
-        # check if a window in tracked_windows is unallocated and allocate it to a slot
-        unallocated_window = self.get_unallocated_window()
-        if unallocated_window:
-            self.slot_manager.add_window_to_empty_slot(unallocated_window)
 
+    @instrumentation.timed("tracker.allocate_unallocated_windows")
+    def allocate_unallocated_windows(self):
+        """
+        allocates tracked windows that are not assigned to a slot yet until
+        every slot is taken
+        """
+        for window in self.tracked_windows.get_unallocated_windows():
+            if self.slot_manager.add_window_to_empty_slot(window) is None:
+                break
+            self.tracked_windows.set_allocated(window)
+
+    @instrumentation.timed("tracker.handle_window_moved_event")
     def handle_window_moved_event(self, window: gw.Window):
-        slot = self.slot_manager.get_slot_from_window(window=window)
-        if not key_states.left_button_pressed:  # check if left mouse button is released
-            if slot.is_center_outside_slot_boundary:
-                self.slot_manager.assign_window_to_closest_slot(window=window)
+        slot_num = self.slot_manager.get_slot_num_from_window(window=window)
+        if slot_num is None:
+            return
+        slot = self.slot_manager.slots[slot_num]
+        # a new drag may have started since the window settled, it settles again on release
+        if not key_states.left_button_pressed:
+            window_center = self.get_window_center(window)
+            if window_center is None:
+                is_center_outside_slot_boundary = slot.is_center_outside_slot_boundary
+            else:
+                center_y, center_x = window_center
+                is_center_outside_slot_boundary = not slot.contains_point(
+                    x=center_x, y=center_y
+                )
+
+            if is_center_outside_slot_boundary:
+                self.slot_manager.assign_window_to_closest_slot(
+                    window=window, window_center=window_center
+                )
             else:
-                slot.move_to_assigned_slot()
+                self.slot_manager.place_windows({slot_num: window})
 
 
 table_manager = TableManager(
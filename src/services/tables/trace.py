@@ -0,0 +1,230 @@
+"""
+record and replay of the window snapshots seen by the tracker.
+
+a trace is a gzip compressed JSON lines file. The first line is a header with
+the search string, table size, slot layout and the initial window snapshot.
+Every following line describes one or more identical ticks as a delta against
+the previous tick:
+
+    {"t": 1520, "u": [[handle, title, left, top, width, height], ...], "r": [handle, ...], "b": 1, "n": 3}
+
+t is the milliseconds since recording started, u the windows that appeared or
+changed, r the windows that disappeared, b whether the left button was held
+(windows are being dragged) and n how many ticks saw the snapshot.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterator
+
+from services.input_controllers.entities import key_states
+from services.windows.backend import set_window_backend
+from services.windows.entities import WindowGeometry
+from services.windows.fake_backend import FakeWindowBackend
+from utils.configuration_models import LayoutSlot
+
+if TYPE_CHECKING:
+    from .table_manager import TableManager
+
+TRACE_VERSION = 2
+TRACE_ENV_VAR = "TABLETAMER_TRACE"  # path of the trace recorded by TrackProcess
+
+WindowRecord = tuple[int, str, int, int, int, int]
+
+
+def to_window_record(handle: int, title: str, geometry: WindowGeometry) -> WindowRecord:
+    return (
+        handle,
+        title,
+        geometry.left,
+        geometry.top,
+        geometry.width,
+        geometry.height,
+    )
+
+
+class TraceRecorder:
+    """
+    writes per-tick window snapshots to a trace file
+    """
+
+    def __init__(self, path: str | Path, header: dict, initial: list[WindowRecord]):
+        self.path = Path(path)
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        self._started = time.monotonic()
+        self._previous = {record[0]: record for record in initial}
+        self._pending: dict | None = None
+
+        self._write(
+            {
+                "version": TRACE_VERSION,
+                **header,
+                "initial": [list(record) for record in initial],
+            }
+        )
+
+    def record(self, windows: list[WindowRecord], button_pressed: bool = False) -> None:
+        current = {record[0]: record for record in windows}
+        updated = [
+            list(record)
+            for handle, record in current.items()
+            if self._previous.get(handle) != record
+        ]
+        removed = [handle for handle in self._previous if handle not in current]
+        self._previous = current
+
+        button = int(button_pressed)
+        if (
+            not updated
+            and not removed
+            and self._pending is not None
+            and self._pending["b"] == button
+        ):
+            self._pending["n"] += 1
+            return
+
+        self._flush_pending()
+        self._pending = {
+            "t": round((time.monotonic() - self._started) * 1000),
+            "u": updated,
+            "r": removed,
+            "b": button,
+            "n": 1,
+        }
+
+    def close(self) -> None:
+        self._flush_pending()
+        self._file.close()
+
+    def _flush_pending(self) -> None:
+        if self._pending is not None:
+            self._write(self._pending)
+            self._pending = None
+
+    def _write(self, line: dict) -> None:
+        self._file.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+
+class TraceReader:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with gzip.open(self.path, "rt", encoding="utf-8") as trace_file:
+            self.header = json.loads(trace_file.readline())
+        if self.header.get("version") != TRACE_VERSION:
+            raise ValueError(f"unsupported trace version {self.header.get('version')}")
+
+    def __iter__(self) -> Iterator[dict]:
+        with gzip.open(self.path, "rt", encoding="utf-8") as trace_file:
+            trace_file.readline()  # header
+            for line in trace_file:
+                yield json.loads(line)
+
+
+@dataclass
+class ReplayStats:
+    ticks: int = 0
+    events: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.ticks / self.elapsed if self.elapsed else 0.0
+
+
+class TraceReplayer:
+    """
+    feeds a recorded trace back through a TableManager running on a
+    FakeWindowBackend, either as fast as possible or following the recorded
+    timestamps.
+
+    the manager used by the last replay is kept in table_manager.
+    """
+
+    def __init__(self, path: str | Path):
+        self.reader = TraceReader(path)
+        self.backend = FakeWindowBackend()
+        self.table_manager: TableManager | None = None
+
+    def build_table_manager(self) -> TableManager:
+        """
+        creates a TableManager with the search string and layout of the recording.
+
+        the manager is a separate instance, the TableManager singleton used by the
+        application is left untouched.
+        """
+        from .table_manager import TableManager
+
+        header = self.reader.header
+        table_manager = object.__new__(TableManager)
+        table_manager.__init__(
+            table_layout_manager=SimpleNamespace(
+                table_configurations={
+                    slot_num: LayoutSlot(top=slot["top"], left=slot["left"])
+                    for slot_num, slot in header["table_configurations"].items()
+                }
+            ),
+            table_configuration=SimpleNamespace(
+                search_string=header["search_string"],
+                width=header["table_width"],
+                height=header["table_height"],
+                top=0,
+                left=0,
+                button_coordinates={},
+            ),
+        )
+        return table_manager
+
+    def apply(self, updated: list[list], removed: list[int]) -> None:
+        for handle in removed:
+            window = self.backend.windows.get(handle)
+            if window:
+                self.backend.close_window(window)
+        for handle, title, left, top, width, height in updated:
+            window = self.backend.windows.get(handle)
+            if window is None:
+                self.backend.open_window(title, left, top, width, height, handle=handle)
+            else:
+                window.title = title
+                window.left, window.top = left, top
+                window.width, window.height = width, height
+
+    def replay(
+        self, table_manager: TableManager | None = None, realtime: bool = False
+    ) -> ReplayStats:
+        set_window_backend(self.backend)
+        table_manager = table_manager or self.build_table_manager()
+        self.table_manager = table_manager
+        button_pressed = key_states.left_button_pressed
+
+        self.apply(self.reader.header["initial"], removed=[])
+        table_manager.initialize_tracked_windows()
+        table_manager.arrange_layout_on_start()
+
+        stats = ReplayStats()
+        started = time.monotonic()
+        for tick in self.reader:
+            if realtime:
+                delay = started + tick["t"] / 1000 - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            self.apply(tick["u"], tick["r"])
+            key_states.left_button_pressed = bool(tick["b"])
+            for _ in range(tick["n"]):
+                events = table_manager.get_event()
+                if events:
+                    table_manager.handle_event(events)
+                stats.ticks += 1
+                stats.events += len(events)
+        stats.elapsed = time.monotonic() - started
+        key_states.left_button_pressed = button_pressed
+        return stats
+
+
+def get_trace_path_from_env() -> str | None:
+    return os.environ.get(TRACE_ENV_VAR) or None
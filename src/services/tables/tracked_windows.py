@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ..utilities import WindowsSelector
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
+
+
+@dataclass
+class TrackedWindow:
+    """
+    Represents a window followed by the tracker
+
+    Attributes:
+        window (gw.Window): the tracked window.
+        allocated (bool): whether the window is currently allocated to a slot.
+    """
+
+    window: gw.Window
+    allocated: bool = False
+
+
+class TrackedWindows:
+    """
+    registry of tracked windows keyed by their native window handle.
+
+    membership checks, allocation flags and lookups are dict operations so
+    diffing a snapshot against the registry is O(n) per tick.
+
+    windows are added and removed by the tracker thread while the gui thread
+    reads the registry, so every iteration runs over a copy of the entries.
+    """
+
+    def __init__(self, windows: Iterable[gw.Window] = ()):
+        self._windows: dict[int, TrackedWindow] = {}
+        for window in windows:
+            self.add(window)
+
+    def __contains__(self, window: gw.Window) -> bool:
+        return WindowsSelector.get_window_handle(window) in self._windows
+
+    def __iter__(self) -> Iterator[gw.Window]:
+        return (tracked.window for tracked in self._get_entries())
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def add(self, window: gw.Window, allocated: bool = False) -> None:
+        self._windows[WindowsSelector.get_window_handle(window)] = TrackedWindow(
+            window=window, allocated=allocated
+        )
+
+    def remove(self, window: gw.Window) -> None:
+        self._windows.pop(WindowsSelector.get_window_handle(window), None)
+
+    def set_allocated(self, window: gw.Window, allocated: bool = True) -> None:
+        tracked = self._windows.get(WindowsSelector.get_window_handle(window))
+        if tracked:
+            tracked.allocated = allocated
+
+    def is_allocated(self, window: gw.Window) -> bool:
+        tracked = self._windows.get(WindowsSelector.get_window_handle(window))
+        return bool(tracked and tracked.allocated)
+
+    def diff(
+        self, target_windows: list[gw.Window]
+    ) -> tuple[list[gw.Window], list[gw.Window]]:
+        """
+        compares a window snapshot against the tracked windows
+
+        returns:
+            tuple: new windows that are not tracked yet and tracked windows missing from the snapshot.
+        """
+        target_handles = {
+            WindowsSelector.get_window_handle(window): window
+            for window in target_windows
+        }
+        new_windows = [
+            window
+            for handle, window in target_handles.items()
+            if handle not in self._windows
+        ]
+        terminated_windows = [
+            tracked.window
+            for handle, tracked in list(self._windows.items())
+            if handle not in target_handles
+        ]
+        return new_windows, terminated_windows
+
+    def get_unallocated_windows(self) -> list[gw.Window]:
+        return [
+            tracked.window for tracked in self._get_entries() if not tracked.allocated
+        ]
+
+    def get_unallocated_window(self) -> gw.Window | None:
+        for tracked in self._get_entries():
+            if not tracked.allocated:
+                return tracked.window
+        return None
+
+    def _get_entries(self) -> list[TrackedWindow]:
+        # copied in a single call, the dict may change size on another thread
+        return list(self._windows.values())
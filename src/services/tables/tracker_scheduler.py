@@ -0,0 +1,73 @@
+import time
+from typing import Callable
+
+BASE_TICK = 0.05  # seconds between polls once the tracker has settled
+FAST_TICK = 0.01  # used while dragging and right after an event
+IDLE_TICK = 0.5  # upper bound reached by backing off while nothing changes
+BACKOFF_FACTOR = 2.0
+FAST_PERIOD = 1.0  # seconds of fast polling after an event
+
+
+class TrackerScheduler:
+    """
+    decides how long the tracker sleeps between two ticks.
+
+    polling is fast while a drag is in progress or shortly after an event,
+    otherwise the interval starts at base_tick and backs off exponentially
+    up to idle_tick while nothing changes.
+    """
+
+    def __init__(
+        self,
+        base_tick: float = BASE_TICK,
+        fast_tick: float = FAST_TICK,
+        idle_tick: float = IDLE_TICK,
+        backoff_factor: float = BACKOFF_FACTOR,
+        fast_period: float = FAST_PERIOD,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.base_tick = base_tick
+        self.fast_tick = fast_tick
+        self.idle_tick = idle_tick
+        self.backoff_factor = backoff_factor
+        self.fast_period = fast_period
+        self.clock = clock
+        self.sleep = sleep
+
+        self._interval = base_tick
+        self._fast_until = 0.0
+
+    def reset(self) -> None:
+        self._interval = self.base_tick
+        self._fast_until = 0.0
+
+    def next_interval(self, event_detected: bool, is_dragging: bool) -> float:
+        """
+        returns the number of seconds to wait before the next tick
+
+        args:
+            event_detected (bool): whether the tick that just ran produced an event.
+            is_dragging (bool): whether the left mouse button is currently held down.
+        """
+        now = self.clock()
+        if event_detected:
+            self._fast_until = now + self.fast_period
+
+        if is_dragging or now < self._fast_until:
+            self._interval = self.base_tick  # back off from base once things settle
+            return self.fast_tick
+
+        interval = self._interval
+        self._interval = min(self._interval * self.backoff_factor, self.idle_tick)
+        return interval
+
+    def wait(self, event_detected: bool, is_dragging: bool) -> float:
+        interval = self.next_interval(
+            event_detected=event_detected, is_dragging=is_dragging
+        )
+        self.sleep(interval)
+        return interval
+
+
+tracker_scheduler = TrackerScheduler()
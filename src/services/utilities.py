@@ -1,20 +1,28 @@
-import pygetwindow as gw
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from services.tables.entities import AppName
+from services.windows.backend import get_window_backend
+from services.windows.entities import WindowGeometry
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
 
 
 class WindowsSelector:
     @staticmethod
     def get_windows_by_app_name(app_name: AppName) -> list[gw.Window] | None:
-        return gw.getWindowsWithTitle(app_name.value)
+        return get_window_backend().get_windows_with_title(app_name.value)
 
     @staticmethod
     def get_active_tab_title(app_name: AppName, process_window: gw.Window) -> str:
+        title = get_window_backend().get_title(process_window)
         match app_name.value:
             case AppName.CHROME.value:
-                return process_window.title.split(" - Google Chrome")[0]
+                return title.split(" - Google Chrome")[0]
             case AppName.FIREFOX.value:
-                return process_window.title
+                return title
 
     @staticmethod
     def filter_windows_by_tab_title(
@@ -35,10 +43,25 @@ class WindowsSelector:
     ) -> list[tuple[int, int, gw.Window]]:
         center_coordinates = []
         for window in windows:
-            value = (window.centery, window.centerx, window)
+            geometry = WindowsSelector.get_window_geometry(window)
+            value = (geometry.centery, geometry.centerx, window)
             center_coordinates.append(value)
         return center_coordinates
 
+    @staticmethod
+    def get_window_handle(window: gw.Window) -> int:
+        """
+        returns the native handle of a window, stable for the lifetime of the window
+        """
+        return get_window_backend().get_handle(window)
+
+    @staticmethod
+    def get_window_geometry(window: gw.Window) -> WindowGeometry:
+        """
+        reads the window rectangle with a single OS call
+        """
+        return get_window_backend().get_geometry(window)
+
     @staticmethod
     def get_active_window() -> gw.Window:
-        return gw.getActiveWindow()
+        return get_window_backend().get_active_window()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from .entities import WindowGeometry
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
+
+
+class WindowBackend(ABC):
+    """
+    every OS window operation used by the tracker, layout and hotkey code.
+
+    windows are opaque objects owned by the backend, only the backend reads or
+    changes them.
+    """
+
+    @abstractmethod
+    def get_windows_with_title(self, title: str) -> list[gw.Window]:
+        """
+        returns every window whose title contains the given string
+        """
+
+    @abstractmethod
+    def get_title(self, window: gw.Window) -> str:
+        pass
+
+    @abstractmethod
+    def get_handle(self, window: gw.Window) -> int:
+        """
+        returns the native handle of a window, stable for the lifetime of the window
+        """
+
+    @abstractmethod
+    def get_geometry(self, window: gw.Window) -> WindowGeometry:
+        pass
+
+    @abstractmethod
+    def move_window(self, window: gw.Window, left: int, top: int) -> None:
+        pass
+
+    @abstractmethod
+    def resize_window(self, window: gw.Window, width: int, height: int) -> None:
+        pass
+
+    @abstractmethod
+    def get_active_window(self) -> gw.Window | None:
+        pass
+
+
+class PyGetWindowBackend(WindowBackend):
+    """
+    pygetwindow implementation, pygetwindow is only imported when the backend
+    is created so the rest of the code can be imported off Windows.
+    """
+
+    def __init__(self):
+        import pygetwindow
+
+        self._gw = pygetwindow
+
+    def get_windows_with_title(self, title: str) -> list[gw.Window]:
+        return self._gw.getWindowsWithTitle(title)
+
+    def get_title(self, window: gw.Window) -> str:
+        return window.title
+
+    def get_handle(self, window: gw.Window) -> int:
+        return window._hWnd
+
+    def get_geometry(self, window: gw.Window) -> WindowGeometry:
+        box = window.box  # a single GetWindowRect call
+        return WindowGeometry(
+            left=box.left, top=box.top, width=box.width, height=box.height
+        )
+
+    def move_window(self, window: gw.Window, left: int, top: int) -> None:
+        window.moveTo(left, top)
+
+    def resize_window(self, window: gw.Window, width: int, height: int) -> None:
+        window.resizeTo(width, height)
+
+    def get_active_window(self) -> gw.Window | None:
+        return self._gw.getActiveWindow()
+
+
+_window_backend: WindowBackend | None = None
+
+
+def get_window_backend() -> WindowBackend:
+    """
+    returns the backend in use, defaults to pygetwindow
+    """
+    global _window_backend
+    if _window_backend is None:
+        _window_backend = PyGetWindowBackend()
+    return _window_backend
+
+
+def set_window_backend(backend: WindowBackend | None) -> None:
+    """
+    replaces the backend in use, None restores the default on next access
+    """
+    global _window_backend
+    _window_backend = backend
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class WindowGeometry:
+    """
+    Snapshot of a window rectangle
+
+    Attributes:
+        left (int): Horizontal position of the window's left edge (in pixels).
+        top (int): Vertical position of the window's top edge (in pixels).
+        width (int): Window width (in pixels).
+        height (int): Window height (in pixels).
+    """
+
+    left: int
+    top: int
+    width: int
+    height: int
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return (self.left, self.top)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return (self.width, self.height)
+
+    @property
+    def centerx(self) -> int:
+        return self.left + self.width // 2
+
+    @property
+    def centery(self) -> int:
+        return self.top + self.height // 2
+
+    @property
+    def center_coordinates(self) -> tuple[int, int]:
+        return (self.centery, self.centerx)
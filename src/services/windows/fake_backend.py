@@ -0,0 +1,134 @@
+import itertools
+import time
+from collections import Counter
+
+from .backend import WindowBackend
+from .entities import WindowGeometry
+
+
+class FakeWindow:
+    """
+    in-memory window, exposes the same attributes the code reads from gw.Window
+    """
+
+    def __init__(
+        self, handle: int, title: str, left: int, top: int, width: int, height: int
+    ):
+        self._hWnd = handle
+        self.title = title
+        self.left = left
+        self.top = top
+        self.width = width
+        self.height = height
+
+    def __repr__(self):
+        return f"FakeWindow(hWnd={self._hWnd}, title={self.title!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, FakeWindow) and self._hWnd == other._hWnd
+
+    def __hash__(self):
+        return hash(self._hWnd)
+
+    @property
+    def centerx(self) -> int:
+        return self.left + self.width // 2
+
+    @property
+    def centery(self) -> int:
+        return self.top + self.height // 2
+
+    @property
+    def geometry(self) -> WindowGeometry:
+        return WindowGeometry(
+            left=self.left, top=self.top, width=self.width, height=self.height
+        )
+
+
+class FakeWindowBackend(WindowBackend):
+    """
+    simulates any number of windows in memory.
+
+    every backend call is counted in call_counts and can be slowed down to
+    mimic the cost of the OS call it replaces, either with a latency shared by
+    all calls or per method name i.e. {"get_windows_with_title": 0.002}.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        call_latencies: dict[str, float] | None = None,
+    ):
+        self.latency = latency
+        self.call_latencies = call_latencies or {}
+        self.call_counts: Counter[str] = Counter()
+        self.windows: dict[int, FakeWindow] = {}
+        self.active_window: FakeWindow | None = None
+        self._handles = itertools.count(1)
+
+    def _call(self, name: str) -> None:
+        self.call_counts[name] += 1
+        latency = self.call_latencies.get(name, self.latency)
+        if latency:
+            time.sleep(latency)
+
+    # simulation helpers, not part of WindowBackend
+
+    def open_window(
+        self,
+        title: str,
+        left: int = 0,
+        top: int = 0,
+        width: int = 800,
+        height: int = 600,
+        handle: int | None = None,
+    ) -> FakeWindow:
+        handle = next(self._handles) if handle is None else handle
+        window = FakeWindow(handle, title, left, top, width, height)
+        self.windows[handle] = window
+        return window
+
+    def close_window(self, window: FakeWindow) -> None:
+        self.windows.pop(window._hWnd, None)
+        if self.active_window == window:
+            self.active_window = None
+
+    def drag_window(self, window: FakeWindow, left: int, top: int) -> None:
+        """
+        moves a window the way a user would, without counting a backend call
+        """
+        window.left, window.top = left, top
+
+    def reset_call_counts(self) -> None:
+        self.call_counts.clear()
+
+    # WindowBackend
+
+    def get_windows_with_title(self, title: str) -> list[FakeWindow]:
+        self._call("get_windows_with_title")
+        title = title.upper()
+        return [
+            window for window in self.windows.values() if title in window.title.upper()
+        ]
+
+    def get_title(self, window: FakeWindow) -> str:
+        return window.title
+
+    def get_handle(self, window: FakeWindow) -> int:
+        return window._hWnd
+
+    def get_geometry(self, window: FakeWindow) -> WindowGeometry:
+        self._call("get_geometry")
+        return window.geometry
+
+    def move_window(self, window: FakeWindow, left: int, top: int) -> None:
+        self._call("move_window")
+        window.left, window.top = left, top
+
+    def resize_window(self, window: FakeWindow, width: int, height: int) -> None:
+        self._call("resize_window")
+        window.width, window.height = width, height
+
+    def get_active_window(self) -> FakeWindow | None:
+        self._call("get_active_window")
+        return self.active_window
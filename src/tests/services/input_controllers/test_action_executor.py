@@ -0,0 +1,71 @@
+import threading
+
+from services.input_controllers.action_executor import ActionExecutor
+
+
+def test_actions_run_in_order_on_one_thread():
+    handled = []
+    executor = ActionExecutor(
+        handler=lambda action: handled.append((action, threading.get_ident()))
+    )
+    executor.start()
+    for action in ("FOLD", "CHECK_CALL", "BET", "RAISE"):
+        assert executor.submit(action)
+    executor.stop()
+
+    assert [action for action, _ in handled] == ["FOLD", "CHECK_CALL", "BET", "RAISE"]
+    assert len({thread for _, thread in handled}) == 1
+    assert not executor.is_running
+
+
+def test_full_queue_drops_new_actions():
+    executor = ActionExecutor(handler=lambda action: None, max_queued_actions=2)
+
+    assert executor.submit("FOLD")
+    assert executor.submit("BET")
+    assert not executor.submit("RAISE")
+
+
+def test_actions_are_kept_by_default():
+    now = [0.0]
+    handled = []
+    executor = ActionExecutor(handler=handled.append, clock=lambda: now[0])
+    executor.submit("FOLD")
+    now[0] = 10.0
+    executor.start()
+    executor.stop()
+
+    assert handled == ["FOLD"]
+
+
+def test_stale_actions_are_skipped(caplog):
+    now = [0.0]
+    handled = []
+    executor = ActionExecutor(
+        handler=handled.append, stale_after=0.5, clock=lambda: now[0]
+    )
+    executor.submit("FOLD")
+    now[0] = 1.0
+    executor.submit("BET")
+    executor.start()
+    executor.stop()
+
+    assert handled == ["BET"]
+    assert "dropped stale FOLD" in caplog.text
+
+
+def test_failing_action_does_not_stop_the_worker():
+    handled = []
+
+    def handler(action):
+        if action == "FOLD":
+            raise RuntimeError
+        handled.append(action)
+
+    executor = ActionExecutor(handler=handler)
+    executor.start()
+    executor.submit("FOLD")
+    executor.submit("BET")
+    executor.stop()
+
+    assert handled == ["BET"]
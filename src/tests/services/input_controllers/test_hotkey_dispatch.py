@@ -0,0 +1,106 @@
+import pytest
+
+from services.input_controllers.exceptions import (
+    DuplicateHotkeysError,
+    HotkeyConflictError,
+    InvalidHotkeyError,
+)
+from services.input_controllers.hotkey_dispatch import (
+    HotkeyDispatcher,
+    compile_hotkeys,
+    parse_chord,
+    parse_key,
+)
+
+CTRL, SHIFT = 0x11, 0x10
+F, G, K, MOUSE4 = parse_key("F"), parse_key("G"), parse_key("K"), parse_key("Mouse4")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_dispatcher(hotkeys: dict, clock=None) -> HotkeyDispatcher:
+    return HotkeyDispatcher(compile_hotkeys(hotkeys), clock=clock or FakeClock())
+
+
+def test_key_names_are_normalized():
+    assert parse_key("f") == parse_key("F") == 0x46
+    assert parse_key("Button.x1") == parse_key("mouse4") == 0x05
+    assert parse_key("F1") == 0x70
+    assert parse_chord("ctrl + f") == parse_chord("Control+F")
+    with pytest.raises(InvalidHotkeyError):
+        parse_key("F25")
+    with pytest.raises(InvalidHotkeyError):
+        parse_chord("Hyper+F")
+
+
+def test_modifier_chords():
+    dispatcher = make_dispatcher(
+        {"FOLD": "F", "BET": "Ctrl+F", "RAISE": "Shift+Mouse4"}
+    )
+
+    assert dispatcher.press(F) == "FOLD"
+    assert dispatcher.press(CTRL) is None
+    assert dispatcher.press(F) == "BET"
+    dispatcher.release(CTRL)
+    assert dispatcher.press(MOUSE4) is None
+    dispatcher.press(SHIFT)
+    assert dispatcher.press(MOUSE4) == "RAISE"
+
+
+def test_reset_forgets_modifiers_held():
+    dispatcher = make_dispatcher({"FOLD": "Mouse2", "BET": "Ctrl+F"})
+    dispatcher.press(CTRL)
+    assert dispatcher.press(parse_key("Mouse2")) is None
+
+    # the listener was stopped before ctrl was released
+    dispatcher.reset()
+    assert dispatcher.press(parse_key("Mouse2")) == "FOLD"
+
+
+def test_sequences():
+    clock = FakeClock()
+    dispatcher = make_dispatcher({"FOLD": "G, G", "BET": "Ctrl+K, F"}, clock=clock)
+
+    assert dispatcher.press(G) is None
+    assert dispatcher.press(G) == "FOLD"
+
+    dispatcher.press(CTRL)
+    assert dispatcher.press(K) is None
+    dispatcher.release(CTRL)
+    assert dispatcher.press(F) == "BET"
+
+    # a key outside the pending sequence starts over
+    dispatcher.press(G)
+    dispatcher.press(F)
+    assert dispatcher.press(G) is None
+    assert dispatcher.press(G) == "FOLD"
+
+    # the sequence expires
+    dispatcher.press(G)
+    clock.now += 5
+    assert dispatcher.press(G) is None
+
+
+@pytest.mark.parametrize(
+    "hotkeys",
+    [
+        {"FOLD": "F", "BET": "f"},
+        {"FOLD": "Button.x1", "BET": "Mouse4"},
+        {"FOLD": "G", "BET": "G, G"},
+    ],
+)
+def test_conflicts_are_detected_at_compile_time(hotkeys):
+    with pytest.raises(HotkeyConflictError):
+        compile_hotkeys(hotkeys)
+    with pytest.raises(DuplicateHotkeysError):
+        compile_hotkeys(hotkeys)
+
+
+def test_unbound_hotkeys_are_skipped():
+    assert compile_hotkeys({"FOLD": "", "BET": ""}) == {}
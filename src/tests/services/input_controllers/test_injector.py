@@ -0,0 +1,75 @@
+import pytest
+
+from services.input_controllers.fake_injector import (
+    FakePyAutoGui,
+    FakeUser32,
+    RecordingInjector,
+)
+from services.input_controllers.injector import (
+    InputStep,
+    PyAutoGuiInjector,
+    SendInputInjector,
+    build_click_sequence,
+    set_input_injector,
+)
+from services.input_controllers.mouse_controller import mouse_controller
+
+
+@pytest.fixture
+def injector():
+    injector = RecordingInjector(cursor=(5, 5))
+    set_input_injector(injector)
+    yield injector
+    set_input_injector(None)
+
+
+def test_click_sequence_is_sent_as_one_batch(injector):
+    mouse_controller.send(build_click_sequence((100, 200), (5, 5)))
+
+    assert injector.batches == [
+        [InputStep.move(100, 200), InputStep.left_click(), InputStep.move(5, 5)]
+    ]
+    assert injector.clicks == [(100, 200)]
+    assert injector.get_cursor_position() == (5, 5)
+
+
+def test_single_calls_go_through_the_injector(injector):
+    mouse_controller.move_to_coordinates(30, 40)
+    mouse_controller.left_click()
+
+    assert len(injector.batches) == 2
+    assert injector.clicks == [(30, 40)]
+    point = mouse_controller.get_mouse_coordinates()
+    assert (point.x, point.y) == (30, 40)
+
+
+def test_send_input_submits_the_sequence_in_one_call():
+    user32 = FakeUser32(cursor=(5, 5))
+    injector = SendInputInjector(user32=user32)
+
+    injector.send(build_click_sequence((100, 200), (5, 5)))
+
+    move = (
+        SendInputInjector.MOUSEEVENTF_MOVE
+        | SendInputInjector.MOUSEEVENTF_ABSOLUTE
+        | SendInputInjector.MOUSEEVENTF_VIRTUALDESK
+    )
+    assert user32.batches == [
+        [
+            move,
+            SendInputInjector.MOUSEEVENTF_LEFTDOWN,
+            SendInputInjector.MOUSEEVENTF_LEFTUP,
+            move,
+        ]
+    ]
+    assert injector.get_cursor_position() == (5, 5)
+
+
+def test_pyautogui_batch_pauses_once():
+    pyautogui = FakePyAutoGui(cursor=(5, 5))
+    injector = PyAutoGuiInjector(pyautogui_module=pyautogui)
+
+    injector.send(build_click_sequence((100, 200), (5, 5)))
+
+    assert (pyautogui.calls, pyautogui.pauses) == (3, 1)
+    assert pyautogui.clicks == [(100, 200)]
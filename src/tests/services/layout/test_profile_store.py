@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+import utils.configuration_parser as configuration_parser
+from services.layout import exceptions
+from services.layout.profile_store import LayoutProfileStore
+from utils.configuration_models import LayoutSlot
+from utils.configuration_parser import LayoutConfigurationParser, settings_writer
+
+
+def write_layout(path, table_configurations):
+    path.write_text(
+        json.dumps(
+            {
+                "layout_configuration": {
+                    "table_count": len(table_configurations),
+                    "table_configurations": table_configurations,
+                }
+            }
+        )
+    )
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    (tmp_path / "settings").mkdir()
+    monkeypatch.setattr(configuration_parser, "BASE_DIR", tmp_path)
+    write_layout(
+        tmp_path / "settings" / "layout_settings.json",
+        {"slot_1": {"top": 0, "left": 0}},
+    )
+    yield LayoutProfileStore(directory=tmp_path / "settings" / "layouts")
+    settings_writer.flush()
+
+
+def test_switching_profile_replaces_the_active_layout(store):
+    store.save_profile("cash")
+    write_layout(
+        store.directory / "mtt.json",
+        {"slot_1": {"top": 10, "left": 20}, "slot_2": {"top": 10, "left": 600}},
+    )
+    settings_writer.flush()
+    store.manifest_path.write_text(
+        json.dumps(
+            {
+                "layout_profiles": {
+                    "active": "cash",
+                    "profiles": {"cash": "cash.json", "mtt": "mtt.json"},
+                }
+            }
+        )
+    )
+
+    profile = store.switch_profile("mtt")
+
+    assert store.active_profile == "mtt"
+    assert profile.table_count == 2
+    layout_settings = LayoutConfigurationParser.read_settings()
+    assert layout_settings.table_configurations["slot_2"] == LayoutSlot(
+        top=10, left=600
+    )
+
+    store.switch_profile("cash")
+    assert LayoutConfigurationParser.read_settings().table_count == 1
+
+
+def test_unknown_and_deleted_profiles_are_rejected(store):
+    store.save_profile("cash")
+    store.delete_profile("cash")
+
+    assert store.profile_names == []
+    assert store.active_profile is None
+    with pytest.raises(exceptions.UnknownLayoutProfile):
+        store.switch_profile("cash")
+
+
+def test_profile_with_a_deleted_file_is_unknown(store):
+    store.save_profile("cash")
+    settings_writer.flush()
+    (store.directory / "cash.json").unlink()
+
+    with pytest.raises(exceptions.UnknownLayoutProfile):
+        store.get_profile("cash")
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["", " ", "..", "../cash", "layouts/cash", "..\\cash", "C:cash", "manifest?"],
+)
+def test_invalid_profile_names_are_rejected(store, name):
+    with pytest.raises(exceptions.InvalidLayoutProfileName):
+        store.save_profile(name)
+
+    assert not store.directory.exists()
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from services.tables.entities import AppName
+from services.tables.table_manager import TableManager
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindowBackend
+from utils.configuration_models import LayoutSlot
+
+SEARCH_STRING = "Test Table"
+TABLE_WIDTH = 516
+TABLE_HEIGHT = 679
+SLOTS_PER_ROW = 4
+
+
+def build_layout(table_count: int) -> dict[str, LayoutSlot]:
+    return {
+        f"slot_{index + 1}": LayoutSlot(
+            top=(index // SLOTS_PER_ROW) * TABLE_HEIGHT,
+            left=(index % SLOTS_PER_ROW) * TABLE_WIDTH,
+        )
+        for index in range(table_count)
+    }
+
+
+def open_table(backend: FakeWindowBackend, number: int, left: int, top: int):
+    return backend.open_window(
+        title=f"{SEARCH_STRING} {number} - {AppName.CHROME.value}",
+        left=left,
+        top=top,
+        width=TABLE_WIDTH,
+        height=TABLE_HEIGHT,
+    )
+
+
+def build_table_manager(slot_count: int, backend: FakeWindowBackend) -> TableManager:
+    """
+    creates a TableManager with slot_count slots whose windows live in the fake
+    backend. the manager is a separate instance, the TableManager singleton used
+    by the application is left untouched.
+    """
+    set_window_backend(backend)
+    table_manager = object.__new__(TableManager)
+    table_manager.__init__(
+        table_layout_manager=SimpleNamespace(
+            table_configurations=build_layout(slot_count)
+        ),
+        table_configuration=SimpleNamespace(
+            search_string=SEARCH_STRING,
+            width=TABLE_WIDTH,
+            height=TABLE_HEIGHT,
+            top=0,
+            left=0,
+            button_coordinates={},
+        ),
+    )
+    return table_manager
@@ -0,0 +1,75 @@
+import itertools
+import random
+
+import pytest
+
+from services.tables.assignment import solve_assignment
+
+
+def brute_force_cost(cost_matrix: list[list[float]]) -> float:
+    rows, columns = len(cost_matrix), len(cost_matrix[0])
+    if rows <= columns:
+        return min(
+            sum(cost_matrix[row][column] for row, column in enumerate(permutation))
+            for permutation in itertools.permutations(range(columns), rows)
+        )
+    return min(
+        sum(cost_matrix[row][column] for column, row in enumerate(permutation))
+        for permutation in itertools.permutations(range(rows), columns)
+    )
+
+
+def assignment_cost(cost_matrix, pairs) -> float:
+    return sum(cost_matrix[row][column] for row, column in pairs)
+
+
+def test_empty_matrix():
+    assert solve_assignment([]) == []
+    assert solve_assignment([[]]) == []
+
+
+def test_square_matrix():
+    cost_matrix = [
+        [4, 1, 3],
+        [2, 0, 5],
+        [3, 2, 2],
+    ]
+
+    pairs = solve_assignment(cost_matrix)
+
+    assert pairs == [(0, 1), (1, 0), (2, 2)]
+
+
+def test_greedy_is_not_optimal():
+    # greedy row by row would take (0, 0) and force (1, 1) for a total of 101
+    cost_matrix = [
+        [1, 2],
+        [2, 100],
+    ]
+
+    assert assignment_cost(cost_matrix, solve_assignment(cost_matrix)) == 4
+
+
+def test_equal_costs_are_all_assigned():
+    cost_matrix = [[5.0] * 4 for _ in range(4)]
+
+    pairs = solve_assignment(cost_matrix)
+
+    assert sorted(row for row, _ in pairs) == [0, 1, 2, 3]
+    assert sorted(column for _, column in pairs) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("rows, columns", [(3, 3), (2, 5), (5, 2), (6, 6), (4, 7)])
+def test_matches_brute_force(rows, columns):
+    rng = random.Random(rows * 100 + columns)
+    for _ in range(20):
+        cost_matrix = [
+            [rng.randint(0, 50) for _ in range(columns)] for _ in range(rows)
+        ]
+
+        pairs = solve_assignment(cost_matrix)
+
+        assert len(pairs) == min(rows, columns)
+        assert len({row for row, _ in pairs}) == len(pairs)
+        assert len({column for _, column in pairs}) == len(pairs)
+        assert assignment_cost(cost_matrix, pairs) == brute_force_cost(cost_matrix)
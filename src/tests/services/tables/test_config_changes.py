@@ -0,0 +1,140 @@
+import json
+
+import pytest
+
+import utils.configuration_parser as configuration_parser
+from services.tables.config_changes import ConfigChange, ConfigChangeType
+from services.tables.events import EventType
+from services.tables.table_config import TableConfiguration
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindowBackend
+from tests.services.tables.helpers import (
+    SEARCH_STRING,
+    TABLE_HEIGHT,
+    TABLE_WIDTH,
+    build_table_manager,
+    open_table,
+)
+from utils.configuration_models import LayoutSlot
+from utils.configuration_parser import TableConfigurationParser
+
+
+@pytest.fixture
+def manager():
+    backend = FakeWindowBackend()
+    manager = build_table_manager(2, backend)
+    for number in (1, 2, 3):
+        open_table(backend, number, left=0, top=0)
+    manager.initialize_tracked_windows()
+    manager.arrange_layout_on_start()
+    yield manager, backend
+    set_window_backend(None)
+
+
+def test_unchanged_settings_have_no_changes(manager):
+    manager, _ = manager
+    assert manager.get_config_changes() == []
+
+
+def test_slot_layout_change_only_touches_affected_slots(manager):
+    manager, backend = manager
+    layout = manager.table_layout_manager.table_configurations
+    untouched_window = manager.slot_manager.slots["slot_2"].window
+    layout["slot_1"] = LayoutSlot(top=100, left=2000)
+    layout["slot_3"] = LayoutSlot(top=800, left=0)
+    backend.reset_call_counts()
+
+    changes = manager.get_config_changes()
+    assert changes == [ConfigChange(ConfigChangeType.SLOT_LAYOUT, ("slot_1", "slot_3"))]
+
+    assert manager.handle_config_changes() == changes
+    slots = manager.slot_manager.slots
+    assert list(slots) == ["slot_1", "slot_2", "slot_3"]
+    assert (slots["slot_1"].window.left, slots["slot_1"].window.top) == (2000, 100)
+    assert slots["slot_2"].window is untouched_window
+    # the unallocated third table fills the new slot
+    assert slots["slot_3"].window is backend.windows[3]
+    assert manager.slot_manager.get_slot_num_at(x=2100, y=200) == "slot_1"
+    assert manager.get_config_changes() == []
+
+
+def test_slot_added_after_changes_were_detected(manager):
+    manager, backend = manager
+    layout = manager.table_layout_manager.table_configurations
+    layout["slot_1"] = LayoutSlot(top=100, left=2000)
+    assert manager.get_config_changes() == [
+        ConfigChange(ConfigChangeType.SLOT_LAYOUT, ("slot_1",))
+    ]
+    # settings change again before the gui thread applies the first change
+    layout["slot_3"] = LayoutSlot(top=800, left=0)
+
+    manager.handle_config_changes()
+
+    assert list(manager.slot_manager.slots) == ["slot_1", "slot_2", "slot_3"]
+    assert manager.slot_manager.slots["slot_3"].window is backend.windows[3]
+    assert manager.get_config_changes() == []
+
+
+def test_removed_slot_releases_its_window(manager):
+    manager, _ = manager
+    window = manager.slot_manager.slots["slot_2"].window
+    del manager.table_layout_manager.table_configurations["slot_2"]
+
+    manager.handle_config_changes()
+
+    assert list(manager.slot_manager.slots) == ["slot_1"]
+    assert not manager.slot_manager.is_window_allocated(window)
+    assert not manager.tracked_windows.is_allocated(window)
+
+
+def test_table_size_change_resizes_windows(manager):
+    manager, backend = manager
+    manager.table_configuration.width = 400
+    manager.table_configuration.height = 500
+
+    manager.handle_config_changes()
+
+    for slot in manager.slot_manager.slots.values():
+        assert (slot.window.width, slot.window.height) == (400, 500)
+    assert (backend.windows[3].width, backend.windows[3].height) != (400, 500)
+
+
+@pytest.mark.parametrize(
+    "table_settings",
+    ['{"table_configuration": {"table_height": "100"}}', '{"table_configuration": {'],
+)
+def test_invalid_settings_keep_the_tracker_running(
+    tmp_path, monkeypatch, table_settings
+):
+    (tmp_path / "settings").mkdir()
+    settings_path = tmp_path / "settings" / "table_settings.json"
+    settings_path.write_text(
+        json.dumps(
+            {
+                "table_configuration": {
+                    "table_height": TABLE_HEIGHT,
+                    "table_width": TABLE_WIDTH,
+                    "search_string": SEARCH_STRING,
+                }
+            }
+        )
+    )
+    monkeypatch.setattr(configuration_parser, "BASE_DIR", tmp_path)
+    backend = FakeWindowBackend()
+    manager = build_table_manager(2, backend)
+    manager.table_configuration = object.__new__(TableConfiguration)
+    manager.table_configuration.__init__(TableConfigurationParser)
+    window = open_table(backend, 1, left=0, top=0)
+    manager.initialize_tracked_windows()
+    manager.arrange_layout_on_start()
+    snapshot = manager.config_snapshot
+
+    settings_path.write_text(table_settings)
+    new_window = open_table(backend, 2, left=0, top=0)
+
+    assert manager.get_config_changes() == []
+    assert manager.get_event() == [(EventType.NEW_WINDOW, new_window)]
+    assert manager.handle_config_changes() == []
+    assert manager.config_snapshot == snapshot
+    assert manager.slot_manager.slots["slot_1"].window is window
+    set_window_backend(None)
@@ -0,0 +1,60 @@
+import math
+
+import pytest
+
+from services.tables.distance_engine import SlotDistanceEngine
+from services.tables.entities import Slot
+
+
+@pytest.fixture
+def slots():
+    return {
+        "slot_1": Slot(top=0, left=0, height=100, width=200),
+        "slot_2": Slot(top=0, left=200, height=100, width=200),
+        "slot_3": Slot(top=100, left=0, height=100, width=200),
+    }
+
+
+def test_distance_matrix(slots):
+    engine = SlotDistanceEngine(slots)
+    points = [(50, 100), (150, 300)]
+
+    distances = engine.distance_matrix(points)
+
+    assert distances.shape == (3, 2)
+    for slot_index, slot in enumerate(slots.values()):
+        for point_index, point in enumerate(points):
+            center_y, center_x = slot.slot_center_coordinates
+            assert distances[slot_index, point_index] == pytest.approx(
+                math.hypot(center_y - point[0], center_x - point[1])
+            )
+    assert distances[0, 0] == 0
+
+
+def test_nearest(slots):
+    engine = SlotDistanceEngine(slots)
+
+    assert engine.nearest([(40, 90), (60, 310), (160, 10)]) == [
+        "slot_1",
+        "slot_2",
+        "slot_3",
+    ]
+
+
+def test_nearest_empty(slots):
+    engine = SlotDistanceEngine(slots)
+    points = [(40, 90), (160, 10)]
+
+    assert engine.nearest_empty(points, [False, True, True]) == ["slot_3", "slot_3"]
+    # every slot taken
+    assert engine.nearest_empty(points, [False, False, False]) == [None, None]
+
+
+def test_empty_layout():
+    engine = SlotDistanceEngine({})
+    points = [(40, 90), (160, 10)]
+
+    assert len(engine) == 0
+    assert engine.distance_matrix(points).shape == (0, 2)
+    assert engine.nearest(points) == [None, None]
+    assert engine.nearest_empty(points, []) == [None, None]
@@ -0,0 +1,88 @@
+import pytest
+
+from services.input_controllers.entities import key_states
+from services.tables.drag_tracker import DragState
+from services.tables.events import EventType
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindowBackend
+from tests.services.tables.helpers import build_table_manager, open_table
+
+
+@pytest.fixture
+def manager():
+    backend = FakeWindowBackend()
+    manager = build_table_manager(2, backend)
+    open_table(backend, 1, left=0, top=0)
+    open_table(backend, 2, left=516, top=0)
+    manager.initialize_tracked_windows()
+    manager.arrange_layout_on_start()
+    key_states.left_button_pressed = False
+    yield manager, backend
+    key_states.left_button_pressed = False
+    set_window_backend(None)
+
+
+def test_drag_settles_once_on_release(manager):
+    manager, backend = manager
+    window = backend.windows[1]
+
+    key_states.left_button_pressed = True
+    states = []
+    for left in (50, 100, 150):
+        backend.drag_window(window, left, 20)
+        assert manager.get_event() == []
+        states.append(manager.drag_tracker.get_state(window))
+    assert states == [DragState.STARTED, DragState.IN_PROGRESS, DragState.IN_PROGRESS]
+
+    key_states.left_button_pressed = False
+    events = manager.get_event()
+    assert events == [(EventType.WINDOW_MOVED, window)]
+    assert not manager.drag_tracker.is_dragging
+
+    manager.handle_event(events)
+    assert (window.left, window.top) == (0, 0)
+    assert manager.get_event() == []
+
+
+def test_drag_settles_once_until_the_event_is_handled(manager):
+    manager, backend = manager
+    window = backend.windows[1]
+
+    key_states.left_button_pressed = True
+    backend.drag_window(window, 50, 20)
+    assert manager.get_event() == []
+
+    key_states.left_button_pressed = False
+    # the gui thread handles the event a few ticks later
+    events = manager.get_event()
+    assert manager.get_event() == []
+    assert manager.get_event() == []
+    assert events == [(EventType.WINDOW_MOVED, window)]
+    assert manager.drag_tracker.get_state(window) is DragState.SETTLED
+    assert not manager.drag_tracker.is_dragging
+
+    manager.handle_event(events)
+    assert manager.get_event() == []
+    assert manager.drag_tracker.get_state(window) is None
+
+    # a new drag of the same window settles again
+    key_states.left_button_pressed = True
+    backend.drag_window(window, 80, 20)
+    assert manager.get_event() == []
+    key_states.left_button_pressed = False
+    assert manager.get_event() == [(EventType.WINDOW_MOVED, window)]
+
+
+def test_drag_across_slots_swaps_on_release(manager):
+    manager, backend = manager
+    first, second = backend.windows[1], backend.windows[2]
+
+    key_states.left_button_pressed = True
+    for left in (200, 400, 600):
+        backend.drag_window(first, left, 0)
+        assert manager.get_event() == []
+
+    key_states.left_button_pressed = False
+    manager.handle_event(manager.get_event())
+    assert manager.slot_manager.slots["slot_1"].window is second
+    assert manager.slot_manager.slots["slot_2"].window is first
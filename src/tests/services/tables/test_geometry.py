@@ -0,0 +1,53 @@
+import pytest
+
+from services.tables.geometry import WindowGeometryCache
+from services.windows.backend import set_window_backend
+from services.windows.entities import WindowGeometry
+from services.windows.fake_backend import FakeWindowBackend
+
+
+@pytest.fixture
+def backend():
+    backend = FakeWindowBackend()
+    set_window_backend(backend)
+    yield backend
+    set_window_backend(None)
+
+
+def test_refresh_reads_each_window_once(backend):
+    first = backend.open_window("", 10, 20, 100, 200)
+    second = backend.open_window("", 300, 0, 100, 200)
+    cache = WindowGeometryCache()
+    backend.reset_call_counts()
+
+    cache.refresh([first, second])
+    for _ in range(3):
+        assert cache.get(first).position == (10, 20)
+        assert cache.get(second).position == (300, 0)
+
+    assert backend.call_counts["get_geometry"] == 2
+
+
+def test_refresh_forgets_other_windows(backend):
+    first = backend.open_window("", 10, 20, 100, 200)
+    second = backend.open_window("", 300, 0, 100, 200)
+    cache = WindowGeometryCache()
+    cache.refresh([first, second])
+
+    backend.drag_window(first, 50, 60)
+    cache.refresh([first])
+
+    assert cache.get(first).position == (50, 60)
+    assert cache.get(second) is None
+
+
+def test_set_overrides_until_next_refresh(backend):
+    window = backend.open_window("", 10, 20, 100, 200)
+    cache = WindowGeometryCache()
+    cache.refresh([window])
+
+    cache.set(window, WindowGeometry(left=0, top=0, width=100, height=200))
+    assert cache.get(window).position == (0, 0)
+
+    cache.refresh([window])
+    assert cache.get(window).position == (10, 20)
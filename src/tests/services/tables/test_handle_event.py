@@ -0,0 +1,89 @@
+import pytest
+
+from services.input_controllers.entities import key_states
+from services.tables.events import EventType
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindowBackend
+from tests.services.tables.helpers import build_layout, build_table_manager, open_table
+
+
+@pytest.fixture
+def backend():
+    key_states.left_button_pressed = False
+    backend = FakeWindowBackend()
+    yield backend
+    set_window_backend(None)
+
+
+def start(backend: FakeWindowBackend, slot_count: int):
+    manager = build_table_manager(slot_count, backend)
+    manager.initialize_tracked_windows()
+    manager.arrange_layout_on_start()
+    return manager
+
+
+def get_layout(manager) -> dict[str, int | None]:
+    return {
+        slot_num: slot.window._hWnd if slot.window else None
+        for slot_num, slot in manager.slot_manager.slots.items()
+    }
+
+
+def test_burst_of_new_windows_in_one_tick(backend):
+    manager = start(backend, 10)
+    # opened in reverse slot order, each a little off its slot
+    layout = build_layout(10)
+    windows = {
+        slot_num: open_table(backend, number, left=slot.left + 30, top=slot.top + 20)
+        for number, (slot_num, slot) in reversed(list(enumerate(layout.items(), 1)))
+    }
+
+    events = manager.get_event()
+    assert len(events) == 10
+    assert {event_type for event_type, _ in events} == {EventType.NEW_WINDOW}
+    manager.handle_event(events)
+
+    for slot_num, window in windows.items():
+        assert manager.slot_manager.slots[slot_num].window is window
+        assert manager.tracked_windows.is_allocated(window)
+        assert (window.left, window.top) == (
+            layout[slot_num].left,
+            layout[slot_num].top,
+        )
+    assert manager.get_event() == []
+
+
+def test_new_windows_are_assigned_in_one_pass(backend):
+    manager = start(backend, 2)
+    # closest to slot_2 but the other window can only reasonably go there
+    open_table(backend, 1, left=300, top=0)
+    open_table(backend, 2, left=700, top=0)
+
+    manager.handle_event(manager.get_event())
+
+    assert get_layout(manager) == {"slot_1": 1, "slot_2": 2}
+
+
+def test_terminated_and_new_windows_in_one_tick(backend):
+    for number, left in ((1, 0), (2, 516), (3, 2000)):
+        open_table(backend, number, left=left, top=0)
+    manager = start(backend, 2)
+    assert get_layout(manager) == {"slot_1": 1, "slot_2": 2}
+    assert not manager.tracked_windows.is_allocated(backend.windows[3])
+
+    backend.close_window(backend.windows[1])
+    backend.close_window(backend.windows[2])
+    open_table(backend, 4, left=530, top=10)
+    events = manager.get_event()
+    assert sorted((event_type.name, window._hWnd) for event_type, window in events) == [
+        ("NEW_WINDOW", 4),
+        ("WINDOW_TERMINATED", 1),
+        ("WINDOW_TERMINATED", 2),
+    ]
+    manager.handle_event(events)
+
+    # the new window takes the slot it was opened on, the waiting window the other
+    assert get_layout(manager) == {"slot_1": 3, "slot_2": 4}
+    assert manager.tracked_windows.is_allocated(backend.windows[3])
+    assert manager.tracked_windows.is_allocated(backend.windows[4])
+    assert manager.get_event() == []
@@ -0,0 +1,52 @@
+from services.tables.entities import Slot
+from services.tables.layout_planner import LayoutOperation, plan_layout
+from services.windows.entities import WindowGeometry
+from services.windows.fake_backend import FakeWindow
+
+SLOTS = {
+    "slot_1": Slot(top=0, left=0, height=100, width=100),
+    "slot_2": Slot(top=0, left=200, height=100, width=100),
+}
+
+
+def plan(assignment):
+    return plan_layout(assignment, SLOTS, get_geometry=lambda window: window.geometry)
+
+
+def test_windows_in_place_are_not_touched():
+    first = FakeWindow(1, "", 0, 0, 100, 100)
+    second = FakeWindow(2, "", 200, 0, 100, 100)
+
+    assert plan({"slot_1": first, "slot_2": second, "slot_3": None}) == []
+
+
+def test_swap_moves_without_resizing():
+    first = FakeWindow(1, "", 0, 0, 100, 100)
+    second = FakeWindow(2, "", 200, 0, 100, 100)
+
+    assert plan({"slot_1": second, "slot_2": first}) == [
+        LayoutOperation(
+            second, WindowGeometry(0, 0, 100, 100), move=True, resize=False
+        ),
+        LayoutOperation(
+            first, WindowGeometry(200, 0, 100, 100), move=True, resize=False
+        ),
+    ]
+
+
+def test_resized_window_in_place_is_only_resized():
+    window = FakeWindow(1, "", 0, 0, 80, 100)
+
+    assert plan({"slot_1": window}) == [
+        LayoutOperation(window, WindowGeometry(0, 0, 100, 100), move=False, resize=True)
+    ]
+
+
+def test_unknown_geometry_is_moved_and_resized():
+    window = FakeWindow(1, "", 0, 0, 100, 100)
+
+    operations = plan_layout({"slot_1": window}, SLOTS, get_geometry=lambda _: None)
+
+    assert operations == [
+        LayoutOperation(window, WindowGeometry(0, 0, 100, 100), move=True, resize=True)
+    ]
@@ -0,0 +1,201 @@
+import pytest
+
+from services.tables import exceptions
+from services.tables.entities import Slot
+from services.tables.table_manager import SlotManager
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindow, FakeWindowBackend
+
+TABLE_WIDTH = 100
+TABLE_HEIGHT = 100
+
+
+def make_window(handle: int, center: tuple[int, int] = (0, 0)) -> FakeWindow:
+    window = FakeWindow(handle, "", 0, 0, TABLE_WIDTH, TABLE_HEIGHT)
+    move_center(window, center)
+    return window
+
+
+def move_center(window: FakeWindow, center: tuple[int, int]):
+    center_y, center_x = center
+    window.left = int(center_x) - window.width // 2
+    window.top = int(center_y) - window.height // 2
+
+
+def assert_index_consistent(slot_manager: SlotManager):
+    """
+    every occupied slot is indexed by its window handle and nothing else is indexed
+    """
+    occupied = {
+        slot.window._hWnd: slot_num
+        for slot_num, slot in slot_manager.slots.items()
+        if slot.window is not None
+    }
+    assert slot_manager._window_slots == occupied
+    for handle, slot_num in occupied.items():
+        window = slot_manager.slots[slot_num].window
+        assert slot_manager.get_slot_num_from_window(window) == slot_num
+        assert slot_manager.get_slot_from_window(window) is slot_manager.slots[slot_num]
+
+
+@pytest.fixture(autouse=True)
+def fake_backend():
+    backend = FakeWindowBackend()
+    set_window_backend(backend)
+    yield backend
+    set_window_backend(None)
+
+
+@pytest.fixture
+def slot_manager():
+    slot_manager = SlotManager()
+    slot_manager.slots = {
+        "slot_1": Slot(top=0, left=0, height=TABLE_HEIGHT, width=TABLE_WIDTH),
+        "slot_2": Slot(top=0, left=200, height=TABLE_HEIGHT, width=TABLE_WIDTH),
+        "slot_3": Slot(top=0, left=400, height=TABLE_HEIGHT, width=TABLE_WIDTH),
+    }
+    return slot_manager
+
+
+def test_allocate_and_deallocate_keep_index(slot_manager):
+    window = make_window(1)
+
+    slot_manager.allocate_window_to_slot("slot_2", window)
+    assert_index_consistent(slot_manager)
+    assert slot_manager.is_window_allocated(window)
+
+    assert slot_manager.deallocate_window_from_slot("slot_2") is window
+    assert_index_consistent(slot_manager)
+    assert not slot_manager.is_window_allocated(window)
+    assert slot_manager.get_slot_from_window(window) is None
+
+
+def test_failed_allocation_does_not_touch_index(slot_manager):
+    slot_manager.allocate_window_to_slot("slot_1", make_window(1))
+
+    with pytest.raises(exceptions.SlotAlreadyOccupied):
+        slot_manager.allocate_window_to_slot("slot_1", make_window(2))
+    with pytest.raises(exceptions.InvalidSlotNum):
+        slot_manager.allocate_window_to_slot("slot_9", make_window(3))
+
+    assert_index_consistent(slot_manager)
+    assert slot_manager.allocated_windows == [slot_manager.slots["slot_1"].window]
+
+
+def test_remove_window_from_slot(slot_manager):
+    window = make_window(1)
+    slot_manager.allocate_window_to_slot("slot_3", window)
+
+    slot_manager.remove_window_from_slot(window)
+    slot_manager.remove_window_from_slot(window)  # no-op once removed
+
+    assert slot_manager.slots["slot_3"].window is None
+    assert_index_consistent(slot_manager)
+
+
+def test_swap_with_occupied_slot(slot_manager):
+    first, second = make_window(1), make_window(2)
+    slot_manager.allocate_window_to_slot("slot_1", first)
+    slot_manager.allocate_window_to_slot("slot_3", second)
+
+    # drag the first window over slot_3
+    move_center(first, slot_manager.get_center_for_slot("slot_3"))
+    slot_manager.assign_window_to_closest_slot(first)
+
+    assert slot_manager.get_slot_num_from_window(first) == "slot_3"
+    assert slot_manager.get_slot_num_from_window(second) == "slot_1"
+    assert_index_consistent(slot_manager)
+
+
+def test_move_to_empty_slot(slot_manager):
+    window = make_window(1)
+    slot_manager.allocate_window_to_slot("slot_1", window)
+
+    move_center(window, slot_manager.get_center_for_slot("slot_2"))
+    slot_manager.assign_window_to_closest_slot(window)
+
+    assert slot_manager.get_slot_num_from_window(window) == "slot_2"
+    assert slot_manager.slots["slot_1"].window is None
+    assert_index_consistent(slot_manager)
+
+
+def test_slots_setter_rebuilds_index(slot_manager):
+    window = make_window(1)
+    slot_manager.allocate_window_to_slot("slot_1", window)
+
+    slot_manager.slots = {
+        "slot_1": Slot(top=0, left=0, height=TABLE_HEIGHT, width=TABLE_WIDTH),
+        "slot_2": Slot(
+            top=0, left=200, height=TABLE_HEIGHT, width=TABLE_WIDTH, window=window
+        ),
+    }
+
+    assert slot_manager.get_slot_num_from_window(window) == "slot_2"
+    assert_index_consistent(slot_manager)
+
+
+def test_assign_windows_to_slots_minimizes_total_distance(slot_manager):
+    slot_centers = {
+        slot_num: slot_manager.get_center_for_slot(slot_num)
+        for slot_num in slot_manager.slots
+    }
+    # two windows sit exactly between slot_1 and slot_2, one right on slot_3,
+    # and one far away that should be left unallocated
+    between = (slot_centers["slot_1"][0], 100)
+    windows = [
+        make_window(1, between),
+        make_window(2, between),
+        make_window(3, slot_centers["slot_3"]),
+        make_window(4, (5000, 5000)),
+    ]
+
+    assigned = slot_manager.assign_windows_to_slots(windows)
+
+    assert {window._hWnd for window in assigned.values()} == {1, 2, 3}
+    assert assigned["slot_3"] is windows[2]
+    assert not slot_manager.is_window_allocated(windows[3])
+    assert_index_consistent(slot_manager)
+
+
+def test_swap_only_moves_the_two_windows(slot_manager, fake_backend):
+    first = fake_backend.open_window("", 0, 0, TABLE_WIDTH, TABLE_HEIGHT)
+    second = fake_backend.open_window("", 200, 0, TABLE_WIDTH, TABLE_HEIGHT)
+    third = fake_backend.open_window("", 400, 0, TABLE_WIDTH, TABLE_HEIGHT)
+    slot_manager.assign_windows_to_slots([first, second, third])
+    assert fake_backend.call_counts["move_window"] == 0
+    assert fake_backend.call_counts["resize_window"] == 0
+
+    move_center(first, (60, 240))
+    slot_manager.assign_window_to_closest_slot(first)
+
+    assert slot_manager.slots["slot_1"].window is second
+    assert slot_manager.slots["slot_2"].window is first
+    assert fake_backend.call_counts["move_window"] == 2
+    assert fake_backend.call_counts["resize_window"] == 0
+    assert_index_consistent(slot_manager)
+
+
+def test_allocated_slot_at_cursor(slot_manager):
+    window = make_window(1)
+    slot_manager.allocate_window_to_slot("slot_2", window)
+
+    assert slot_manager.get_allocated_slot_num_at(x=250, y=50) == "slot_2"
+    # empty slot and a point outside every slot
+    assert slot_manager.get_allocated_slot_num_at(x=50, y=50) is None
+    assert slot_manager.get_allocated_slot_num_at(x=150, y=50) is None
+
+
+def test_no_allocated_slot_at_cursor_where_slots_overlap(slot_manager):
+    slot_manager.slots = {
+        "slot_1": Slot(top=0, left=0, height=TABLE_HEIGHT, width=TABLE_WIDTH),
+        "slot_2": Slot(top=0, left=60, height=TABLE_HEIGHT, width=TABLE_WIDTH),
+    }
+    slot_manager.allocate_window_to_slot("slot_1", make_window(1))
+
+    # only one of the overlapping slots holds a window
+    assert slot_manager.get_allocated_slot_num_at(x=80, y=50) == "slot_1"
+
+    slot_manager.allocate_window_to_slot("slot_2", make_window(2))
+    assert slot_manager.get_allocated_slot_num_at(x=80, y=50) is None
+    assert slot_manager.get_allocated_slot_num_at(x=30, y=50) == "slot_1"
+    assert slot_manager.get_allocated_slot_num_at(x=140, y=50) == "slot_2"
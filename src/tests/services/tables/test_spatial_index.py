@@ -0,0 +1,119 @@
+import math
+import random
+
+import pytest
+
+from services.tables import spatial_index
+from services.tables.entities import Slot
+from services.tables.spatial_index import MIN_CELL_SIZE, SlotSpatialIndex
+
+
+def build_slots(rng: random.Random, slot_count: int) -> dict[str, Slot]:
+    return {
+        f"slot_{index + 1}": Slot(
+            top=rng.randint(0, 2000),
+            left=rng.randint(0, 4000),
+            height=rng.randint(200, 700),
+            width=rng.randint(200, 600),
+        )
+        for index in range(slot_count)
+    }
+
+
+def brute_force_nearest(slots, point, is_candidate=lambda slot_num: True):
+    candidates = [slot_num for slot_num in slots if is_candidate(slot_num)]
+    return min(
+        candidates,
+        key=lambda slot_num: math.hypot(
+            slots[slot_num].slot_center_coordinates[0] - point[0],
+            slots[slot_num].slot_center_coordinates[1] - point[1],
+        ),
+        default=None,
+    )
+
+
+def test_slot_center_is_inside_the_slot():
+    slots = {
+        "slot_1": Slot(top=0, left=0, height=100, width=200),
+        "slot_2": Slot(top=100, left=0, height=100, width=200),
+    }
+    index = SlotSpatialIndex(slots)
+
+    assert slots["slot_2"].slot_center_coordinates == (150, 100)
+    # near the bottom edge of slot_1, still closer to its center than to slot_2's
+    assert index.nearest((90, 100)) == "slot_1"
+    assert index.nearest((110, 100)) == "slot_2"
+
+
+@pytest.mark.parametrize("linear_scan_max_slots", [0, 32])
+def test_small_layout_matches_brute_force(monkeypatch, linear_scan_max_slots):
+    monkeypatch.setattr(spatial_index, "LINEAR_SCAN_MAX_SLOTS", linear_scan_max_slots)
+    rng = random.Random(4)
+    slots = build_slots(rng, 4)
+    slots["slot_2"].window = object()
+    index = SlotSpatialIndex(slots)
+
+    for _ in range(200):
+        point = (rng.uniform(-3000, 5000), rng.uniform(-3000, 8000))
+        assert index.nearest(point) == brute_force_nearest(slots, point)
+        assert index.nearest_empty(point) == brute_force_nearest(
+            slots, point, lambda slot_num: slots[slot_num].window is None
+        )
+
+
+def test_default_cell_size_has_a_floor():
+    slots = {"slot_1": Slot(top=0, left=0, height=0, width=0)}
+
+    assert SlotSpatialIndex({}).cell_size == MIN_CELL_SIZE
+    assert SlotSpatialIndex(slots).cell_size == MIN_CELL_SIZE
+    assert SlotSpatialIndex(slots).nearest((5000, 5000)) == "slot_1"
+
+
+def test_empty_index():
+    index = SlotSpatialIndex({})
+
+    assert index.nearest((10, 10)) is None
+    assert index.slot_at(x=10, y=10) is None
+
+
+@pytest.mark.parametrize("slot_count", [1, 4, 30, 200])
+def test_nearest_matches_brute_force(slot_count):
+    rng = random.Random(slot_count)
+    slots = build_slots(rng, slot_count)
+    index = SlotSpatialIndex(slots)
+
+    for _ in range(200):
+        point = (rng.uniform(-3000, 5000), rng.uniform(-3000, 8000))
+        assert index.nearest(point) == brute_force_nearest(slots, point)
+
+
+def test_nearest_empty_skips_occupied_slots():
+    rng = random.Random(7)
+    slots = build_slots(rng, 50)
+    for slot_num in list(slots)[::2]:
+        slots[slot_num].window = object()
+    index = SlotSpatialIndex(slots)
+
+    for _ in range(100):
+        point = (rng.uniform(0, 3000), rng.uniform(0, 5000))
+        assert index.nearest_empty(point) == brute_force_nearest(
+            slots, point, lambda slot_num: slots[slot_num].window is None
+        )
+
+
+def test_slot_at():
+    slots = {
+        "slot_1": Slot(top=0, left=0, height=100, width=100),
+        "slot_2": Slot(top=0, left=150, height=100, width=100),
+        "slot_3": Slot(top=50, left=50, height=100, width=100),
+    }
+    index = SlotSpatialIndex(slots, cell_size=40)
+
+    assert index.slot_at(x=10, y=10) == "slot_1"
+    assert index.slot_at(x=200, y=20) == "slot_2"
+    assert index.slot_at(x=75, y=75) == "slot_1"  # overlapping, first in order
+    assert index.slot_at(x=120, y=140) == "slot_3"
+    assert index.slot_at(x=125, y=20) is None
+    assert index.slot_at(x=-5, y=-5) is None
+    assert index.slots_at(x=75, y=75) == ["slot_1", "slot_3"]
+    assert index.slots_at(x=125, y=20) == []
@@ -0,0 +1,66 @@
+import pytest
+
+from services.input_controllers.entities import key_states
+from services.tables.trace import TraceReader, TraceReplayer
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindowBackend
+from tests.services.tables.helpers import build_table_manager, open_table
+
+
+@pytest.fixture
+def backend():
+    backend = FakeWindowBackend()
+    yield backend
+    set_window_backend(None)
+
+
+def get_layout(manager) -> dict[str, int]:
+    return {
+        slot_num: slot.window._hWnd
+        for slot_num, slot in manager.slot_manager.slots.items()
+        if slot.window
+    }
+
+
+def test_recorded_trace_replays_to_the_same_layout(backend, tmp_path):
+    key_states.left_button_pressed = False
+    path = tmp_path / "session.trace.gz"
+    manager = build_table_manager(4, backend)
+    open_table(backend, 1, left=900, top=900)
+    open_table(backend, 2, left=20, top=10)
+
+    manager.start_recording(path)
+    manager.initialize_tracked_windows()
+    manager.arrange_layout_on_start()
+    recorded_events = 0
+    for step in range(10):
+        if step == 2:
+            open_table(backend, 3, left=1200, top=100)
+        if step == 4:
+            backend.close_window(backend.windows[1])
+        # drag table 2 over slot 2, settling once the button is released
+        if step in (5, 6, 7):
+            key_states.left_button_pressed = True
+            backend.drag_window(backend.windows[2], 200 * (step - 4), 10)
+        if step == 8:
+            key_states.left_button_pressed = False
+        events = manager.get_event()
+        if events:
+            manager.handle_event(events)
+        recorded_events += len(events)
+    manager.stop_recording()
+    recorded = get_layout(manager)
+
+    reader = TraceReader(path)
+    assert [record[0] for record in reader.header["initial"]] == [1, 2]
+    assert sum(tick["n"] for tick in reader) == 10
+    assert [tick["b"] for tick in reader].count(1) == 3
+
+    replayer = TraceReplayer(path)
+    stats = replayer.replay()
+
+    assert replayer.table_manager is not manager
+    assert stats.ticks == 10
+    assert stats.events == recorded_events
+    assert get_layout(replayer.table_manager) == recorded
+    assert not key_states.left_button_pressed
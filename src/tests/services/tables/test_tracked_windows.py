@@ -0,0 +1,69 @@
+import pytest
+
+from services.tables.tracked_windows import TrackedWindows
+from services.windows.backend import set_window_backend
+from services.windows.fake_backend import FakeWindowBackend
+
+
+@pytest.fixture
+def backend():
+    backend = FakeWindowBackend()
+    set_window_backend(backend)
+    yield backend
+    set_window_backend(None)
+
+
+def open_windows(backend: FakeWindowBackend, count: int):
+    return [backend.open_window("", 0, 0, 100, 100) for _ in range(count)]
+
+
+def test_diff(backend):
+    first, second, third = open_windows(backend, 3)
+    tracked_windows = TrackedWindows([first, second])
+
+    new_windows, terminated_windows = tracked_windows.diff([second, third])
+
+    assert new_windows == [third]
+    assert terminated_windows == [first]
+    # diffing does not change the registry
+    assert list(tracked_windows) == [first, second]
+
+
+def test_allocated_flag(backend):
+    first, second = open_windows(backend, 2)
+    tracked_windows = TrackedWindows([first, second])
+
+    tracked_windows.set_allocated(first)
+    assert tracked_windows.is_allocated(first)
+    assert tracked_windows.get_unallocated_windows() == [second]
+    assert tracked_windows.get_unallocated_window() is second
+
+    tracked_windows.set_allocated(first, allocated=False)
+    assert tracked_windows.get_unallocated_windows() == [first, second]
+
+
+def test_remove(backend):
+    first, second = open_windows(backend, 2)
+    tracked_windows = TrackedWindows([first, second])
+    tracked_windows.set_allocated(first)
+
+    tracked_windows.remove(first)
+    tracked_windows.remove(first)  # no-op once removed
+    tracked_windows.set_allocated(first)  # ignored for untracked windows
+
+    assert first not in tracked_windows
+    assert not tracked_windows.is_allocated(first)
+    assert len(tracked_windows) == 1
+
+
+def test_iteration_tolerates_windows_added_meanwhile(backend):
+    windows = open_windows(backend, 4)
+    tracked_windows = TrackedWindows(windows[:2])
+
+    # the tracker thread adds a window while the gui thread iterates
+    for window in tracked_windows:
+        tracked_windows.add(windows[2])
+    for window in tracked_windows.get_unallocated_windows():
+        tracked_windows.add(windows[3])
+
+    assert len(tracked_windows) == 4
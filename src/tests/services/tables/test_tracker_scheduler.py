@@ -0,0 +1,49 @@
+import pytest
+
+from services.tables.tracker_scheduler import TrackerScheduler
+
+
+@pytest.fixture
+def scheduler():
+    clock = {"now": 0.0}
+
+    def sleep(seconds):
+        clock["now"] += seconds
+
+    return TrackerScheduler(
+        base_tick=0.05,
+        fast_tick=0.01,
+        idle_tick=0.4,
+        backoff_factor=2,
+        fast_period=1.0,
+        clock=lambda: clock["now"],
+        sleep=sleep,
+    )
+
+
+def test_backs_off_to_idle_tick(scheduler):
+    intervals = [
+        scheduler.wait(event_detected=False, is_dragging=False) for _ in range(6)
+    ]
+
+    assert intervals == [0.05, 0.1, 0.2, 0.4, 0.4, 0.4]
+
+
+def test_polls_fast_while_dragging(scheduler):
+    for _ in range(5):
+        scheduler.wait(event_detected=False, is_dragging=False)
+
+    assert scheduler.wait(event_detected=False, is_dragging=True) == 0.01
+    # backoff restarts from the base tick once the drag is over
+    assert scheduler.wait(event_detected=False, is_dragging=False) == 0.05
+
+
+def test_polls_fast_after_event(scheduler):
+    assert scheduler.wait(event_detected=True, is_dragging=False) == 0.01
+
+    fast_intervals = []
+    while (interval := scheduler.wait(False, False)) == 0.01:
+        fast_intervals.append(interval)
+
+    assert sum(fast_intervals) == pytest.approx(1.0, abs=0.011)
+    assert interval == 0.05
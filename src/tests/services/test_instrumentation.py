@@ -0,0 +1,48 @@
+import json
+import threading
+
+from services.instrumentation import Instrumentation, LatencyHistogram
+
+
+def test_histogram_percentiles_use_bucket_upper_bounds():
+    histogram = LatencyHistogram()
+    for duration_ns in [100] * 90 + [5_000] * 9 + [1_000_000]:
+        histogram.record(duration_ns)
+
+    assert histogram.count == 100
+    assert histogram.percentile(0.5) == 128
+    assert histogram.percentile(0.95) == 8192
+    assert histogram.percentile(1.0) == 1_000_000
+
+
+def test_disabled_instrumentation_records_nothing():
+    instrumentation = Instrumentation(enabled=False)
+
+    @instrumentation.timed("stage")
+    def work():
+        return 1
+
+    with instrumentation.measure("block"):
+        assert work() == 1
+    assert instrumentation.summary() == {}
+
+
+def test_threads_are_merged_on_dump(tmp_path):
+    instrumentation = Instrumentation(enabled=True, dump_path=tmp_path / "latency.json")
+
+    @instrumentation.timed("stage")
+    def work():
+        pass
+
+    threads = [
+        threading.Thread(target=lambda: [work() for _ in range(100)]) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    instrumentation.dump()
+
+    report = json.loads((tmp_path / "latency.json").read_text())
+    assert report["stages"]["stage"]["count"] == 400
+    assert sum(report["stages"]["stage"]["buckets"]) == 400
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+from utils.configuration_models import TableSettings
+from utils.configuration_parser import ConfigurationCache
+from utils.exceptions import InvalidConfigurationError
+
+
+def write_settings(path, settings, mtime_ns=None):
+    path.write_text(json.dumps(settings))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, monkeypatch):
+    path = tmp_path / "table_settings.json"
+    write_settings(path, {"table_configuration": {"top": 1}})
+    cache = ConfigurationCache()
+    loads = []
+    monkeypatch.setattr(json, "loads", lambda text: loads.append(text) or {"x": 1})
+
+    first = cache.read(path)
+    second = cache.read(path)
+
+    assert first is second
+    assert len(loads) == 1
+
+
+def test_changed_mtime_or_size_is_reparsed(tmp_path):
+    path = tmp_path / "table_settings.json"
+    write_settings(path, {"top": 1}, mtime_ns=1_000_000_000)
+    cache = ConfigurationCache()
+    assert cache.read(path) == {"top": 1}
+
+    write_settings(path, {"top": 2}, mtime_ns=2_000_000_000)
+    assert cache.read(path) == {"top": 2}
+
+    # same mtime, different size
+    write_settings(path, {"top": 300}, mtime_ns=2_000_000_000)
+    assert cache.read(path) == {"top": 300}
+
+
+def test_invalid_reload_keeps_the_previous_models(tmp_path, caplog):
+    path = tmp_path / "table_settings.json"
+    write_settings(
+        path, {"table_configuration": {"table_height": 679}}, mtime_ns=1_000_000_000
+    )
+    cache = ConfigurationCache()
+    settings = cache.read_model(path, "table_configuration", TableSettings)
+
+    write_settings(
+        path, {"table_configuration": {"table_height": "100"}}, mtime_ns=2_000_000_000
+    )
+    # validated when the file is re-parsed, not when the model is read
+    assert cache.read(path) == {"table_configuration": {"table_height": 679}}
+    assert cache.read_model(path, "table_configuration", TableSettings) is settings
+    assert cache.read_model(path, "table_configuration", TableSettings) is settings
+    assert len(caplog.records) == 1
+
+    path.write_text("{")
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+    assert cache.read_model(path, "table_configuration", TableSettings) is settings
+
+    write_settings(
+        path, {"table_configuration": {"table_height": 100}}, mtime_ns=4_000_000_000
+    )
+    assert (
+        cache.read_model(path, "table_configuration", TableSettings).table_height == 100
+    )
+
+
+def test_invalid_first_read_raises(tmp_path):
+    path = tmp_path / "table_settings.json"
+    write_settings(path, {"table_configuration": {"table_height": "100"}})
+
+    with pytest.raises(InvalidConfigurationError):
+        ConfigurationCache().read_model(path, "table_configuration", TableSettings)
@@ -0,0 +1,53 @@
+import pytest
+
+from utils.configuration_models import LayoutSettings, LayoutSlot, TableSettings
+from utils.exceptions import InvalidConfigurationError
+
+
+def test_table_settings_are_parsed_into_typed_values():
+    table_settings = TableSettings.from_dict(
+        {
+            "table_height": 679,
+            "table_width": 516,
+            "search_string": "Dummy Table",
+            "button_coordinates": {"FOLD": [146, 385]},
+        }
+    )
+
+    assert table_settings.top == 0
+    assert table_settings.button_coordinates["FOLD"] == (146, 385)
+    with pytest.raises(TypeError):
+        table_settings.button_coordinates["FOLD"] = (0, 0)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"table_width": "516"},
+        {"table_height": -1},
+        {"search_string": 0},
+        {"button_coordinates": {"FOLD": [146]}},
+    ],
+)
+def test_invalid_table_settings_are_rejected_at_load(data):
+    with pytest.raises(InvalidConfigurationError):
+        TableSettings.from_dict(data)
+
+
+def test_layout_settings_keep_slot_order():
+    layout_settings = LayoutSettings.from_dict(
+        {
+            "table_count": 2,
+            "table_configurations": {
+                "slot_2": {"top": 1, "left": 540},
+                "slot_1": {"top": 0, "left": 39},
+            },
+        }
+    )
+
+    assert list(layout_settings.table_configurations.items()) == [
+        ("slot_2", LayoutSlot(top=1, left=540)),
+        ("slot_1", LayoutSlot(top=0, left=39)),
+    ]
+    with pytest.raises(InvalidConfigurationError):
+        LayoutSettings.from_dict({"table_configurations": {"slot_1": {"top": "0"}}})
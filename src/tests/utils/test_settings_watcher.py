@@ -0,0 +1,25 @@
+import os
+
+from utils.settings_watcher import SettingsWatcher
+
+
+def test_poll_reports_changed_files_once_per_interval(tmp_path):
+    (tmp_path / "table_settings.json").write_text("{}")
+    (tmp_path / "layout_settings.json").write_text("{}")
+    now = [0.0]
+    watcher = SettingsWatcher(
+        directory=tmp_path, poll_interval=1.0, clock=lambda: now[0]
+    )
+
+    (tmp_path / "layout_settings.json").write_text('{"a": 1}')
+    assert watcher.poll() == set()  # throttled
+
+    now[0] = 1.0
+    assert watcher.poll() == {"layout_settings.json"}
+
+    now[0] = 2.0
+    assert watcher.poll() == set()
+
+    os.remove(tmp_path / "table_settings.json")
+    now[0] = 3.0
+    assert watcher.poll() == {"table_settings.json"}
@@ -0,0 +1,82 @@
+import json
+import os
+
+import pytest
+
+from utils.configuration_parser import ConfigurationCache, SettingsWriter
+
+
+@pytest.fixture
+def layout_settings_file(tmp_path):
+    path = tmp_path / "layout_settings.json"
+    path.write_text(
+        json.dumps(
+            {
+                "layout_configuration": {
+                    "table_count": 2,
+                    "table_configurations": {"slot_1": {"top": 5, "left": 6}},
+                }
+            }
+        )
+    )
+    return path
+
+
+def test_updates_are_merged_into_one_atomic_write(layout_settings_file, monkeypatch):
+    cache = ConfigurationCache()
+    writer = SettingsWriter(cache=cache, debounce=60)
+    replaced = []
+    original_replace = os.replace
+    monkeypatch.setattr(
+        os, "replace", lambda *paths: replaced.append(paths) or original_replace(*paths)
+    )
+
+    for table_count in (3, 4, 5):
+        writer.update(
+            layout_settings_file, "layout_configuration", {"table_count": table_count}
+        )
+
+    # readers see the pending update before it is written
+    assert cache.read(layout_settings_file)["layout_configuration"]["table_count"] == 5
+    assert replaced == []
+
+    writer.flush()
+
+    assert len(replaced) == 1
+    assert json.loads(layout_settings_file.read_text()) == {
+        "layout_configuration": {
+            "table_count": 5,
+            "table_configurations": {"slot_1": {"top": 5, "left": 6}},
+        }
+    }
+    assert list(layout_settings_file.parent.iterdir()) == [layout_settings_file]
+
+
+def test_replace_overwrites_the_section(layout_settings_file):
+    writer = SettingsWriter(cache=ConfigurationCache(), debounce=60)
+
+    writer.update(
+        layout_settings_file, "layout_configuration", {"table_count": 1}, replace=True
+    )
+    writer.flush()
+
+    assert json.loads(layout_settings_file.read_text()) == {
+        "layout_configuration": {"table_count": 1}
+    }
+
+
+def test_update_copies_the_values(layout_settings_file):
+    cache = ConfigurationCache()
+    writer = SettingsWriter(cache=cache, debounce=60)
+    button_coords = {"fold": {"x": 1, "y": 2}}
+
+    writer.update(layout_settings_file, "button_coordinates", button_coords)
+    button_coords["fold"]["x"] = 10
+
+    assert cache.read(layout_settings_file)["button_coordinates"] == {
+        "fold": {"x": 1, "y": 2}
+    }
+    writer.flush()
+    assert json.loads(layout_settings_file.read_text())["button_coordinates"] == {
+        "fold": {"x": 1, "y": 2}
+    }
@@ -0,0 +1,148 @@
+"""
+typed settings parsed once from the settings files.
+
+models are frozen, validated when a file is loaded and shared by reference
+through the configuration cache until the file changes to valid settings.
+"""
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from .exceptions import InvalidConfigurationError
+
+
+def get_int(data: Mapping, key: str, default: int = 0, section: str = "") -> int:
+    value = data.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise InvalidConfigurationError(
+            f"{section}.{key} must be an integer, got {value!r}"
+        )
+    return value
+
+
+def get_str(data: Mapping, key: str, default: str = "", section: str = "") -> str:
+    value = data.get(key, default)
+    if not isinstance(value, str):
+        raise InvalidConfigurationError(
+            f"{section}.{key} must be a string, got {value!r}"
+        )
+    return value
+
+
+def get_mapping(data: Mapping, key: str, section: str = "") -> Mapping[str, Any]:
+    value = data.get(key, {})
+    if not isinstance(value, Mapping):
+        raise InvalidConfigurationError(
+            f"{section}.{key} must be an object, got {value!r}"
+        )
+    return value
+
+
+def to_coordinate(value: Any, name: str) -> tuple[int, int]:
+    if (
+        not isinstance(value, (list, tuple))
+        or len(value) != 2
+        or not all(
+            isinstance(axis, int) and not isinstance(axis, bool) for axis in value
+        )
+    ):
+        raise InvalidConfigurationError(f"{name} must be an [x, y] pair, got {value!r}")
+    return value[0], value[1]
+
+
+@dataclass(frozen=True, slots=True)
+class TableSettings:
+    """
+    size and search string of the tables, and the button coordinates recorded
+    on the reference table at (left, top)
+    """
+
+    table_height: int = 0
+    table_width: int = 0
+    search_string: str = ""
+    top: int = 0
+    left: int = 0
+    button_coordinates: Mapping[str, tuple[int, int]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "TableSettings":
+        section = "table_configuration"
+        table_settings = cls(
+            table_height=get_int(data, "table_height", section=section),
+            table_width=get_int(data, "table_width", section=section),
+            search_string=get_str(data, "search_string", section=section),
+            top=get_int(data, "top", section=section),
+            left=get_int(data, "left", section=section),
+            button_coordinates=MappingProxyType(
+                {
+                    button: to_coordinate(
+                        coordinate, f"{section}.button_coordinates.{button}"
+                    )
+                    for button, coordinate in get_mapping(
+                        data, "button_coordinates", section=section
+                    ).items()
+                }
+            ),
+        )
+        if table_settings.table_height < 0 or table_settings.table_width < 0:
+            raise InvalidConfigurationError(
+                f"{section} table size must not be negative"
+            )
+        return table_settings
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutSlot:
+    top: int
+    left: int
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutSettings:
+    """
+    number of tables and the position of every slot, in slot order
+    """
+
+    table_count: int = 1
+    table_configurations: Mapping[str, LayoutSlot] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "LayoutSettings":
+        section = "layout_configuration"
+        table_configurations = {}
+        for slot_num, slot in get_mapping(
+            data, "table_configurations", section=section
+        ).items():
+            slot_section = f"{section}.table_configurations.{slot_num}"
+            if not isinstance(slot, Mapping):
+                raise InvalidConfigurationError(f"{slot_section} must be an object")
+            table_configurations[slot_num] = LayoutSlot(
+                top=get_int(slot, "top", section=slot_section),
+                left=get_int(slot, "left", section=slot_section),
+            )
+        return cls(
+            table_count=get_int(data, "table_count", default=1, section=section),
+            table_configurations=MappingProxyType(table_configurations),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class HotkeySettings:
+    """
+    key or mouse button bound to every action, empty if unbound
+    """
+
+    hotkeys: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "HotkeySettings":
+        section = "hotkey_configuration"
+        return cls(
+            hotkeys=MappingProxyType(
+                {action: get_str(data, action, section=section) for action in data}
+            )
+        )
@@ -1,8 +1,202 @@
+import atexit
+import copy
 import json
+import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Mapping, Protocol, TypeVar
+
+from .configuration_models import HotkeySettings, LayoutSettings, TableSettings
+from .exceptions import InvalidConfigurationError
+
+logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+WRITE_DEBOUNCE = 0.5  # seconds pending settings are held before being written
+
+
+class SettingsModel(Protocol):
+    @classmethod
+    def from_dict(cls, data: Mapping):
+        ...
+
+
+M = TypeVar("M", bound=SettingsModel)
+
+
+class ConfigurationCache:
+    """
+    parsed settings files shared by every parser, keyed by path.
+
+    an entry is reused as long as the mtime and size of the file are unchanged,
+    so reading a setting only touches the disk after the file changed. parsed
+    settings, and the typed models built from them, are shared between callers
+    and must not be mutated.
+
+    every section read as a model is validated again as soon as its file is
+    re-parsed. a file that changed to invalid settings is reported once and the
+    previous valid settings are served until the file is fixed.
+    """
+
+    def __init__(self):
+        self._entries: dict[Path, tuple[tuple[int, int], dict, dict]] = {}
+        self._sections: dict[Path, set[tuple[str, type[SettingsModel]]]] = {}
+
+    def _get_entry(self, path: Path) -> tuple[tuple[int, int], dict, dict]:
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry and entry[0] == version:
+            return entry
+
+        try:
+            with open(path) as settings_file:
+                parsed_settings = json.loads(settings_file.read())
+            models = self._build_models(path, parsed_settings)
+        except (json.JSONDecodeError, InvalidConfigurationError) as e:
+            if entry is None:
+                raise
+            logger.error("%s not reloaded, invalid settings: %s", path, e)
+            # kept under the new version so the error is reported once
+            entry = self._entries[path] = (version, entry[1], entry[2])
+            return entry
+        entry = self._entries[path] = (version, parsed_settings, models)
+        return entry
+
+    def _build_models(self, path: Path, parsed_settings: dict) -> dict:
+        return {
+            (section, model): model.from_dict(parsed_settings.get(section, {}))
+            for section, model in self._sections.get(path, ())
+        }
+
+    def read(self, path: Path) -> dict:
+        return self._get_entry(path)[1]
+
+    def read_model(self, path: Path, section: str, model: type[M]) -> M:
+        """
+        returns a section of a settings file as a typed model, the model is
+        built and validated once per version of the file.
+
+        raises:
+            InvalidConfigurationError: if the section holds invalid values the
+                first time it is read, later changes to invalid values are not
+                applied.
+        """
+        key = (section, model)
+        self._sections.setdefault(path, set()).add(key)
+        _, parsed_settings, models = self._get_entry(path)
+        if key not in models:
+            models[key] = model.from_dict(parsed_settings.get(section, {}))
+        return models[key]
+
+    def store(self, path: Path, parsed_settings: dict) -> None:
+        """
+        sets the parsed settings of a file, valid until the file changes on disk
+
+        raises:
+            InvalidConfigurationError: if a section read as a model holds invalid values.
+        """
+        stat = path.stat()
+        self._entries[path] = (
+            (stat.st_mtime_ns, stat.st_size),
+            parsed_settings,
+            self._build_models(path, parsed_settings),
+        )
+
+    def invalidate(self, path: Path | None = None) -> None:
+        if path is None:
+            self._entries = {}
+        else:
+            self._entries.pop(path, None)
+
+
+configuration_cache = ConfigurationCache()
+
+
+class SettingsWriter:
+    """
+    write-behind for settings files.
+
+    updates are merged into an in-memory copy of the file, which readers see
+    straight away through the configuration cache, and every file is written at
+    most once per debounce window on a background timer. files are written to a
+    temporary file and renamed over the original so a crash never leaves a
+    truncated settings file.
+    """
+
+    def __init__(
+        self,
+        cache: ConfigurationCache = configuration_cache,
+        debounce: float = WRITE_DEBOUNCE,
+    ):
+        self.cache = cache
+        self.debounce = debounce
+        self._pending: dict[Path, dict] = {}
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def update(self, path: Path, section: str, values: dict, replace: bool = False):
+        """
+        merges values into a section of a settings file, or replaces the whole
+        section if replace is set, and schedules the file to be written
+        """
+        # copied so later changes to the caller's dict reach neither the cache nor the file
+        values = copy.deepcopy(values)
+        with self._lock:
+            parsed_settings = dict(self._pending.get(path) or self.cache.read(path))
+            if replace:
+                parsed_settings[section] = values
+            else:
+                parsed_settings[section] = {
+                    **parsed_settings.get(section, {}),
+                    **values,
+                }
+            # stored first, invalid settings are rejected before being scheduled
+            self.cache.store(path, parsed_settings)
+            self._pending[path] = parsed_settings
+
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """
+        writes every pending settings file now
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+            for path, parsed_settings in pending.items():
+                self.write_atomic(path, parsed_settings)
+                self.cache.store(path, parsed_settings)
+
+    def write(self, path: Path, parsed_settings: dict) -> None:
+        """
+        writes a whole settings file now, replacing any pending update of it
+        """
+        parsed_settings = copy.deepcopy(parsed_settings)
+        with self._lock:
+            self._pending.pop(path, None)
+            self.write_atomic(path, parsed_settings)
+            self.cache.store(path, parsed_settings)
+
+    @staticmethod
+    def write_atomic(path: Path, parsed_settings: dict) -> None:
+        temporary_path = path.with_name(f".{path.name}.tmp")
+        with open(temporary_path, "w") as file:
+            file.write(json.dumps(parsed_settings, indent=4))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+
+settings_writer = SettingsWriter()
+atexit.register(settings_writer.flush)  # pending settings are written on exit
 
 
 class IConfigurationParser(ABC):
@@ -14,76 +208,76 @@ class IConfigurationParser(ABC):
     def write_configuration(self, filename: str, *args, **kwargs):
         pass
 
+    @abstractmethod
+    def read_settings(self, filename: str):
+        pass
+
 
 class TableConfigurationParser(IConfigurationParser):
     @staticmethod
     def read_configuration(filename="table_settings.json", *args, **kwargs):
-        with open(BASE_DIR / "settings" / filename) as settings:
-            file_contents = settings.read()
-            parsed_settings = json.loads(file_contents)
-            return parsed_settings["table_configuration"]
+        parsed_settings = configuration_cache.read(BASE_DIR / "settings" / filename)
+        return parsed_settings["table_configuration"]
 
     @staticmethod
-    def write_configuration(filename="table_settings.json", *args, **kwargs):
-        with open(BASE_DIR / "settings" / filename) as file:
-            file_contents = file.read()
-            parsed_settings = json.loads(file_contents)
-
-        parsed_settings["table_configuration"] = kwargs
+    def read_settings(filename="table_settings.json") -> TableSettings:
+        return configuration_cache.read_model(
+            BASE_DIR / "settings" / filename, "table_configuration", TableSettings
+        )
 
-        with open(BASE_DIR / "settings" / filename, "w") as file:
-            json_string = json.dumps(parsed_settings, indent=4)
-            file.write(json_string)
+    @staticmethod
+    def write_configuration(filename="table_settings.json", *args, **kwargs):
+        settings_writer.update(
+            BASE_DIR / "settings" / filename,
+            section="table_configuration",
+            values=kwargs,
+            replace=True,
+        )
 
 
 class LayoutConfigurationParser(IConfigurationParser):
     @staticmethod
     def read_configuration(filename="layout_settings.json", *args, **kwargs):
-        with open(BASE_DIR / "settings" / filename) as settings_file:
-            file_contents = settings_file.read()
-            parsed_settings = json.loads(file_contents)
-            return parsed_settings.get("layout_configuration", {})
+        parsed_settings = configuration_cache.read(BASE_DIR / "settings" / filename)
+        return parsed_settings.get("layout_configuration", {})
 
     @staticmethod
-    def write_configuration(filename="layout_settings.json", *args, **kwargs):
-        with open(BASE_DIR / "settings" / filename) as file:
-            file_contents = file.read()
-            parsed_settings = json.loads(file_contents)
-
-        layout_configuration = parsed_settings.get("layout_configuration", {})
+    def read_settings(filename="layout_settings.json") -> LayoutSettings:
+        return configuration_cache.read_model(
+            BASE_DIR / "settings" / filename, "layout_configuration", LayoutSettings
+        )
 
+    @staticmethod
+    def write_configuration(filename="layout_settings.json", *args, **kwargs):
         # Update the "table_count" and "table_configurations" in layout_configuration
-        layout_configuration["table_count"] = kwargs.get(
-            "table_count", layout_configuration["table_count"]
-        )
-        layout_configuration["table_configurations"] = kwargs.get(
-            "table_configurations", layout_configuration["table_configurations"]
+        settings_writer.update(
+            BASE_DIR / "settings" / filename,
+            section="layout_configuration",
+            values={
+                key: kwargs[key]
+                for key in ("table_count", "table_configurations")
+                if key in kwargs
+            },
         )
 
-        # Update the "layout_configuration" in the main parsed_settings
-        parsed_settings["layout_configuration"] = layout_configuration
-
-        with open(BASE_DIR / "settings" / filename, "w") as file:
-            json_string = json.dumps(parsed_settings, indent=4)
-            file.write(json_string)
-
 
 class HotkeyConfigurationParser(IConfigurationParser):
     @staticmethod
     def read_configuration(filename="hotkey_settings.json", *args, **kwargs):
-        with open(BASE_DIR / "settings" / filename) as settings_file:
-            file_contents = settings_file.read()
-            parsed_settings = json.loads(file_contents)
-            return parsed_settings.get("hotkey_configuration", {})
+        parsed_settings = configuration_cache.read(BASE_DIR / "settings" / filename)
+        return parsed_settings.get("hotkey_configuration", {})
 
     @staticmethod
-    def write_configuration(filename="hotkey_settings.json", *args, **kwargs):
-        with open(BASE_DIR / "settings" / filename) as file:
-            file_contents = file.read()
-            parsed_settings = json.loads(file_contents)
-
-        parsed_settings["hotkey_configuration"] = kwargs["hotkeys"]
+    def read_settings(filename="hotkey_settings.json") -> HotkeySettings:
+        return configuration_cache.read_model(
+            BASE_DIR / "settings" / filename, "hotkey_configuration", HotkeySettings
+        )
 
-        with open(BASE_DIR / "settings" / filename, "w") as file:
-            json_string = json.dumps(parsed_settings, indent=4)
-            file.write(json_string)
+    @staticmethod
+    def write_configuration(filename="hotkey_settings.json", *args, **kwargs):
+        settings_writer.update(
+            BASE_DIR / "settings" / filename,
+            section="hotkey_configuration",
+            values=kwargs["hotkeys"],
+            replace=True,
+        )
@@ -0,0 +1,65 @@
+import time
+from pathlib import Path
+from typing import Callable
+
+from .configuration_parser import BASE_DIR
+
+POLL_INTERVAL = 1.0  # seconds between two scans of the settings directory
+
+
+class SettingsWatcher:
+    """
+    detects changes to the settings files by polling their mtime and size.
+
+    a scan is a handful of stat calls, and scans are throttled to one per
+    poll_interval, so poll can be called on every tracker tick.
+    """
+
+    def __init__(
+        self,
+        directory: Path = BASE_DIR / "settings",
+        poll_interval: float = POLL_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self._versions = self.scan()
+        self._next_scan = clock() + poll_interval
+
+    def scan(self) -> dict[str, tuple[int, int]]:
+        versions = {}
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # replaced while scanning
+                continue
+            versions[path.name] = (stat.st_mtime_ns, stat.st_size)
+        return versions
+
+    def reset(self) -> None:
+        self._versions = self.scan()
+        self._next_scan = self.clock() + self.poll_interval
+
+    def poll(self) -> set[str]:
+        """
+        returns:
+            set[str]: names of the settings files created, changed or removed
+            since the last scan, empty if it is not time to scan yet.
+        """
+        now = self.clock()
+        if now < self._next_scan:
+            return set()
+        self._next_scan = now + self.poll_interval
+
+        versions = self.scan()
+        changed = {
+            name
+            for name in versions.keys() | self._versions.keys()
+            if versions.get(name) != self._versions.get(name)
+        }
+        self._versions = versions
+        return changed
+
+
+settings_watcher = SettingsWatcher()
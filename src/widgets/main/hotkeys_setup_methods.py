@@ -7,6 +7,7 @@ from widgets.utils.popup import PopupMessage
 
 MESSAGES = {
     "DUPLICATE_HOTKEYS": "key duplication exist, please recheck",
+    "INVALID_HOTKEYS": "invalid hotkey, use e.g. F, Ctrl+F, Shift+Mouse4 or Ctrl+K, F",
     "HOTKEYS_SAVED": "Successfully saved hotkeys",
 }
 
@@ -26,9 +27,8 @@ def get_hotkeys_from_ui(ui) -> dict:
     for hk_action, hk_ui_attr in hk_constants.HOTKEYS_MAP.items():
         if hasattr(ui, hk_ui_attr):
             input_ui = getattr(ui, hk_ui_attr)
-            hotkeys[hk_action] = (
-                input_ui.currentText() if input_ui.currentText() != "-" else ""
-            )
+            hotkey = input_ui.currentText().strip()
+            hotkeys[hk_action] = hotkey if hotkey != "-" else ""
     return hotkeys
 
 
@@ -36,6 +36,8 @@ def populate_selections(ui):
     for cbox_name in hk_constants.HOTKEYS_MAP.values():
         if hasattr(ui, cbox_name):
             input_ui = getattr(ui, cbox_name)
+            # editable so chords and sequences can be typed in, e.g. Ctrl+F
+            input_ui.setEditable(True)
             # alphabet only on toggle hotkeys
             if cbox_name == "hk_toggle_hotkeys":
                 for hk_option in hk_constants.ALPHABET:
@@ -51,6 +53,8 @@ def save_settings(ui):
         hotkey_configuration.save_settings(hotkeys=hotkeys)
     except hotkey_exceptions.DuplicateHotkeysError:
         PopupMessage(title="Duplicate Hotkeys", message=MESSAGES["DUPLICATE_HOTKEYS"])
+    except hotkey_exceptions.InvalidHotkeyError:
+        PopupMessage(title="Invalid Hotkeys", message=MESSAGES["INVALID_HOTKEYS"])
     else:
         PopupMessage(
             title="Hotkeys Settings Saved",
@@ -1,15 +1,34 @@
+from PyQt6.QtWidgets import QMessageBox
+
+from services.layout import exceptions as layout_exceptions
 from services.layout.layout_manager import table_layout_manager
+from services.layout.profile_store import layout_profile_store
+from services.tables.table_manager import table_manager
 from widgets.table_layout.main_table_template import MainTableTemplate
 from widgets.table_layout.table_template import TableTemplate
+from widgets.utils.popup import PopupMessage
+
+MESSAGES = {
+    "UNKNOWN_LAYOUT_PROFILE": "No layout profile named '{name}', save the layout under this name first",
+    "INVALID_LAYOUT_PROFILE_NAME": "'{name}' cannot be used as a profile name",
+    "LAYOUT_PROFILE_SAVED": "Successfully saved the layout as '{name}'",
+}
 
 
 def load_settings(ui):
     layout_settings = table_layout_manager.layout_settings
-    ui.table_count_value.setText(str(layout_settings.get("table_count")))
+    ui.table_count_value.setText(str(layout_settings.table_count))
+    load_profiles(ui)
+
+
+def load_profiles(ui):
+    ui.layout_profile.clear()
+    ui.layout_profile.addItems(layout_profile_store.profile_names)
+    ui.layout_profile.setCurrentText(layout_profile_store.active_profile or "")
 
 
 def add_table_count(ui):
-    init_table_count = table_layout_manager.layout_settings.get("table_count")
+    init_table_count = table_layout_manager.layout_settings.table_count
     new_table_count = init_table_count + 1
     table_layout_manager.save_table_count(new_table_count)
 
@@ -17,7 +36,7 @@ def add_table_count(ui):
 
 
 def reduce_table_count(ui):
-    init_table_count = table_layout_manager.layout_settings.get("table_count")
+    init_table_count = table_layout_manager.layout_settings.table_count
     new_table_count = init_table_count - 1
     if new_table_count != 0:
         table_layout_manager.save_table_count(new_table_count)
@@ -28,3 +47,41 @@ def show_layout():
     table_layout_manager.show_templates(
         cls_table_template=TableTemplate, cls_main_table_template=MainTableTemplate
     )
+
+
+def switch_profile(ui):
+    """
+    makes the selected profile the active layout, running tables are re-tiled
+    onto it on the gui thread, where the tracker applies its events too
+    """
+    name = ui.layout_profile.currentText().strip()
+    try:
+        table_manager.switch_layout_profile(name)
+    except layout_exceptions.UnknownLayoutProfile:
+        PopupMessage(
+            title="Unknown Layout Profile",
+            message=MESSAGES["UNKNOWN_LAYOUT_PROFILE"].format(name=name),
+            icon=QMessageBox.Icon.Warning,
+        )
+        load_profiles(ui)
+    else:
+        load_settings(ui)
+
+
+def save_profile(ui):
+    name = ui.layout_profile.currentText().strip()
+    try:
+        layout_profile_store.save_profile(name)
+    except layout_exceptions.InvalidLayoutProfileName:
+        PopupMessage(
+            title="Invalid Profile Name",
+            message=MESSAGES["INVALID_LAYOUT_PROFILE_NAME"].format(name=name),
+            icon=QMessageBox.Icon.Warning,
+        )
+    else:
+        load_profiles(ui)
+        PopupMessage(
+            title="Layout Profile Saved",
+            message=MESSAGES["LAYOUT_PROFILE_SAVED"].format(name=name),
+            icon=QMessageBox.Icon.Information,
+        )
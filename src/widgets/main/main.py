@@ -68,6 +68,14 @@ class MainWindow(QMainWindow):
                 lambda: layout_setup_methods.reduce_table_count(self.ui)
             )
 
+        def layout_profiles():
+            self.ui.switch_layout_profile.clicked.connect(
+                lambda: layout_setup_methods.switch_profile(self.ui)
+            )
+            self.ui.save_layout_profile.clicked.connect(
+                lambda: layout_setup_methods.save_profile(self.ui)
+            )
+
         def connect_application_start():
             self.ui.start_button.clicked.connect(
                 lambda: main_methods.on_start(self, self.ui)
@@ -77,4 +85,5 @@ class MainWindow(QMainWindow):
         setup_hotkeys()
         visualize_grid()
         add_reduce_tables()
+        layout_profiles()
         connect_application_start()
@@ -1,17 +1,26 @@
+from __future__ import annotations
+
 import time
+from typing import TYPE_CHECKING
 
-import pygetwindow as gw
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from services.input_controllers.entities import key_states
 from services.input_controllers.hotkey_manager import hotkey_manager
 from services.input_controllers.mouse_controller import mouse_controller
 from services.input_controllers.mouse_listener import mouse_listener
+from services.instrumentation import instrumentation
 from services.tables import exceptions as table_exceptions
 from services.tables.entities import Buttons
 from services.tables.events import EventType
 from services.tables.table_config import table_configuration
 from services.tables.table_manager import table_manager
+from services.tables.trace import get_trace_path_from_env
+from services.tables.tracker_scheduler import tracker_scheduler
+from utils.settings_watcher import settings_watcher
+
+if TYPE_CHECKING:
+    import pygetwindow as gw
 
 mouse_listener.start()  # start mouse listener to handle mouse events
 
@@ -37,26 +46,45 @@ class Task(QObject):
 
 
 class TrackProcess(Task):
-    event_signal = pyqtSignal(EventType, gw.Window)
+    event_signal = pyqtSignal(list)
+    config_signal = pyqtSignal()
 
     def __init__(self):
         super().__init__()
         self.event_signal.connect(self.handle_event)
+        self.config_signal.connect(self.handle_config_changes)
 
     def run(self):
+        if trace_path := get_trace_path_from_env():
+            table_manager.start_recording(trace_path)
         table_manager.initialize_tracked_windows()
         table_manager.arrange_layout_on_start()
         hotkey_manager.start()
+        tracker_scheduler.reset()
+        settings_watcher.reset()
+        instrumentation.start_periodic_dump()
 
         while not self.is_stopped:
-            event_type, window = table_manager.get_event()
-            if event_type is not None:
-                self.event_signal.emit(event_type, window)
+            events = table_manager.get_event()
+            if events:
+                self.event_signal.emit(events)
+            # changes are diffed again when applied on the gui thread
+            if settings_watcher.poll() and table_manager.get_config_changes():
+                self.config_signal.emit()
+            tracker_scheduler.wait(
+                event_detected=bool(events),
+                is_dragging=key_states.left_button_pressed,
+            )
         self.stop_signal.emit(True)
         hotkey_manager.stop()
+        table_manager.stop_recording()
+        instrumentation.stop_periodic_dump()
+
+    def handle_event(self, events: list[tuple[EventType, gw.Window]]):
+        table_manager.handle_event(events=events)
 
-    def handle_event(self, event_type: EventType, window: gw.Window):
-        table_manager.handle_event(event_type=event_type, window=window)
+    def handle_config_changes(self):
+        table_manager.handle_config_changes()
 
 
 class AssignButtonCoordinates(Task):